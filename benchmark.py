@@ -0,0 +1,374 @@
+"""
+⏱️ BENCHMARK - Coût par fonction des étapes BRONZE / SILVER / GOLD
+──────────────────────────────────────────────────────────────────
+Mesure chaque fonction du pipeline sur des fixtures générées à plusieurs
+échelles (generate_landing_data.py): temps (meilleur de N), lignes/s et
+pic mémoire (tracemalloc, allocations Python/numpy). Les fixtures sont
+préparées hors chrono; seules les fonctions mesurées sont chronométrées.
+
+Les fonctions GOLD lisant SILVER sur disque, leur fixture SILVER est écrite
+dans un répertoire temporaire avant la mesure.
+
+Usage:
+  python benchmark.py                                   # Échelles 1× et 10×
+  python benchmark.py --scale 1 --scale 100 --repeat 5
+  python benchmark.py --save-baseline                   # Enregistre la référence
+  python benchmark.py --dtype-backend pyarrow           # Colonnes Arrow de bout en bout
+  python benchmark.py --compare data/benchmarks/baseline.json --threshold 0.25
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+from generate_landing_data import generate_landing
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from lib.dtype_utils import DTYPE_BACKEND_ENV, DTYPE_BACKENDS, load_dtype_backend
+
+
+PROJECT_ROOT = Path(__file__).parent
+BENCHMARK_DIR = PROJECT_ROOT / "data" / "benchmarks"
+BASELINE_FILE = BENCHMARK_DIR / "baseline.json"
+
+
+def load_job(module_name: str):
+    """
+    Importe un job de src/jobs (noms de fichiers commençant par un chiffre)
+    
+    Args:
+        module_name: Nom du fichier sans extension (ex: "02_silver_clean")
+    
+    Returns:
+        Module importé
+    """
+    path = PROJECT_ROOT / "src" / "jobs" / f"{module_name}.py"
+    spec = importlib.util.spec_from_file_location(f"job_{module_name}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def measure(func: Callable[[], object], repeat: int) -> dict:
+    """
+    Mesure une fonction: meilleur temps sur `repeat` passes + pic mémoire
+    
+    Le pic mémoire est mesuré sur une passe séparée (tracemalloc ralentit
+    l'exécution et fausserait le chrono). La sortie console est masquée.
+    
+    Args:
+        func: Fonction sans argument (fixture déjà liée)
+        repeat: Nombre de passes chronométrées
+    
+    Returns:
+        dict: {wall_s, peak_mb, result}
+    """
+    times = []
+    result = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            times.append(time.perf_counter() - start)
+        
+        tracemalloc.start()
+        try:
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    
+    return {'wall_s': min(times), 'peak_mb': peak / 1024 / 1024, 'result': result}
+
+
+def result_rows(result) -> int:
+    """Nombre de lignes du résultat (DataFrame ou tuple (valid, rejects))"""
+    if isinstance(result, tuple):
+        return sum(len(part) for part in result)
+    return len(result) if result is not None else 0
+
+
+def build_fixtures(landing_dir: str, work_dir: str, bronze, silver) -> dict:
+    """
+    Prépare les fixtures d'une échelle (hors chrono)
+    
+    Args:
+        landing_dir: CSV générés pour cette échelle
+        work_dir: Répertoire temporaire (SILVER de test)
+        bronze: Module BRONZE
+        silver: Module SILVER
+    
+    Returns:
+        dict: {csv: {source: chemin}, bronze: {source: DataFrame}, valid_eurostat, silver_path, config}
+    """
+    csv_files = {
+        name: os.path.join(landing_dir, f"{name}.csv")
+        for name in ["france_time_series", "eurostat_electricity_france", "time_series_60min_sample", "renewable_power_plants_FR"]
+    }
+    
+    with contextlib.redirect_stdout(io.StringIO()):
+        bronze_frames = {
+            name: bronze.ingest_csv_to_bronze_pandas(path, name)
+            for name, path in csv_files.items()
+        }
+        
+        # SILVER de test pour les fonctions GOLD
+        silver_path = os.path.join(work_dir, "silver")
+        valid_ts, _ = silver.clean_france_time_series(bronze_frames["france_time_series"].copy())
+        valid_plants, _ = silver.clean_renewable_power_plants(bronze_frames["renewable_power_plants_FR"].copy())
+        valid_eurostat, _ = silver.clean_eurostat_electricity_france(bronze_frames["eurostat_electricity_france"].copy())
+        silver.write_parquet_safe(valid_ts, os.path.join(silver_path, "france_time_series"), "data")
+        silver.write_parquet_safe(valid_plants, os.path.join(silver_path, "renewable_plants"), "data")
+        silver.write_parquet_safe(
+            silver.melt_eurostat_balance(valid_eurostat), os.path.join(silver_path, "eurostat_energy_balance"), "data"
+        )
+    
+    return {
+        'csv': csv_files,
+        'bronze': bronze_frames,
+        'valid_eurostat': valid_eurostat,
+        'silver_path': silver_path,
+        'config': {'paths': {'silver': silver_path}},
+    }
+
+
+def benchmark_cases(fixtures: dict, scale: int, bronze, silver, gold) -> Dict[str, tuple]:
+    """
+    Fonctions mesurées pour une échelle
+    
+    Args:
+        fixtures: Résultat de build_fixtures
+        scale: Facteur d'échelle
+        bronze, silver, gold: Modules des jobs
+    
+    Returns:
+        Dict[nom, (fonction, lignes_en_entrée)] - None = lignes du résultat
+    """
+    frames = fixtures['bronze']
+    silver_path = fixtures['silver_path']
+    # dim_date: période proportionnelle à l'échelle (bornée par les limites de pd.Timestamp)
+    end_year = min(2015 + 12 * scale, 2250)
+    with contextlib.redirect_stdout(io.StringIO()):
+        dim_date = gold.create_dim_date()
+        valid_60min, _ = silver.clean_time_series_60min(frames['time_series_60min_sample'].copy())
+    
+    return {
+        'ingest_csv_to_bronze_pandas': (
+            lambda: bronze.ingest_csv_to_bronze_pandas(fixtures['csv']['france_time_series'], "france_time_series"),
+            len(frames['france_time_series'])
+        ),
+        'clean_france_time_series': (
+            lambda: silver.clean_france_time_series(frames['france_time_series'].copy()),
+            len(frames['france_time_series'])
+        ),
+        'clean_time_series_60min': (
+            lambda: silver.clean_time_series_60min(frames['time_series_60min_sample'].copy()),
+            len(frames['time_series_60min_sample'])
+        ),
+        'melt_time_series_60min': (
+            lambda: silver.melt_time_series_60min(valid_60min),
+            len(valid_60min)
+        ),
+        'melt_eurostat_balance': (
+            lambda: silver.melt_eurostat_balance(fixtures['valid_eurostat']),
+            len(fixtures['valid_eurostat'])
+        ),
+        'clean_renewable_power_plants': (
+            lambda: silver.clean_renewable_power_plants(frames['renewable_power_plants_FR'].copy()),
+            len(frames['renewable_power_plants_FR'])
+        ),
+        'create_dim_date': (
+            lambda: gold.create_dim_date("2015-01-01", f"{end_year}-12-31"),
+            None
+        ),
+        'create_fact_energy_production': (
+            lambda: gold.create_fact_energy_production(silver_path, dim_date),
+            len(frames['france_time_series'])
+        ),
+        'create_fact_monthly_summary': (
+            lambda: gold.create_fact_monthly_summary(fixtures['config']),
+            len(frames['france_time_series'])
+        ),
+        'create_fact_annual_energy_balance': (
+            lambda: gold.create_fact_annual_energy_balance(fixtures['config']),
+            None
+        ),
+    }
+
+
+def run_benchmarks(scales: List[int], repeat: int, seed: int, only: Optional[List[str]] = None) -> dict:
+    """
+    Lance toutes les mesures
+    
+    Args:
+        scales: Facteurs d'échelle des fixtures
+        repeat: Passes chronométrées par mesure
+        seed: Graine du générateur de fixtures
+        only: Fonctions à mesurer (None = toutes)
+    
+    Returns:
+        dict: Rapport {meta, results: [{function, scale, rows, wall_s, rows_per_s, peak_mb}]}
+    """
+    bronze = load_job("01_bronze_ingest_pandas")
+    silver = load_job("02_silver_clean")
+    gold = load_job("03_gold_dwh")
+    
+    results = []
+    for scale in scales:
+        with tempfile.TemporaryDirectory() as work_dir:
+            print(f"\n🧪 Échelle {scale}×: génération des fixtures...")
+            landing_dir = os.path.join(work_dir, "landing")
+            with contextlib.redirect_stdout(io.StringIO()):
+                generate_landing(landing_dir, scale=scale, seed=seed, dirty_rate=0.01)
+            fixtures = build_fixtures(landing_dir, work_dir, bronze, silver)
+            
+            for name, (func, input_rows) in benchmark_cases(fixtures, scale, bronze, silver, gold).items():
+                if only and name not in only:
+                    continue
+                m = measure(func, repeat)
+                rows = input_rows if input_rows is not None else result_rows(m['result'])
+                entry = {
+                    'function': name,
+                    'scale': scale,
+                    'rows': rows,
+                    'wall_s': round(m['wall_s'], 6),
+                    'rows_per_s': round(rows / m['wall_s'], 1) if m['wall_s'] > 0 else None,
+                    'peak_mb': round(m['peak_mb'], 2),
+                }
+                results.append(entry)
+                print(f"   {name:32s} {rows:>12,} lignes  {entry['wall_s'] * 1000:10.1f} ms"
+                      f"  {entry['rows_per_s'] or 0:>14,.0f} l/s  {entry['peak_mb']:8.1f} Mo")
+    
+    return {
+        'meta': {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'platform': platform.platform(),
+            'repeat': repeat,
+            'seed': seed,
+            'dtype_backend': load_dtype_backend(),
+        },
+        'results': results,
+    }
+
+
+def compare_reports(current: dict, baseline: dict, threshold: float) -> List[dict]:
+    """
+    Compare deux rapports et liste les régressions
+    
+    Une régression est un temps ou un pic mémoire qui dépasse la référence
+    de plus de `threshold` (0.25 = +25%) pour la même fonction et échelle.
+    
+    Args:
+        current: Rapport courant
+        baseline: Rapport de référence
+        threshold: Tolérance relative
+    
+    Returns:
+        List[dict]: Régressions {function, scale, metric, baseline, current, ratio}
+    """
+    reference = {(r['function'], r['scale']): r for r in baseline.get('results', [])}
+    regressions = []
+    
+    print(f"\n{'='*80}")
+    print(f"📊 COMPARAISON (tolérance +{threshold:.0%})")
+    print(f"{'='*80}")
+    
+    for entry in current['results']:
+        ref = reference.get((entry['function'], entry['scale']))
+        if not ref:
+            print(f"   {entry['function']:32s} {entry['scale']:>5}×  (pas de référence)")
+            continue
+        
+        ratios = {}
+        for metric in ['wall_s', 'peak_mb']:
+            ratio = entry[metric] / ref[metric] if ref[metric] else 1.0
+            ratios[metric] = ratio
+            if ratio > 1 + threshold:
+                regressions.append({
+                    'function': entry['function'],
+                    'scale': entry['scale'],
+                    'metric': metric,
+                    'baseline': ref[metric],
+                    'current': entry[metric],
+                    'ratio': round(ratio, 3),
+                })
+        
+        flag = "❌" if max(ratios.values()) > 1 + threshold else "✅"
+        print(f"{flag} {entry['function']:32s} {entry['scale']:>5}×  temps {ratios['wall_s']:6.2f}×"
+              f"  mémoire {ratios['peak_mb']:6.2f}×")
+    
+    return regressions
+
+
+def main():
+    """Point d'entrée"""
+    
+    parser = argparse.ArgumentParser(description="Benchmark des fonctions BRONZE / SILVER / GOLD")
+    parser.add_argument("--scale", type=int, action="append", help="Échelle(s) des fixtures (défaut: 1 et 10)")
+    parser.add_argument("--repeat", type=int, default=3, help="Passes chronométrées par mesure")
+    parser.add_argument("--seed", type=int, default=42, help="Graine des fixtures")
+    parser.add_argument("--function", action="append", help="Fonction(s) à mesurer (défaut: toutes)")
+    parser.add_argument("--dtype-backend", choices=DTYPE_BACKENDS,
+                        help="Backend des dtypes (défaut: `dtype_backend` de config.yaml)")
+    parser.add_argument("--output", help="Fichier JSON du rapport (défaut: data/benchmarks/<horodatage>.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="Enregistre aussi le rapport comme référence")
+    parser.add_argument("--compare", nargs="?", const=str(BASELINE_FILE), help="Rapport de référence à comparer")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Tolérance de régression (0.25 = +25%%)")
+    args = parser.parse_args()
+    
+    # Les jobs résolvent conf/config.yaml en relatif
+    os.chdir(PROJECT_ROOT)
+    
+    # Lu par lib.dtype_utils avant config.yaml (aussi dans les workers)
+    if args.dtype_backend:
+        os.environ[DTYPE_BACKEND_ENV] = args.dtype_backend
+    
+    print(f"\n{'='*80}")
+    print(f"⏱️  BENCHMARK PIPELINE")
+    print(f"{'='*80}")
+    
+    report = run_benchmarks(args.scale or [1, 10], args.repeat, args.seed, args.function)
+    
+    BENCHMARK_DIR.mkdir(parents=True, exist_ok=True)
+    output = Path(args.output) if args.output else BENCHMARK_DIR / f"{datetime.now():%Y%m%dT%H%M%S}.json"
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"\n📂 Rapport: {output}")
+    
+    if args.save_baseline:
+        BASELINE_FILE.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"📌 Référence: {BASELINE_FILE}")
+    
+    if args.compare:
+        baseline_path = Path(args.compare)
+        if not baseline_path.exists():
+            print(f"❌ Référence introuvable: {baseline_path}")
+            return 2
+        
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        regressions = compare_reports(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} régression(s) au-delà de +{args.threshold:.0%}")
+            return 1
+        print(f"\n✅ Aucune régression")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,443 @@
+"""
+🧪 GÉNÉRATEUR LANDING - Données synthétiques à l'échelle pour tests de charge
+─────────────────────────────────────────────────────────────────────────────
+Reproduit les schémas et les distributions des 4 fichiers landing
+(échantillons de data/landing) avec un facteur d'échelle, et injecte une
+part contrôlée de lignes sales (timestamps invalides, MW négatifs, dates
+futures, doublons) pour exercer les rejets SILVER.
+
+- Déterministe: même seed => mêmes fichiers
+- 100% hors ligne: amorcé uniquement depuis les échantillons locaux
+- Écriture par blocs: mémoire bornée même à 1000×
+- Séries temporelles: le pas de temps est divisé par l'échelle, la période
+  couverte reste la même (aucune date future involontaire)
+
+Usage:
+  python generate_landing_data.py --scale 10
+  python generate_landing_data.py --scale 100 --dirty-rate 0.02 --seed 7
+  python generate_landing_data.py --scale 1000 --compression gz --output data/landing_1000x
+"""
+
+import argparse
+import bz2
+import gzip
+import io
+import json
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+SAMPLE_DIR = "data/landing"
+
+# Lignes d'échantillon traitées par bloc (× échelle = lignes écrites par bloc)
+CHUNK_ROWS = 500_000
+
+# Bruit multiplicatif appliqué aux copies (la 1re copie reste identique à l'échantillon)
+VALUE_NOISE = 0.02
+
+COMPRESSION_SUFFIX = {None: "", "gz": ".gz", "bz2": ".bz2", "zst": ".zst"}
+
+
+def open_output(path: Path, compression: Optional[str]):
+    """
+    Ouvre le fichier de sortie (texte) avec la compression demandée
+    
+    Args:
+        path: Fichier de sortie
+        compression: None, "gz", "bz2" ou "zst"
+    
+    Returns:
+        Flux texte ouvert en écriture
+    """
+    if compression == "gz":
+        return gzip.open(path, "wt", encoding="utf-8", newline="")
+    if compression == "bz2":
+        return bz2.open(path, "wt", encoding="utf-8", newline="")
+    if compression == "zst":
+        import zstandard
+        raw = zstandard.ZstdCompressor().stream_writer(open(path, "wb"), closefd=True)
+        return io.TextIOWrapper(raw, encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def jitter(values: np.ndarray, rng: np.random.Generator, copy_index: np.ndarray) -> np.ndarray:
+    """
+    Bruit multiplicatif sur les copies (copy_index > 0), NaN conservés
+    
+    Args:
+        values: Valeurs numériques (2D)
+        rng: Générateur aléatoire
+        copy_index: Numéro de copie de chaque ligne (0 = original)
+    
+    Returns:
+        np.ndarray: Valeurs bruitées
+    """
+    noise = rng.normal(1.0, VALUE_NOISE, size=values.shape)
+    noise[copy_index == 0] = 1.0
+    return values * noise
+
+
+def inject_dirty(
+    df: pd.DataFrame,
+    rng: np.random.Generator,
+    dirty_rate: float,
+    kinds: Dict[str, callable],
+    counts: Dict[str, int]
+) -> pd.DataFrame:
+    """
+    Remplace une part des lignes par des lignes sales
+    
+    Chaque ligne est salie avec la probabilité `dirty_rate`; le type de
+    défaut est tiré uniformément parmi ceux supportés par la source. Les
+    doublons recopient la ligne précédente (le nombre de lignes ne change pas).
+    
+    Args:
+        df: Bloc généré
+        rng: Générateur aléatoire
+        dirty_rate: Part de lignes sales (0-1)
+        kinds: {type_défaut: fonction(df, positions)}
+        counts: Compteurs par type (mis à jour)
+    
+    Returns:
+        pd.DataFrame: Bloc avec lignes sales
+    """
+    if dirty_rate <= 0 or len(df) < 2:
+        return df
+    
+    positions = np.flatnonzero(rng.random(len(df)) < dirty_rate)
+    positions = positions[positions > 0]  # La 1re ligne sert de modèle aux doublons
+    if len(positions) == 0:
+        return df
+    
+    names = list(kinds)
+    chosen = rng.integers(0, len(names), size=len(positions))
+    for i, name in enumerate(names):
+        selected = positions[chosen == i]
+        if len(selected):
+            kinds[name](df, selected)
+            counts[name] = counts.get(name, 0) + len(selected)
+    
+    return df
+
+
+def duplicate_previous(df: pd.DataFrame, positions: np.ndarray) -> None:
+    """Recopie la ligne précédente (doublon exact)"""
+    df.iloc[positions] = df.iloc[positions - 1].to_numpy()
+
+
+def set_column(column: str, value: str):
+    """Défaut qui remplace une colonne par une valeur fixe"""
+    def apply(df: pd.DataFrame, positions: np.ndarray) -> None:
+        df.iloc[positions, df.columns.get_loc(column)] = value
+    return apply
+
+
+def negate_columns(columns: List[str], rng: np.random.Generator):
+    """Défaut qui rend négative une colonne numérique tirée au hasard"""
+    def apply(df: pd.DataFrame, positions: np.ndarray) -> None:
+        targets = rng.integers(0, len(columns), size=len(positions))
+        for target in np.unique(targets):
+            rows = positions[targets == target]
+            col = df.columns.get_loc(columns[target])
+            values = pd.to_numeric(df.iloc[rows, col], errors="coerce").to_numpy(dtype="float64")
+            negative = np.where(np.isnan(values) | (values == 0), -1.0, -np.abs(values))
+            df.iloc[rows, col] = round_values(negative)
+    return apply
+
+
+def round_values(values: np.ndarray, decimals: int = 4) -> np.ndarray:
+    """Arrondi des valeurs générées (les NaN deviennent des champs vides au CSV)"""
+    return np.round(values, decimals)
+
+
+def format_timestamps(ts: pd.DatetimeIndex, local: bool = False) -> np.ndarray:
+    """
+    Timestamps UTC -> chaînes au format des fichiers sources ('' pour NaT)
+    
+    Formatage vectorisé numpy (strftime pandas trop lent à grande échelle).
+    
+    Args:
+        ts: Timestamps UTC
+        local: Heure locale Europe/Paris au format "2015-01-01T01:00:00+0100"
+    
+    Returns:
+        np.ndarray: Chaînes
+    """
+    utc = ts.tz_localize(None)
+    if local:
+        wall = ts.tz_convert("Europe/Paris").tz_localize(None)
+        offset_h = ((wall - utc) // pd.Timedelta(hours=1)).fillna(0).astype(int).to_numpy()
+        suffix = np.where(offset_h >= 0, "+", "-").astype(object) + pd.Series(np.abs(offset_h)).map("{:02d}00".format).to_numpy()
+        text = np.datetime_as_string(wall.to_numpy(), unit="s").astype(object) + suffix
+    else:
+        text = np.char.replace(np.datetime_as_string(utc.to_numpy(), unit="s"), "T", " ").astype(object) + "+00:00"
+    text[np.asarray(ts.isna())] = ""
+    return text
+
+
+def generate_time_series(
+    sample: pd.DataFrame,
+    scale: int,
+    rng: np.random.Generator,
+    timestamp_col: str = "utc_timestamp",
+    local_col: Optional[str] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Séries temporelles: chaque pas de l'échantillon devient `scale` pas
+    
+    Les valeurs des copies sont bruitées autour de la mesure d'origine; le
+    pas de temps est divisé par l'échelle pour couvrir la même période.
+    
+    Args:
+        sample: Échantillon (colonnes string)
+        scale: Facteur d'échelle
+        rng: Générateur aléatoire
+        timestamp_col: Colonne timestamp UTC
+        local_col: Colonne timestamp local (CET/CEST) optionnelle
+    
+    Yields:
+        pd.DataFrame: Blocs générés
+    """
+    value_cols = [c for c in sample.columns if c not in (timestamp_col, local_col)]
+    timestamps = pd.to_datetime(sample[timestamp_col], utc=True, errors="coerce")
+    step = timestamps.diff().median()
+    if pd.isna(step):
+        step = pd.Timedelta(hours=1)
+    offsets = pd.to_timedelta(np.arange(scale) * (step / scale))
+    
+    block = max(1, CHUNK_ROWS // scale)
+    for start in range(0, len(sample), block):
+        chunk = sample.iloc[start:start + block]
+        copy_index = np.tile(np.arange(scale), len(chunk))
+        
+        ts = pd.DatetimeIndex(timestamps.iloc[start:start + block].repeat(scale)) + np.tile(offsets, len(chunk))
+        values = chunk[value_cols].apply(pd.to_numeric, errors="coerce").to_numpy(dtype="float64")
+        values = jitter(np.repeat(values, scale, axis=0), rng, copy_index)
+        
+        out = pd.DataFrame(round_values(values), columns=value_cols)
+        out.insert(0, timestamp_col, format_timestamps(ts))
+        if local_col:
+            out.insert(1, local_col, format_timestamps(ts, local=True))
+        yield out[list(sample.columns)]
+
+
+def generate_rows_bootstrap(
+    sample: pd.DataFrame,
+    scale: int,
+    rng: np.random.Generator,
+    numeric_cols: List[str],
+    id_col: Optional[str] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Tables de référence: rééchantillonnage des lignes avec bruit numérique
+    
+    La 1re copie reprend l'échantillon tel quel, les suivantes tirent des
+    lignes avec remise et bruitent les colonnes numériques.
+    
+    Args:
+        sample: Échantillon (colonnes string)
+        scale: Facteur d'échelle
+        rng: Générateur aléatoire
+        numeric_cols: Colonnes bruitées
+        id_col: Colonne identifiant à rendre unique (optionnelle)
+    
+    Yields:
+        pd.DataFrame: Blocs générés
+    """
+    n = len(sample)
+    numeric = sample[numeric_cols].apply(pd.to_numeric, errors="coerce").to_numpy(dtype="float64")
+    id_values = pd.to_numeric(sample[id_col], errors="coerce") if id_col else None
+    id_stride = int(id_values.max()) + 1 if id_col else 0
+    
+    copies_per_block = max(1, CHUNK_ROWS // n)
+    for first_copy in range(0, scale, copies_per_block):
+        copies = np.arange(first_copy, min(scale, first_copy + copies_per_block))
+        copy_index = np.repeat(copies, n)
+        picks = np.where(copy_index == 0, np.tile(np.arange(n), len(copies)), rng.integers(0, n, size=len(copy_index)))
+        
+        out = sample.iloc[picks].reset_index(drop=True).copy()
+        out[numeric_cols] = round_values(jitter(numeric[picks], rng, copy_index))
+        if id_col:
+            out[id_col] = (id_values.iloc[picks].to_numpy() + copy_index * id_stride).astype("int64").astype(str)
+        yield out
+
+
+def source_specs(rng: np.random.Generator) -> List[dict]:
+    """
+    Description des 4 sources landing (générateur + défauts injectables)
+    
+    Args:
+        rng: Générateur aléatoire
+    
+    Returns:
+        List[dict]: {file, generate(sample, scale), dirty(sample)}
+    """
+    future_ts = "2099-01-01 00:00:00+00:00"
+    
+    def value_columns(sample, exclude):
+        return [c for c in sample.columns if c not in exclude]
+    
+    return [
+        {
+            "file": "france_time_series.csv",
+            "generate": lambda sample, scale: generate_time_series(sample, scale, rng),
+            "dirty": lambda sample: {
+                "bad_timestamp": set_column("utc_timestamp", "not-a-date"),
+                "negative_value": negate_columns(value_columns(sample, {"utc_timestamp"}), rng),
+                "future_date": set_column("utc_timestamp", future_ts),
+                "duplicate": duplicate_previous,
+            },
+        },
+        {
+            "file": "time_series_60min_sample.csv",
+            "generate": lambda sample, scale: generate_time_series(
+                sample, scale, rng, local_col="cet_cest_timestamp"
+            ),
+            "dirty": lambda sample: {
+                "bad_timestamp": set_column("utc_timestamp", "not-a-date"),
+                "negative_value": negate_columns(
+                    [c for c in sample.columns if c.startswith("FR_")]
+                    or value_columns(sample, {"utc_timestamp", "cet_cest_timestamp"}),
+                    rng
+                ),
+                "future_date": set_column("utc_timestamp", future_ts),
+                "duplicate": duplicate_previous,
+            },
+        },
+        {
+            "file": "renewable_power_plants_FR.csv",
+            "generate": lambda sample, scale: generate_rows_bootstrap(
+                sample, scale, rng, numeric_cols=["electrical_capacity"]
+            ),
+            "dirty": lambda sample: {
+                "bad_timestamp": set_column("commissioning_date", "not-a-date"),
+                "negative_value": negate_columns(["electrical_capacity"], rng),
+                "future_date": set_column("commissioning_date", "2099-01-01"),
+                "duplicate": duplicate_previous,
+            },
+        },
+        {
+            "file": "eurostat_electricity_france.csv",
+            "generate": lambda sample, scale: generate_rows_bootstrap(
+                sample, scale, rng,
+                numeric_cols=[c for c in sample.columns if c.isdigit()],
+                id_col="index"
+            ),
+            "dirty": lambda sample: {
+                "negative_value": negate_columns([c for c in sample.columns if c.isdigit()], rng),
+                "duplicate": duplicate_previous,
+            },
+        },
+    ]
+
+
+def generate_landing(
+    output_dir: str,
+    scale: int = 1,
+    seed: int = 42,
+    dirty_rate: float = 0.0,
+    sample_dir: str = SAMPLE_DIR,
+    compression: Optional[str] = None,
+    sources: Optional[List[str]] = None
+) -> dict:
+    """
+    Génère les fichiers landing à l'échelle demandée
+    
+    Args:
+        output_dir: Répertoire de sortie
+        scale: Facteur d'échelle (1, 10, 100, 1000...)
+        seed: Graine aléatoire
+        dirty_rate: Part de lignes sales (0-1)
+        sample_dir: Répertoire des échantillons
+        compression: None, "gz", "bz2" ou "zst"
+        sources: Fichiers à générer (None = tous)
+    
+    Returns:
+        dict: Résumé {file: {rows, dirty: {type: nb}}}
+    """
+    if scale < 1:
+        raise ValueError(f"Échelle invalide: {scale}")
+    if not 0 <= dirty_rate <= 1:
+        raise ValueError(f"dirty_rate hors [0, 1]: {dirty_rate}")
+    
+    rng = np.random.default_rng(seed)
+    output = Path(output_dir)
+    output.mkdir(parents=True, exist_ok=True)
+    summary = {}
+    
+    for spec in source_specs(rng):
+        if sources and spec["file"] not in sources:
+            continue
+        
+        sample_file = Path(sample_dir) / spec["file"]
+        if not sample_file.exists():
+            print(f"  ⚠️  SKIP - échantillon absent: {sample_file}")
+            continue
+        
+        sample = pd.read_csv(sample_file, dtype=str, keep_default_na=False)
+        target = output / (spec["file"] + COMPRESSION_SUFFIX[compression])
+        dirty_kinds = spec["dirty"](sample)
+        counts = {}
+        rows = 0
+        
+        print(f"  🔄 {spec['file']}: {len(sample):,} × {scale} lignes")
+        with open_output(target, compression) as f:
+            for i, chunk in enumerate(spec["generate"](sample, scale)):
+                chunk = inject_dirty(chunk, rng, dirty_rate, dirty_kinds, counts)
+                chunk.to_csv(f, index=False, header=(i == 0))
+                rows += len(chunk)
+        
+        print(f"    ✅ {rows:,} lignes ({sum(counts.values()):,} sales) -> {target}")
+        summary[spec["file"]] = {"file": str(target), "rows": rows, "dirty": counts}
+    
+    with open(output / "_generation.json", "w", encoding="utf-8") as f:
+        json.dump(
+            {"scale": scale, "seed": seed, "dirty_rate": dirty_rate, "compression": compression, "sources": summary},
+            f, indent=2, ensure_ascii=False
+        )
+    
+    return summary
+
+
+def main():
+    """Point d'entrée"""
+    
+    parser = argparse.ArgumentParser(description="Génère des données landing synthétiques à l'échelle")
+    parser.add_argument("--scale", type=int, default=10, help="Facteur d'échelle (1, 10, 100, 1000...)")
+    parser.add_argument("--seed", type=int, default=42, help="Graine aléatoire (déterminisme)")
+    parser.add_argument("--dirty-rate", type=float, default=0.01, help="Part de lignes sales (0-1)")
+    parser.add_argument("--output", default=None, help="Répertoire de sortie (défaut: data/landing_<scale>x)")
+    parser.add_argument("--samples", default=SAMPLE_DIR, help="Répertoire des échantillons")
+    parser.add_argument("--compression", choices=["gz", "bz2", "zst"], help="Compression des CSV")
+    parser.add_argument("--source", action="append", help="Fichier(s) à générer (défaut: tous)")
+    args = parser.parse_args()
+    
+    output_dir = args.output or f"data/landing_{args.scale}x"
+    
+    print(f"\n{'='*80}")
+    print(f"🧪 GÉNÉRATION LANDING - échelle {args.scale}×, seed {args.seed}, {args.dirty_rate:.1%} sales")
+    print(f"{'='*80}\n")
+    
+    summary = generate_landing(
+        output_dir=output_dir,
+        scale=args.scale,
+        seed=args.seed,
+        dirty_rate=args.dirty_rate,
+        sample_dir=args.samples,
+        compression=args.compression,
+        sources=args.source
+    )
+    
+    total = sum(s["rows"] for s in summary.values())
+    print(f"\n📊 {len(summary)} fichiers, {total:,} lignes -> {output_dir}")
+    print(f"💡 Pointer `paths.landing` de conf/config.yaml sur ce répertoire pour lancer le pipeline")
+    
+    return 0 if summary else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+"""
+📦 RAPPORT PARQUET - Taille et temps de lecture selon les réglages d'écriture
+───────────────────────────────────────────────────────────────────────────
+Réécrit chaque table d'une couche avec plusieurs réglages (codec, niveau,
+row groups, dictionnaire, BYTE_STREAM_SPLIT / DELTA) et compare la taille
+des fichiers et le temps de lecture, pour choisir la section `parquet`
+de conf/config.yaml.
+
+Usage:
+  python parquet_report.py                      # Tables SILVER + GOLD
+  python parquet_report.py --layer bronze       # Une couche
+  python parquet_report.py --file chemin.parquet
+  python parquet_report.py --output report.json # Export JSON
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from lib.parquet_utils import (
+    DEFAULT_WRITE_OPTIONS,
+    load_write_options,
+    parquet_writer_kwargs,
+    read_partitioned_table,
+)
+
+
+LOW_CARDINALITY_COLUMNS = ["country", "energy_type", "region", "technology", "_source_file", "_ingest_date"]
+
+# Réglages comparés (complètent DEFAULT_WRITE_OPTIONS)
+VARIANTS = {
+    "snappy (défaut pandas)": {'compression': 'snappy'},
+    "lz4": {'compression': 'lz4'},
+    "zstd-1": {'compression': 'zstd', 'compression_level': 1},
+    "zstd-3": {'compression': 'zstd', 'compression_level': 3},
+    "zstd-9": {'compression': 'zstd', 'compression_level': 9},
+    "zstd-3 + dict ciblé": {
+        'compression': 'zstd', 'compression_level': 3,
+        'dictionary_columns': LOW_CARDINALITY_COLUMNS,
+    },
+    "zstd-3 + BSS/DELTA": {
+        'compression': 'zstd', 'compression_level': 3,
+        'byte_stream_split': True, 'delta_encoding': True,
+    },
+    "zstd-3 + RG 128k": {'compression': 'zstd', 'compression_level': 3, 'row_group_size': 131_072},
+}
+
+
+def load_layer_tables(layer_path: Path) -> dict:
+    """
+    Charge les tables d'une couche en Arrow (dernier run pour BRONZE)
+    
+    Args:
+        layer_path: Répertoire de la couche
+    
+    Returns:
+        dict: {nom_table: pa.Table}
+    """
+    tables = {}
+    for table_dir in sorted(p for p in layer_path.iterdir() if p.is_dir()):
+        try:
+            df = read_partitioned_table(str(table_dir), partitions="latest_run")
+        except FileNotFoundError:
+            continue
+        tables[table_dir.name] = pa.Table.from_pandas(df, preserve_index=False)
+    return tables
+
+
+def measure_variant(table: pa.Table, options: dict, work_dir: str, repeat: int = 3) -> dict:
+    """
+    Écrit une table avec un réglage puis mesure taille et lecture
+    
+    Args:
+        table: Table Arrow
+        options: Réglages d'écriture
+        work_dir: Répertoire temporaire
+        repeat: Nombre de lectures (meilleur temps retenu)
+    
+    Returns:
+        dict: {bytes, write_s, read_s}
+    """
+    options = {**DEFAULT_WRITE_OPTIONS, **options}
+    parquet_file = os.path.join(work_dir, "variant.parquet")
+    
+    start = time.perf_counter()
+    pq.write_table(
+        table,
+        parquet_file,
+        row_group_size=options['row_group_size'],
+        **parquet_writer_kwargs(table.schema, options)
+    )
+    write_s = time.perf_counter() - start
+    
+    read_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        pq.read_table(parquet_file)
+        read_times.append(time.perf_counter() - start)
+    
+    size = os.path.getsize(parquet_file)
+    os.remove(parquet_file)
+    
+    return {'bytes': size, 'write_s': write_s, 'read_s': min(read_times)}
+
+
+def run_report(tables: dict, variants: dict) -> dict:
+    """
+    Compare les réglages sur toutes les tables
+    
+    Args:
+        tables: {nom_table: pa.Table}
+        variants: {nom_réglage: options}
+    
+    Returns:
+        dict: {nom_table: {nom_réglage: mesures}}
+    """
+    report = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        for table_name, table in tables.items():
+            print(f"🔄 {table_name} ({table.num_rows:,} lignes, {table.num_columns} colonnes)")
+            report[table_name] = {
+                name: measure_variant(table, options, work_dir)
+                for name, options in variants.items()
+            }
+    return report
+
+
+def print_report(report: dict, variants: dict) -> None:
+    """
+    Affiche le rapport (par table puis totaux, relatif au premier réglage)
+    
+    Args:
+        report: Résultat de run_report
+        variants: Réglages comparés
+    """
+    baseline = next(iter(variants))
+    totals = {name: {'bytes': 0, 'read_s': 0.0} for name in variants}
+    
+    for table_name, results in report.items():
+        print(f"\n📦 {table_name}")
+        base = results[baseline]
+        for name, m in results.items():
+            totals[name]['bytes'] += m['bytes']
+            totals[name]['read_s'] += m['read_s']
+            print(
+                f"   {name:26s} {m['bytes'] / 1024:10,.0f} Ko ({m['bytes'] / base['bytes']:5.0%})"
+                f"   lecture {m['read_s'] * 1000:8.1f} ms ({m['read_s'] / base['read_s']:5.0%})"
+            )
+    
+    print(f"\n{'='*80}")
+    print(f"📊 TOTAL ({len(report)} tables)")
+    print(f"{'='*80}")
+    base = totals[baseline]
+    for name, m in totals.items():
+        if base['bytes'] == 0:
+            break
+        print(
+            f"   {name:26s} {m['bytes'] / 1024:10,.0f} Ko ({m['bytes'] / base['bytes']:5.0%})"
+            f"   lecture {m['read_s'] * 1000:8.1f} ms ({m['read_s'] / max(base['read_s'], 1e-9):5.0%})"
+        )
+    
+    current = load_write_options()
+    print(f"\n⚙️  Réglage actuel (config.yaml): compression={current['compression']}, "
+          f"level={current['compression_level']}, row_group_size={current['row_group_size']:,}")
+
+
+def main():
+    """Point d'entrée"""
+    
+    parser = argparse.ArgumentParser(description="Compare les réglages d'écriture Parquet")
+    parser.add_argument("--layer", action="append", choices=["bronze", "silver", "gold"],
+                        help="Couche(s) à analyser (défaut: silver + gold)")
+    parser.add_argument("--file", action="append", help="Fichier(s) Parquet à analyser")
+    parser.add_argument("--output", help="Export JSON du rapport")
+    parser.add_argument("--config", default="conf/config.yaml", help="Chemin config.yaml")
+    args = parser.parse_args()
+    
+    with open(args.config, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    
+    tables = {}
+    if args.file:
+        for parquet_file in args.file:
+            tables[Path(parquet_file).stem] = pq.read_table(parquet_file)
+    else:
+        for layer in args.layer or ["silver", "gold"]:
+            layer_path = Path(config['paths'][layer])
+            if not layer_path.exists():
+                print(f"⚠️  Couche absente: {layer_path}")
+                continue
+            for name, table in load_layer_tables(layer_path).items():
+                tables[f"{layer}/{name}"] = table
+    
+    if not tables:
+        print("❌ Aucune table à analyser (lancer le pipeline d'abord)")
+        return 1
+    
+    report = run_report(tables, VARIANTS)
+    print_report(report, VARIANTS)
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n📂 {args.output}")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
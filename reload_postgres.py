@@ -33,6 +33,7 @@ try:
     
     # Supprimer les tables dans le bon ordre
     drop_sql = """
+    DROP TABLE IF EXISTS gold.fact_annual_energy_balance CASCADE;
     DROP TABLE IF EXISTS gold.fact_monthly_summary CASCADE;
     DROP TABLE IF EXISTS gold.fact_renewable_capacity CASCADE;
     DROP TABLE IF EXISTS gold.fact_energy_production CASCADE;
@@ -92,6 +93,7 @@ try:
         'dim_plant': gold_path / 'dim_plant' / 'data.parquet',
         'fact_energy_production': gold_path / 'fact_energy_production' / 'data.parquet',
         'fact_renewable_capacity': gold_path / 'fact_renewable_capacity' / 'data.parquet',
+        'fact_annual_energy_balance': gold_path / 'fact_annual_energy_balance' / 'data.parquet',
     }
     
     for table_name, parquet_path in tables.items():
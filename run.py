@@ -11,26 +11,36 @@ Usage:
   python run.py --gold             # BRONZE + SILVER + GOLD (sans PostgreSQL)
   python run.py --load             # BRONZE + SILVER + GOLD + POSTGRES (complet)
   python run.py --clean            # Efface les données et relance tout
+  python run.py --force            # Réingère les sources BRONZE même inchangées
 """
 
 import os
 import sys
+import json
 import subprocess
 import argparse
 import shutil
 from datetime import datetime
 from pathlib import Path
 
+# Résumé des couches, exécuté par le Python du venv (run.py n'importe que la stdlib)
+SUMMARY_SCRIPT = (
+    "import json, sys; sys.path.insert(0, 'src'); "
+    "from lib.parquet_utils import summarize_layer; "
+    "print(json.dumps({path: summarize_layer(path) for path in sys.argv[1:]}))"
+)
+
 
 class PipelineRunner:
     """Orchestrateur du pipeline ETL"""
     
-    def __init__(self, venv_python: str = None):
+    def __init__(self, venv_python: str = None, force: bool = False):
         """
         Initialise le runner
         
         Args:
             venv_python: Chemin vers le Python du venv (auto-détection si None)
+            force: Réingérer toutes les sources BRONZE (ignore le manifest)
         """
         self.project_root = Path(__file__).parent
         self.venv_path = self.project_root / ".venv"
@@ -43,6 +53,7 @@ class PipelineRunner:
             if not Path(self.python_exe).exists():
                 self.python_exe = "python"
         
+        self.force = force
         self.jobs_dir = self.project_root / "src" / "jobs"
         self.data_dir = self.project_root / "data" / "warehouse"
         
@@ -59,13 +70,14 @@ class PipelineRunner:
         print(f"🐍 Python:       {self.python_exe}")
         print(f"⏰ Démarrage:    {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
     
-    def run_job(self, job_name: str, job_file: str) -> bool:
+    def run_job(self, job_name: str, job_file: str, job_args: list = None) -> bool:
         """
         Exécute un job
         
         Args:
             job_name: Nom du job (pour affichage)
             job_file: Fichier Python du job
+            job_args: Arguments supplémentaires passés au job
             
         Returns:
             bool: True si succès, False sinon
@@ -82,7 +94,7 @@ class PipelineRunner:
         
         try:
             result = subprocess.run(
-                [self.python_exe, str(job_path)],
+                [self.python_exe, str(job_path)] + (job_args or []),
                 cwd=self.project_root,
                 capture_output=False,
                 text=True
@@ -119,7 +131,8 @@ class PipelineRunner:
     
     def run_bronze(self) -> bool:
         """Exécute la couche BRONZE"""
-        return self.run_job("🟤 BRONZE (Ingestion RAW)", "01_bronze_ingest_pandas.py")
+        job_args = ["--force"] if self.force else []
+        return self.run_job("🟤 BRONZE (Ingestion RAW)", "01_bronze_ingest_pandas.py", job_args)
     
     def run_silver(self) -> bool:
         """Exécute la couche SILVER"""
@@ -188,6 +201,35 @@ class PipelineRunner:
         self.end_time = datetime.now()
         return True
     
+    def summarize_layers(self, layer_paths: list) -> dict:
+        """
+        Résumés des couches (fichiers, lignes, octets) depuis les sidecars / footers
+        
+        Calculés dans un sous-processus lancé avec le Python du venv (pandas,
+        pyarrow); repli sur le seul nombre de fichiers s'il échoue.
+        
+        Args:
+            layer_paths: Répertoires des couches
+            
+        Returns:
+            dict: {chemin: {files, rows, bytes}} (rows / bytes = None en repli)
+        """
+        paths = [str(path) for path in layer_paths]
+        try:
+            result = subprocess.run(
+                [self.python_exe, "-c", SUMMARY_SCRIPT] + paths,
+                cwd=self.project_root,
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            return json.loads(result.stdout)
+        except (OSError, subprocess.CalledProcessError, ValueError):
+            return {
+                path: {'files': len(list(Path(path).rglob("*.parquet"))), 'rows': None, 'bytes': None}
+                for path in paths
+            }
+    
     def print_summary(self):
         """Affiche le résumé final"""
         duration = (self.end_time - self.start_time).total_seconds() if self.end_time and self.start_time else 0
@@ -210,22 +252,18 @@ class PipelineRunner:
         print(f"   • Fin: {self.end_time.strftime('%H:%M:%S') if self.end_time else 'N/A'}")
         
         print(f"\n📁 Répertoires générés:")
-        if (self.data_dir / "bronze").exists():
-            bronze_files = list((self.data_dir / "bronze").rglob("*.parquet"))
-            print(f"   • bronze/: {len(bronze_files)} fichiers Parquet")
-        
-        if (self.data_dir / "silver").exists():
-            silver_files = list((self.data_dir / "silver").rglob("*.parquet"))
-            print(f"   • silver/: {len(silver_files)} fichiers Parquet")
-        
-        if (self.data_dir / "gold").exists():
-            gold_files = list((self.data_dir / "gold").rglob("*.parquet"))
-            print(f"   • gold/: {len(gold_files)} fichiers Parquet")
-        
-        if (self.data_dir / "dq").exists():
-            dq_files = list((self.data_dir / "dq").rglob("*.parquet"))
-            if dq_files:
-                print(f"   • dq/: {len(dq_files)} fichiers Parquet (rejets)")
+        # Sidecars / footers Parquet uniquement: aucune donnée relue
+        layers = [layer for layer in ["bronze", "silver", "gold", "dq"] if (self.data_dir / layer).exists()]
+        summaries = self.summarize_layers([self.data_dir / layer for layer in layers])
+        for layer in layers:
+            summary = summaries[str(self.data_dir / layer)]
+            if layer == "dq" and summary['files'] == 0:
+                continue
+            label = " (rejets)" if layer == "dq" else ""
+            details = ""
+            if summary['rows'] is not None:
+                details = f", {summary['rows']:,} lignes, {summary['bytes'] / 1024**2:.1f} Mo"
+            print(f"   • {layer}/: {summary['files']} fichiers Parquet{label}{details}")
         
         # Status final
         print(f"\n{'─'*80}")
@@ -260,6 +298,7 @@ Exemples:
   python run.py --load             # BRONZE + SILVER + GOLD + POSTGRES (alias du défaut)
   python run.py --clean            # Efface données + relance tout
   python run.py --clean --bronze   # Efface + seulement BRONZE
+  python run.py --force            # Réingère les sources BRONZE même inchangées
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
@@ -294,6 +333,12 @@ Exemples:
         help="Nettoyer données existantes avant d'exécuter"
     )
     
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Réingérer toutes les sources BRONZE, même inchangées depuis le dernier run"
+    )
+    
     parser.add_argument(
         "--python",
         type=str,
@@ -304,7 +349,7 @@ Exemples:
     args = parser.parse_args()
     
     # Créer runner
-    runner = PipelineRunner(venv_python=args.python)
+    runner = PipelineRunner(venv_python=args.python, force=args.force)
     runner.print_header()
     
     # Nettoyage optionnel
@@ -45,7 +45,7 @@ CREATE TABLE IF NOT EXISTS gold.dim_energy_type (
     category VARCHAR(50) NOT NULL,
     description TEXT,
     
-    CONSTRAINT ck_category CHECK (category IN ('Thermique', 'Renouvelable', 'Nucléaire', 'Importation'))
+    CONSTRAINT ck_category CHECK (category IN ('Thermique', 'Renouvelable', 'Nucléaire', 'Importation', 'Électricité'))
 );
 
 -- Data de base
@@ -54,7 +54,8 @@ INSERT INTO gold.dim_energy_type VALUES
     (2, 'Éolien Terrestre', 'Renouvelable', 'Énergie éolienne onshore'),
     (3, 'Éolien Offshore', 'Renouvelable', 'Énergie éolienne offshore'),
     (4, 'Solaire', 'Renouvelable', 'Énergie photovoltaïque'),
-    (5, 'Hydraulique', 'Renouvelable', 'Production hydroélectrique')
+    (5, 'Hydraulique', 'Renouvelable', 'Production hydroélectrique'),
+    (6, 'Électricité', 'Électricité', 'Électricité tous modes de production (bilan Eurostat, produit E7000)')
 ON CONFLICT DO NOTHING;
 
 -- 1.3 Dimension Localisation (Régions France)
@@ -173,6 +174,24 @@ CREATE INDEX idx_fact_monthly_energy_type ON gold.fact_monthly_summary (energy_t
 CREATE INDEX idx_fact_monthly_location ON gold.fact_monthly_summary (location_id);
 CREATE INDEX idx_fact_monthly_year_month ON gold.fact_monthly_summary (year, month);
 
+-- 2.4 Fact: Bilan Énergétique Annuel (Eurostat nrg_cb_e)
+CREATE TABLE IF NOT EXISTS gold.fact_annual_energy_balance (
+    year SMALLINT NOT NULL,
+    energy_type_id INTEGER NOT NULL REFERENCES gold.dim_energy_type(energy_type_id),
+    siec VARCHAR(20) NOT NULL,
+    nrg_bal VARCHAR(20) NOT NULL,
+    unit VARCHAR(10) NOT NULL,
+    value DOUBLE PRECISION,
+    nb_records INTEGER,
+    country VARCHAR(2) NOT NULL DEFAULT 'FR',
+    
+    CONSTRAINT pk_fact_annual_balance PRIMARY KEY (energy_type_id, siec, nrg_bal, unit, year),
+    CONSTRAINT ck_balance_year CHECK (year BETWEEN 1900 AND 2100)
+);
+
+-- Index: séries annuelles d'un poste (clé primaire) et coupes par année
+CREATE INDEX idx_fact_balance_year ON gold.fact_annual_energy_balance (year);
+
 -- ============================================================================
 -- VUES UTILES POUR L'ANALYTIQUE
 -- ============================================================================
@@ -238,13 +257,14 @@ GRANT SELECT ON ALL TABLES IN SCHEMA gold TO PUBLIC;
 COMMENT ON SCHEMA gold IS 'Couche GOLD - Star Schema pour analytique Data Warehouse Énergie';
 
 COMMENT ON TABLE gold.dim_date IS 'Dimension temporelle complète (2015-2026)';
-COMMENT ON TABLE gold.dim_energy_type IS 'Types d''énergie couverts: Nucléaire, Éolien, Solaire, Hydro, Thermique';
+COMMENT ON TABLE gold.dim_energy_type IS 'Types d''énergie couverts: Nucléaire, Éolien, Solaire, Hydro, Thermique, Électricité';
 COMMENT ON TABLE gold.dim_location IS 'Localisations: Régions France avec codes NUTS';
 COMMENT ON TABLE gold.dim_plant IS 'Master data installations: Centrales, Parcs éoliens, Panneaux solaires';
 
 COMMENT ON TABLE gold.fact_energy_production IS 'Production horaire/quotidienne d''énergie avec qualité des données';
 COMMENT ON TABLE gold.fact_renewable_capacity IS 'Capacité installée renouvelable par date, type, localisation';
 COMMENT ON TABLE gold.fact_monthly_summary IS 'Agrégations mensuelles pour performance rapide';
+COMMENT ON TABLE gold.fact_annual_energy_balance IS 'Bilans énergétiques annuels Eurostat par poste, produit SIEC (rattaché à un type d''énergie) et unité';
 
 -- ============================================================================
 -- FIN - Schéma Gold PostgreSQL
@@ -108,6 +108,21 @@ CREATE TABLE IF NOT EXISTS gold.fact_monthly_summary (
     country VARCHAR(2)
 );
 
+-- 2.4 Fact: Bilan Énergétique Annuel (Eurostat)
+CREATE TABLE IF NOT EXISTS gold.fact_annual_energy_balance (
+    year SMALLINT NOT NULL,
+    energy_type_id INTEGER NOT NULL REFERENCES gold.dim_energy_type(energy_type_id),
+    siec VARCHAR(20) NOT NULL,
+    nrg_bal VARCHAR(20) NOT NULL,
+    unit VARCHAR(10) NOT NULL,
+    value DOUBLE PRECISION,
+    nb_records INTEGER,
+    country VARCHAR(2),
+    PRIMARY KEY (energy_type_id, siec, nrg_bal, unit, year)
+);
+
+CREATE INDEX idx_fact_balance_year ON gold.fact_annual_energy_balance (year);
+
 -- ============================================================================
 -- PERMISSIONS
 -- ============================================================================
@@ -1,13 +1,55 @@
 """Bronze Layer - CSV Ingestion to Parquet (Pandas)"""
 
+import argparse
+import contextlib
+import fnmatch
+import glob
+import hashlib
+import io
+import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional, Tuple, Union
 
 import yaml
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pcsv
+import pyarrow.parquet as pq
+
+# Ajouter le chemin src pour les imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.dtype_utils import load_dtype_backend
+from lib.parquet_utils import (
+    load_write_options,
+    parquet_writer_kwargs,
+    partition_part_file,
+    read_parquet_stats,
+    write_parquet_table,
+    write_stats_sidecar
+)
+
+# Colonnes techniques ajoutées à chaque ligne ingérée
+SYSTEM_COLUMNS = ['_source_file', '_ingest_ts', '_ingest_date']
+
+# Type de _ingest_ts, identique en écriture pandas et streaming (un seul
+# schéma par table BRONZE quel que soit `bronze.streaming`)
+INGEST_TS_TYPE = pa.timestamp('us')
+
+# Manifest des derniers ingests réussis (à la racine de BRONZE)
+MANIFEST_FILE = "_manifest.json"
+
+# Valeurs lues comme null (défauts de pd.read_csv), pour que le parser
+# pyarrow (dtype_backend: pyarrow) produise exactement le même BRONZE
+CSV_NULL_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
 
 
 def load_config(config_path: str = "conf/config.yaml") -> dict:
@@ -16,7 +58,7 @@ def load_config(config_path: str = "conf/config.yaml") -> dict:
     
     Args:
         config_path: Chemin vers config.yaml
-        
+    
     Returns:
         dict: Configuration
     """
@@ -25,24 +67,175 @@ def load_config(config_path: str = "conf/config.yaml") -> dict:
     return config
 
 
+def add_system_columns(
+    df: pd.DataFrame,
+    source_file: str,
+    ingest_timestamp: pd.Timestamp,
+    dtype_backend: str = "numpy"
+) -> pd.DataFrame:
+    """
+    Ajoute les colonnes techniques (_source_file, _ingest_ts, _ingest_date)
+    
+    Args:
+        df: DataFrame (modifié sur place)
+        source_file: Nom du fichier source
+        ingest_timestamp: Horodatage d'ingestion (identique pour tous les lots d'un fichier)
+        dtype_backend: "pyarrow" = colonnes Arrow (string / timestamp[us])
+    
+    Returns:
+        Le DataFrame enrichi
+    """
+    values = {
+        '_source_file': (source_file, pa.string()),
+        '_ingest_ts': (ingest_timestamp, INGEST_TS_TYPE),
+        '_ingest_date': (ingest_timestamp.strftime("%Y-%m-%d"), pa.string()),
+    }
+    for name, (value, arrow_type) in values.items():
+        if dtype_backend == "pyarrow":
+            array = pa.nulls(len(df), arrow_type).fill_null(pa.scalar(value, arrow_type))
+            df[name] = pd.arrays.ArrowExtensionArray(array)
+        elif pa.types.is_timestamp(arrow_type):
+            # Unité fixée (sinon celle de pandas: ns avant pandas 3, us ensuite)
+            df[name] = np.full(len(df), np.datetime64(value.to_datetime64(), arrow_type.unit))
+        else:
+            df[name] = value
+    return df
+
+
+def bronze_arrow_schema(columns) -> pa.Schema:
+    """
+    Schéma Arrow BRONZE: colonnes métier en string + colonnes techniques
+    
+    Fixé à partir de l'en-tête du CSV pour que tous les lots écrits
+    par le ParquetWriter aient exactement le même schéma (une colonne
+    entièrement vide dans un lot resterait sinon de type null).
+    
+    Args:
+        columns: Colonnes métier (en-tête du CSV)
+    
+    Returns:
+        pa.Schema
+    """
+    fields = [pa.field(col, pa.string()) for col in columns]
+    fields += [
+        pa.field('_source_file', pa.string()),
+        pa.field('_ingest_ts', INGEST_TS_TYPE),
+        pa.field('_ingest_date', pa.string()),
+    ]
+    return pa.schema(fields)
+
+
+def resolve_usecols(
+    csv_path: str,
+    columns: Optional[List[str]] = None,
+    column_patterns: Optional[List[str]] = None,
+    delimiter: str = ",",
+    encoding: str = "utf-8"
+) -> Optional[List[str]]:
+    """
+    Résout la projection de colonnes d'une source (clés `columns` / `column_patterns`)
+    
+    Seul l'en-tête du CSV est lu. Les motifs sont de type shell (ex: "FR_*").
+    
+    Args:
+        csv_path: Chemin vers le fichier CSV
+        columns: Noms de colonnes explicites
+        column_patterns: Motifs fnmatch
+        delimiter: Délimiteur du CSV
+        encoding: Encodage du fichier
+    
+    Returns:
+        Liste des colonnes à parser (ordre du fichier), None = toutes
+    """
+    if not columns and not column_patterns:
+        return None
+    
+    header = pd.read_csv(csv_path, sep=delimiter, encoding=encoding, dtype=str, nrows=0)
+    wanted = set(columns or [])
+    patterns = column_patterns or []
+    
+    missing = wanted - set(header.columns)
+    if missing:
+        print(f"    ⚠️  Colonnes absentes du fichier: {sorted(missing)}")
+    
+    usecols = [
+        col for col in header.columns
+        if col in wanted or any(fnmatch.fnmatchcase(col, pattern) for pattern in patterns)
+    ]
+    
+    print(f"    ✂️  Projection: {len(usecols)}/{len(header.columns)} colonnes")
+    
+    return usecols
+
+
+def read_csv_arrow(
+    csv_path: str,
+    delimiter: str = ",",
+    encoding: str = "utf-8",
+    usecols: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Lit un CSV RAW avec le parser pyarrow (dtype_backend: pyarrow)
+    
+    Toutes les colonnes sont forcées en string (aucune inférence: "8.0"
+    reste "8.0") avec les valeurs nulles de pd.read_csv. Le résultat est
+    en string[pyarrow]: aucun objet Python n'est créé par cellule et
+    l'écriture Parquet réutilise les buffers Arrow.
+    
+    Args:
+        csv_path: Chemin vers le fichier CSV (.gz / .bz2 / .zst acceptés)
+        delimiter: Délimiteur du CSV
+        encoding: Encodage du fichier
+        usecols: Colonnes à parser (None = toutes)
+    
+    Returns:
+        pd.DataFrame: Colonnes string[pyarrow], dans l'ordre du fichier
+    """
+    header = pd.read_csv(csv_path, sep=delimiter, encoding=encoding, dtype=str, nrows=0, usecols=usecols)
+    columns = list(header.columns)
+    
+    table = pcsv.read_csv(
+        csv_path,
+        read_options=pcsv.ReadOptions(encoding=encoding),
+        parse_options=pcsv.ParseOptions(delimiter=delimiter),
+        convert_options=pcsv.ConvertOptions(
+            column_types={col: pa.string() for col in columns},
+            include_columns=columns,
+            null_values=CSV_NULL_VALUES,
+            strings_can_be_null=True,
+            quoted_strings_can_be_null=True
+        )
+    )
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
 def ingest_csv_to_bronze_pandas(
     csv_path: str,
     source_name: str,
     delimiter: str = ",",
-    encoding: str = "utf-8"
+    encoding: str = "utf-8",
+    usecols: Optional[List[str]] = None,
+    ingest_timestamp: Optional[pd.Timestamp] = None,
+    dtype_backend: Optional[str] = None
 ) -> pd.DataFrame:
     """
     Ingère un fichier CSV en BRONZE (RAW, sans transformation)
     
+    Les fichiers compressés (.csv.gz, .csv.bz2, .csv.zst) sont décompressés
+    à la volée par le parser (aucun fichier temporaire).
+    
     Args:
         csv_path: Chemin vers le fichier CSV
         source_name: Nom logique de la source
         delimiter: Délimiteur du CSV
         encoding: Encodage du fichier
-        
+        usecols: Colonnes à parser (None = toutes)
+        ingest_timestamp: Horodatage d'ingest (None = maintenant)
+        dtype_backend: "numpy" ou "pyarrow" (None = `dtype_backend` de config.yaml)
+    
     Returns:
         DataFrame avec colonnes métier + système (_source_file, _ingest_ts)
-        
+    
     Raises:
         FileNotFoundError: Si le fichier n'existe pas
     """
@@ -50,23 +243,25 @@ def ingest_csv_to_bronze_pandas(
     if not Path(csv_path).exists():
         raise FileNotFoundError(f"Fichier non trouvé: {csv_path}")
     
+    dtype_backend = dtype_backend or load_dtype_backend()
+    
     print(f"  📥 Lecture CSV: {Path(csv_path).name}")
     
     # Lire le CSV AS-IS (aucun transformation!)
-    df = pd.read_csv(
-        csv_path,
-        sep=delimiter,
-        encoding=encoding,
-        dtype=str  # Garder tous les types comme string (RAW)
-    )
+    if dtype_backend == "pyarrow":
+        df = read_csv_arrow(csv_path, delimiter, encoding, usecols)
+    else:
+        df = pd.read_csv(
+            csv_path,
+            sep=delimiter,
+            encoding=encoding,
+            dtype=str,  # Garder tous les types comme string (RAW)
+            usecols=usecols,  # Colonnes hors projection jamais matérialisées
+            compression='infer'  # .gz / .bz2 / .zst décompressés en streaming
+        )
     
     # Ajouter les colonnes système
-    ingest_timestamp = pd.Timestamp.now()
-    ingest_date = ingest_timestamp.strftime("%Y-%m-%d")
-    
-    df['_source_file'] = Path(csv_path).name
-    df['_ingest_ts'] = ingest_timestamp
-    df['_ingest_date'] = ingest_date
+    add_system_columns(df, Path(csv_path).name, ingest_timestamp or pd.Timestamp.now(), dtype_backend)
     
     row_count = len(df)
     col_count = len(df.columns)
@@ -77,18 +272,130 @@ def ingest_csv_to_bronze_pandas(
     return df
 
 
-def write_parquet(
-    df: pd.DataFrame,
+def ingest_csv_to_bronze_streaming(
+    csv_path: Union[str, List[str]],
+    source_name: str,
     output_path: str,
-    source_name: str
-) -> None:
+    delimiter: str = ",",
+    encoding: str = "utf-8",
+    batch_size: int = 100_000,
+    partition_column: Optional[str] = None,
+    usecols: Optional[List[str]] = None,
+    ingest_timestamp: Optional[pd.Timestamp] = None,
+    dtype_backend: Optional[str] = None
+) -> Tuple[int, str]:
     """
-    Écrit le DataFrame en Parquet
+    Ingère un fichier CSV en BRONZE par lots (mémoire bornée)
+    
+    Le CSV est lu par blocs de `batch_size` lignes (toujours en string, RAW)
+    et chaque bloc est ajouté comme row group au fichier Parquet via un
+    ParquetWriter. Le pic mémoire dépend de la taille des lots, pas de la
+    taille du fichier. Les fichiers compressés (.gz, .bz2, .zst) sont
+    décompressés en flux directement dans le parser.
+    
+    Plusieurs fichiers (même en-tête) peuvent être ingérés dans le même
+    fichier Parquet, chacun avec son propre `_source_file`.
+    
+    Args:
+        csv_path: Chemin du fichier CSV, ou liste de fichiers
+        source_name: Nom logique de la source
+        output_path: Répertoire BRONZE (parent)
+        delimiter: Délimiteur du CSV
+        encoding: Encodage du fichier
+        batch_size: Nombre de lignes par lot
+        partition_column: Colonne de partition Hive (None = data.parquet unique)
+        usecols: Colonnes à parser (None = toutes)
+        ingest_timestamp: Horodatage d'ingest (None = maintenant)
+        dtype_backend: "pyarrow" = lots en string[pyarrow] (None = config.yaml)
+    
+    Returns:
+        Tuple[nb_lignes, fichier_parquet]
+    
+    Raises:
+        FileNotFoundError: Si un fichier n'existe pas
+    """
+    
+    csv_paths = [csv_path] if isinstance(csv_path, str) else list(csv_path)
+    
+    for path in csv_paths:
+        if not Path(path).exists():
+            raise FileNotFoundError(f"Fichier non trouvé: {path}")
+    
+    # Schéma fixé depuis l'en-tête (aucune ligne de données lue)
+    header = pd.read_csv(csv_paths[0], sep=delimiter, encoding=encoding, dtype=str, nrows=0, usecols=usecols)
+    schema = bronze_arrow_schema(header.columns)
+    
+    ingest_timestamp = ingest_timestamp or pd.Timestamp.now()
+    dtype_backend = dtype_backend or load_dtype_backend()
+    raw_dtype = pd.ArrowDtype(pa.string()) if dtype_backend == "pyarrow" else str
+    
+    parquet_file = bronze_table_file(output_path, source_name, ingest_timestamp, partition_column)
+    
+    # La colonne de partition est portée par le chemin, pas par le fichier
+    if partition_column:
+        schema = schema.remove(schema.get_field_index(partition_column))
+    
+    print(f"  💾 Écriture Parquet (streaming): {source_name}")
+    
+    row_count = 0
+    batch_count = 0
+    row_group_size = load_write_options()['row_group_size']
+    
+    with pq.ParquetWriter(parquet_file, schema, **parquet_writer_kwargs(schema)) as writer:
+        for path in csv_paths:
+            source_file = Path(path).name
+            print(f"  📥 Lecture CSV en streaming: {source_file} (lots de {batch_size:,} lignes)")
+            
+            with pd.read_csv(
+                path,
+                sep=delimiter,
+                encoding=encoding,
+                dtype=raw_dtype,  # Garder tous les types comme string (RAW)
+                usecols=usecols,
+                compression='infer',  # .gz / .bz2 / .zst décompressés en streaming
+                chunksize=batch_size
+            ) as reader:
+                for chunk in reader:
+                    add_system_columns(chunk, source_file, ingest_timestamp, dtype_backend)
+                    if partition_column:
+                        chunk = chunk.drop(columns=[partition_column])
+                    table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+                    writer.write_table(table, row_group_size=row_group_size)
+                    
+                    row_count += len(chunk)
+                    batch_count += 1
+    
+    # Statistiques (lignes, nulls, min/max) depuis le footer tout juste écrit
+    write_stats_sidecar(parquet_file)
+    
+    print(f"    ✅ {row_count:,} lignes ingérées ({batch_count} lots)")
+    print(f"    📊 {len(header.columns) + 3} colonnes (dont 3 techniques)")
+    print(f"    📂 {parquet_file}")
+    
+    return row_count, parquet_file
+
+
+def bronze_table_file(
+    output_path: str,
+    source_name: str,
+    ingest_timestamp: Optional[pd.Timestamp] = None,
+    partition_column: Optional[str] = None
+) -> str:
+    """
+    Prépare le répertoire d'une table BRONZE et retourne le fichier Parquet cible
+    
+    Partitionné: <source>/_ingest_date=YYYY-MM-DD/part-<run>-<uuid>.parquet,
+    un nouveau fichier par run (append, l'historique RAW est conservé).
+    Sinon: <source>/data.parquet (écrasé à chaque run).
     
     Args:
-        df: DataFrame à écrire
         output_path: Chemin de destination (parent directory)
         source_name: Nom de la source (pour path)
+        ingest_timestamp: Horodatage de l'ingest (requis si partitionné)
+        partition_column: Colonne de partition (None = pas de partition)
+    
+    Returns:
+        str: Chemin du fichier Parquet
     """
     
     full_path = os.path.join(output_path, source_name)
@@ -105,14 +412,218 @@ def write_parquet(
     except Exception as e:
         print(f"    ⚠️  Impossible de créer {full_path}: {str(e)}")
     
+    if partition_column:
+        # Seule _ingest_date est constante sur un run: valeur = date de l'ingest
+        partition_value = ingest_timestamp.strftime("%Y-%m-%d")
+        return partition_part_file(full_path, partition_column, partition_value, ingest_timestamp)
+    
+    # Fichier parquet directement (sans sous-dossier)
+    return os.path.join(full_path, "data.parquet")
+
+
+def write_parquet(
+    df: pd.DataFrame,
+    output_path: str,
+    source_name: str,
+    partition_column: Optional[str] = None
+) -> str:
+    """
+    Écrit le DataFrame en Parquet
+    
+    Args:
+        df: DataFrame à écrire
+        output_path: Chemin de destination (parent directory)
+        source_name: Nom de la source (pour path)
+        partition_column: Colonne de partition Hive (None = data.parquet unique)
+    
+    Returns:
+        str: Chemin du fichier Parquet écrit
+    """
+    
+    if partition_column:
+        ingest_timestamp = df['_ingest_ts'].iloc[0] if len(df) > 0 else pd.Timestamp.now()
+        parquet_file = bronze_table_file(output_path, source_name, ingest_timestamp, partition_column)
+        df = df.drop(columns=[partition_column])
+    else:
+        parquet_file = bronze_table_file(output_path, source_name)
+    
     print(f"  💾 Écriture Parquet: {source_name}")
     
-    # Écrire le fichier parquet directement (sans sous-dossier)
-    parquet_file = os.path.join(full_path, "data.parquet")
-    df.to_parquet(parquet_file, engine='pyarrow', index=False)
+    # Même schéma que l'écriture streaming (string, _ingest_ts en timestamp[us])
+    schema = bronze_arrow_schema([col for col in df.columns if col not in SYSTEM_COLUMNS])
+    if partition_column:
+        schema = schema.remove(schema.get_field_index(partition_column))
+    
+    # Writer partagé (codec, row groups, encodages) + sidecar de statistiques
+    write_parquet_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False), parquet_file)
     
     print(f"    ✅ Parquet écrit")
     print(f"    📂 {parquet_file}")
+    
+    return parquet_file
+
+
+def hash_file(path: str, block_size: int = 1 << 20) -> str:
+    """
+    Calcule le SHA-256 du contenu d'un fichier (lecture par blocs)
+    
+    Args:
+        path: Chemin du fichier
+        block_size: Taille des blocs lus
+    
+    Returns:
+        str: Empreinte hexadécimale
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_fingerprint(path: str, previous: Optional[dict] = None) -> dict:
+    """
+    Empreinte d'un fichier landing: chemin, taille, mtime, hash du contenu
+    
+    Si la taille et le mtime sont identiques à l'empreinte précédente,
+    le hash enregistré est réutilisé sans relire le fichier: un run sans
+    nouveauté se réduit à un stat() par source.
+    
+    Args:
+        path: Chemin du fichier
+        previous: Entrée du manifest du dernier ingest (optionnel)
+    
+    Returns:
+        dict: {path, size, mtime_ns, sha256}
+    
+    Raises:
+        FileNotFoundError: Si le fichier n'existe pas
+    """
+    if not Path(path).exists():
+        raise FileNotFoundError(f"Fichier non trouvé: {path}")
+    
+    stat = os.stat(path)
+    fingerprint = {
+        'path': str(path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+    }
+    
+    if (previous
+            and previous.get('size') == stat.st_size
+            and previous.get('mtime_ns') == stat.st_mtime_ns
+            and previous.get('sha256')):
+        fingerprint['sha256'] = previous['sha256']
+    else:
+        fingerprint['sha256'] = hash_file(path)
+    
+    return fingerprint
+
+
+def resolve_source_files(landing_path: str, file_pattern: str) -> List[str]:
+    """
+    Fichiers landing d'une source: nom simple ou motif glob (ex: "ts_*.csv.gz")
+    
+    Args:
+        landing_path: Répertoire landing
+        file_pattern: Clé `file` de la source
+    
+    Returns:
+        List[str]: Fichiers triés
+    
+    Raises:
+        FileNotFoundError: Si aucun fichier ne correspond
+    """
+    pattern = os.path.join(landing_path, file_pattern)
+    
+    if not glob.has_magic(file_pattern):
+        if not Path(pattern).exists():
+            raise FileNotFoundError(f"Fichier non trouvé: {pattern}")
+        return [pattern]
+    
+    files = sorted(glob.glob(pattern))
+    if not files:
+        raise FileNotFoundError(f"Aucun fichier pour le motif: {pattern}")
+    return files
+
+
+def source_fingerprint(csv_paths: List[str], previous: Optional[dict] = None) -> List[dict]:
+    """
+    Empreintes de tous les fichiers d'une source
+    
+    Args:
+        csv_paths: Fichiers landing de la source
+        previous: Entrée du manifest du dernier ingest (optionnel)
+    
+    Returns:
+        List[dict]: Une empreinte par fichier
+    """
+    previous_files = {f['path']: f for f in (previous or {}).get('files', [])}
+    return [file_fingerprint(path, previous_files.get(str(path))) for path in csv_paths]
+
+
+def load_manifest(bronze_path: str) -> dict:
+    """
+    Charge le manifest BRONZE ({source: entrée du dernier ingest réussi})
+    
+    Args:
+        bronze_path: Répertoire BRONZE
+    
+    Returns:
+        dict: Manifest (vide si absent ou illisible)
+    """
+    manifest_file = os.path.join(bronze_path, MANIFEST_FILE)
+    if not os.path.exists(manifest_file):
+        return {}
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Manifest illisible, ignoré: {str(e)}")
+        return {}
+
+
+def save_manifest(bronze_path: str, manifest: dict) -> None:
+    """
+    Écrit le manifest BRONZE de manière atomique (fichier temporaire + rename)
+    
+    Args:
+        bronze_path: Répertoire BRONZE
+        manifest: Manifest à écrire
+    """
+    manifest_file = os.path.join(bronze_path, MANIFEST_FILE)
+    tmp_file = manifest_file + ".tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_file, manifest_file)
+
+
+def is_source_unchanged(previous: Optional[dict], fingerprints: List[dict], options: dict) -> bool:
+    """
+    Vrai si la source est identique au dernier ingest réussi
+    
+    Compare la liste des fichiers (chemin, taille, hash du contenu) et les
+    options d'ingestion, et vérifie que le fichier BRONZE produit existe toujours.
+    
+    Args:
+        previous: Entrée du manifest (None si jamais ingérée)
+        fingerprints: Empreintes actuelles des fichiers landing
+        options: Options d'ingestion (délimiteur, ...)
+    
+    Returns:
+        bool
+    """
+    if not previous:
+        return False
+    
+    def content_key(files):
+        return [(f['path'], f['size'], f['sha256']) for f in files]
+    
+    return (
+        content_key(previous.get('files', [])) == content_key(fingerprints)
+        and previous.get('options') == options
+        and os.path.exists(previous.get('output_file', ''))
+    )
 
 
 def print_schema(df: pd.DataFrame, max_cols: int = 15) -> None:
@@ -136,10 +647,164 @@ def print_schema(df: pd.DataFrame, max_cols: int = 15) -> None:
             break
 
 
-def run_bronze_ingestion_pandas() -> bool:
+def ingest_source(
+    source: dict,
+    landing_path: str,
+    bronze_path: str,
+    bronze_config: dict,
+    partition_column: Optional[str] = None,
+    previous: Optional[dict] = None,
+    force: bool = False,
+    verbose: bool = True
+) -> Tuple[str, Optional[dict]]:
+    """
+    Ingère une source de config.yaml en BRONZE (exécutable dans un worker)
+    
+    Toutes les erreurs sont capturées: l'échec d'une source n'affecte pas
+    les autres.
+    
+    Args:
+        source: Entrée de la section `sources`
+        landing_path: Répertoire landing
+        bronze_path: Répertoire BRONZE
+        bronze_config: Section `bronze` de la config
+        partition_column: Colonne de partition Hive (None = data.parquet unique)
+        previous: Entrée du manifest du dernier ingest réussi
+        force: Réingérer même si inchangée
+        verbose: Afficher schéma et aperçu
+    
+    Returns:
+        Tuple[résultat, entrée_manifest] - entrée None si l'ingest a échoué
+    """
+    source_name = source['name']
+    filename = source['file']
+    delimiter = source.get('delimiter', ',')
+    streaming = source.get('streaming', bronze_config.get('streaming', False))
+    batch_size = int(bronze_config.get('batch_size', 100_000))
+    
+    # Projection de colonnes, sauf si on préserve le RAW complet
+    preserve_raw = source.get('preserve_raw', bronze_config.get('preserve_raw', False))
+    columns = None if preserve_raw else source.get('columns')
+    column_patterns = None if preserve_raw else source.get('column_patterns')
+    
+    options = {
+        'delimiter': delimiter,
+        'partition_column': partition_column,
+        'columns': columns,
+        'column_patterns': column_patterns,
+    }
+    
+    print(f"🔄 Source: {source_name}")
+    
+    try:
+        # Fichiers landing (nom simple ou glob) vs dernier ingest réussi
+        csv_paths = resolve_source_files(landing_path, filename)
+        fingerprints = source_fingerprint(csv_paths, previous)
+        
+        if not force and is_source_unchanged(previous, fingerprints, options):
+            print(f"    ⏭️  Inchangé depuis le dernier ingest ({previous.get('ingest_ts')})\n")
+            # mtime rafraîchi: un fichier "touché" ne sera pas re-hashé au prochain run
+            return "UNCHANGED", {**previous, 'files': fingerprints}
+        
+        if len(csv_paths) > 1:
+            print(f"    🗂️  {len(csv_paths)} fichiers")
+        
+        usecols = resolve_usecols(csv_paths[0], columns, column_patterns, delimiter)
+        
+        # Un seul horodatage (et donc un seul run) pour tous les fichiers de la source
+        ingest_timestamp = pd.Timestamp.now()
+        
+        if streaming:
+            # Ingérer + écrire par lots (mémoire bornée)
+            row_count, output_file = ingest_csv_to_bronze_streaming(
+                csv_path=csv_paths,
+                source_name=source_name,
+                output_path=bronze_path,
+                delimiter=delimiter,
+                batch_size=batch_size,
+                partition_column=partition_column,
+                usecols=usecols,
+                ingest_timestamp=ingest_timestamp
+            )
+        else:
+            # Ingérer (chaque fichier garde son _source_file)
+            frames = [
+                ingest_csv_to_bronze_pandas(
+                    csv_path=path,
+                    source_name=source_name,
+                    delimiter=delimiter,
+                    usecols=usecols,
+                    ingest_timestamp=ingest_timestamp
+                )
+                for path in csv_paths
+            ]
+            df_bronze = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+            
+            if verbose:
+                # Afficher schéma
+                print_schema(df_bronze)
+                
+                # Afficher aperçu (3 lignes)
+                print(f"    🔍 Aperçu:")
+                print(df_bronze.head(3).to_string())
+            
+            # Écrire en Parquet
+            output_file = write_parquet(
+                df=df_bronze,
+                output_path=bronze_path,
+                source_name=source_name,
+                partition_column=partition_column
+            )
+            row_count = len(df_bronze)
+        
+        print()
+        
+        # Entrée du manifest pour cet ingest réussi
+        return "SUCCESS", {
+            'files': fingerprints,
+            'options': options,
+            'row_count': row_count,
+            'output_file': output_file,
+            'ingest_ts': pd.Timestamp.now().isoformat(),
+        }
+    
+    except FileNotFoundError as e:
+        print(f"    ⚠️  SKIP - {str(e)}\n")
+        return "FILE_NOT_FOUND", None
+    
+    except Exception as e:
+        print(f"    ❌ ERREUR - {str(e)}\n")
+        import traceback
+        traceback.print_exc()
+        return f"ERROR: {str(e)}", None
+
+
+def ingest_source_worker(*args) -> Tuple[str, Optional[dict], str]:
+    """
+    Variante de `ingest_source` pour le pool de process
+    
+    Capture la sortie du worker pour que le parent l'affiche d'un bloc
+    (pas de logs entrelacés entre sources).
+    
+    Returns:
+        Tuple[résultat, entrée_manifest, log]
+    """
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+        result, entry = ingest_source(*args)
+    return result, entry, buffer.getvalue()
+
+
+def run_bronze_ingestion_pandas(force: bool = False) -> bool:
     """
     Pipeline complet d'ingestion BRONZE (Pandas)
     
+    Les sources dont l'empreinte (taille, mtime, hash) correspond au
+    dernier ingest réussi du manifest sont ignorées.
+    
+    Args:
+        force: Réingérer toutes les sources même inchangées
+    
     Returns:
         bool: True si succès, False sinon
     """
@@ -154,62 +819,88 @@ def run_bronze_ingestion_pandas() -> bool:
         landing_path = config['paths']['landing']
         bronze_path = config['paths']['bronze']
         sources = config['sources']
+        bronze_config = config.get('bronze', {})
+        
+        # Partitionnement Hive append-only (partitioning.bronze)
+        partitioning = config.get('partitioning', {}).get('bronze', {})
+        partition_column = None
+        if partitioning.get('enabled', False):
+            partition_column = partitioning.get('column', '_ingest_date')
+            if partition_column != '_ingest_date':
+                print(f"⚠️  Partition sur {partition_column} non supportée, utilisation de _ingest_date")
+                partition_column = '_ingest_date'
         
         print(f"📂 Landing: {landing_path}")
-        print(f"📂 Bronze:  {bronze_path}\n")
+        print(f"📂 Bronze:  {bronze_path}")
+        print(f"📂 Partitions: {partition_column + '=YYYY-MM-DD (append)' if partition_column else 'aucune (écrasement)'}\n")
         
         # 2️⃣ Créer répertoires
         Path(bronze_path).mkdir(parents=True, exist_ok=True)
         
         # 3️⃣ Ingérer et écrire chaque source
+        manifest = load_manifest(bronze_path)
+        if force:
+            print(f"⚠️  --force: réingestion de toutes les sources\n")
+        
+        workers = int(bronze_config.get('workers', 1))
+        outcomes = {}
+        
+        if workers > 1 and len(sources) > 1:
+            # Sources indépendantes: une par process (parsing CSV CPU-bound)
+            workers = min(workers, len(sources))
+            print(f"⚡ Ingestion parallèle: {workers} workers\n")
+            
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(
+                        ingest_source_worker,
+                        source,
+                        landing_path,
+                        bronze_path,
+                        bronze_config,
+                        partition_column,
+                        manifest.get(source['name']),
+                        force,
+                        False
+                    ): source['name']
+                    for source in sources
+                }
+                for future in as_completed(futures):
+                    source_name = futures[future]
+                    try:
+                        result, entry, log = future.result()
+                        print(log, end='')
+                        outcomes[source_name] = (result, entry)
+                    except Exception as e:
+                        # Crash du worker lui-même (ex: process tué)
+                        print(f"❌ {source_name}: worker en échec - {str(e)}\n")
+                        outcomes[source_name] = (f"ERROR: {str(e)}", None)
+        else:
+            for source in sources:
+                outcomes[source['name']] = ingest_source(
+                    source,
+                    landing_path,
+                    bronze_path,
+                    bronze_config,
+                    partition_column,
+                    manifest.get(source['name']),
+                    force
+                )
+        
+        # Consolider les résultats (ordre de config.yaml) et le manifest
         results = {}
         success_count = 0
         
         for source in sources:
             source_name = source['name']
-            filename = source['file']
-            delimiter = source.get('delimiter', ',')
-            
-            csv_path = os.path.join(landing_path, filename)
-            
-            print(f"🔄 Source: {source_name}")
-            
-            try:
-                # Ingérer
-                df_bronze = ingest_csv_to_bronze_pandas(
-                    csv_path=csv_path,
-                    source_name=source_name,
-                    delimiter=delimiter
-                )
-                
-                # Afficher schéma
-                print_schema(df_bronze)
-                
-                # Afficher aperçu (3 lignes)
-                print(f"    🔍 Aperçu:")
-                print(df_bronze.head(3).to_string())
-                
-                # Écrire en Parquet
-                write_parquet(
-                    df=df_bronze,
-                    output_path=bronze_path,
-                    source_name=source_name
-                )
-                
-                results[source_name] = "SUCCESS"
+            result, entry = outcomes[source_name]
+            results[source_name] = result
+            if entry is not None:
+                manifest[source_name] = entry
+            if result in ("SUCCESS", "UNCHANGED"):
                 success_count += 1
-                
-            except FileNotFoundError as e:
-                print(f"    ⚠️  SKIP - {str(e)}\n")
-                results[source_name] = "FILE_NOT_FOUND"
-                
-            except Exception as e:
-                print(f"    ❌ ERREUR - {str(e)}\n")
-                import traceback
-                traceback.print_exc()
-                results[source_name] = f"ERROR: {str(e)}"
-            
-            print()
+        
+        save_manifest(bronze_path, manifest)
         
         # 4️⃣ Vérification des fichiers écrits
         print(f"{'='*80}")
@@ -218,13 +909,16 @@ def run_bronze_ingestion_pandas() -> bool:
         
         for source_name, result in results.items():
             if result == "SUCCESS":
-                bronze_table_path = os.path.join(bronze_path, source_name)
+                # Sidecar du fichier écrit par ce run: aucune relecture des données
+                bronze_table_path = manifest[source_name]['output_file']
                 try:
-                    df = pd.read_parquet(bronze_table_path)
-                    count = len(df)
-                    print(f"✅ {source_name:35s} : {count:10,} lignes")
+                    stats = read_parquet_stats(bronze_table_path)
+                    print(f"✅ {source_name:35s} : {stats['rows']:10,} lignes ({stats['bytes'] / 1024**2:.1f} Mo)")
                 except:
                     print(f"⚠️  {source_name:35s} : Parquet non accessible")
+            elif result == "UNCHANGED":
+                count = manifest[source_name].get('row_count', 0)
+                print(f"⏭️  {source_name:35s} : {count:10,} lignes (inchangé)")
             else:
                 print(f"⏭️  {source_name:35s} : {result}")
         
@@ -233,7 +927,8 @@ def run_bronze_ingestion_pandas() -> bool:
         print(f"✅ BRONZE LAYER - COMPLÉTÉ")
         print(f"{'='*80}\n")
         print(f"📊 RÉSUMÉ:")
-        print(f"   • Sources ingérées: {success_count}/{len(sources)}")
+        unchanged_count = sum(1 for r in results.values() if r == "UNCHANGED")
+        print(f"   • Sources ingérées: {success_count - unchanged_count}/{len(sources)} (+{unchanged_count} inchangées)")
         print(f"   • Destination: {bronze_path}")
         print(f"   • Format: Parquet (compatible Spark)")
         print(f"   • Colonnes système: _source_file, _ingest_ts, _ingest_date")
@@ -241,7 +936,7 @@ def run_bronze_ingestion_pandas() -> bool:
         print(f"   • Next step: 02_silver_clean.py\n")
         
         return success_count == len(sources)
-        
+    
     except Exception as e:
         print(f"\n❌ ERREUR FATALE: {str(e)}\n")
         import traceback
@@ -250,9 +945,13 @@ def run_bronze_ingestion_pandas() -> bool:
 
 
 if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Ingestion BRONZE (CSV → Parquet)")
+    parser.add_argument("--force", action="store_true", help="Réingérer toutes les sources, même inchangées")
+    args = parser.parse_args()
     
     try:
-        success = run_bronze_ingestion_pandas()
+        success = run_bronze_ingestion_pandas(force=args.force)
         
         if success:
             print("🎉 Pipeline BRONZE (PANDAS) terminé avec succès!\n")
@@ -260,7 +959,7 @@ if __name__ == "__main__":
         else:
             print("⚠️  Pipeline BRONZE (PANDAS) terminé avec des avertissements\n")
             sys.exit(1)
-            
+    
     except Exception as e:
         print(f"❌ Erreur fatale: {str(e)}\n")
         sys.exit(1)
@@ -1,15 +1,65 @@
 """Silver Layer - Data Cleaning & Quality Control"""
 
+import argparse
+import contextlib
+import io
+import json
 import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 import pandas as pd
 import numpy as np
 
+# Ajouter le chemin src pour les imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.dedup_utils import ROW_ID_COLUMN, deduplicate
+from lib.dq_rules import Rule, add_dq_metrics, pop_dq_metrics, source_rules, split_valid_rejects
+from lib.dtype_utils import coerce_numeric, constants_metadata, format_bytes_saved, load_dtype_options, optimize_dtypes
+from lib.parquet_utils import (
+    delete_key_range,
+    load_write_options,
+    part_run_token,
+    plan_row_group_chunks,
+    read_key_range,
+    read_parquet_stats,
+    read_partitioned_table,
+    read_row_group_chunk,
+    run_token,
+    select_partition_files,
+    stats_sidecar_path,
+    table_files,
+    table_part_file,
+    write_parquet_table,
+)
+from lib.profile_utils import invalidate_profile, update_profile
+from lib.reject_sink import SAMPLE_KEY_COLUMN, Rejects, concat_rejects, filter_rejects, summarize_rejects
+from lib.timestamp_utils import parse_timestamps, timestamp_format
+
+
+# État incrémental SILVER: {source: watermark} (préfixe "_" = ignoré des lecteurs)
+WATERMARK_FILE = "_watermarks.json"
+
+# Colonnes de séries 60 min: <CC>[_<zone>]_<variable>_<attribut>[_<fournisseur>]
+# ex: FR_load_actual_entsoe_transparency, DE_50hertz_wind_generation_actual
+SERIES_COLUMN = re.compile(r"^[A-Z]{2}_")
+SERIES_VARIABLES = ("load", "solar", "wind", "price")
+SERIES_PROVIDERS = ("entsoe_transparency", "entsoe_power_statistics", "tso")
+
+# Row groups de la table longue: petits pour qu'un scan par pays / métrique
+# (table triée) n'en lise que quelques-uns
+LONG_TABLE_ROW_GROUP_SIZE = 131_072
+
+# Eurostat (nrg_cb_e): une colonne par année, dimensions du bilan en texte
+EUROSTAT_YEAR_COLUMN = re.compile(r"^\d{4}$")
+EUROSTAT_DIMENSIONS = ("nrg_bal", "siec", "unit")
+
 
 def load_config(config_path: str = "conf/config.yaml") -> dict:
     """Charge la configuration"""
@@ -18,7 +68,11 @@ def load_config(config_path: str = "conf/config.yaml") -> dict:
     return config
 
 
-def clean_france_time_series(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+def clean_france_time_series(
+    df: pd.DataFrame,
+    rules: Optional[List[Rule]] = None,
+    ts_format: Optional[str] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Nettoie france_time_series.csv
     
@@ -27,25 +81,31 @@ def clean_france_time_series(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFra
               FR_solar_generation_actual (str) → solar_mw (float)
               FR_wind_onshore_generation_actual (str) → wind_mw (float)
     
+    Toutes les règles sont évaluées en une passe (masque de rejet); une
+    ligne rejetée porte toutes les règles qu'elle enfreint.
+    
+    Args:
+        df: Données BRONZE
+        rules: Règles DQ (None = `dq_rules.france_time_series` de config.yaml)
+        ts_format: Format de utc_timestamp (None = `silver.timestamp_formats`)
+    
     Returns:
-        Tuple[valid_df, reject_df]
+        Tuple[valid_df, rejects]
     """
     
     df = df.copy()
-    reject_reasons = []
     
     print("  🔧 Nettoyage france_time_series...")
     
-    # 1. Convertir timestamp
-    try:
-        df['event_ts'] = pd.to_datetime(df['utc_timestamp'], errors='coerce')
-    except:
-        df['event_ts'] = pd.NaT
+    # 1. Convertir timestamp (format explicite, repli tolérant compté en métrique DQ)
+    if ts_format is None:
+        ts_format = timestamp_format('france_time_series', 'utc_timestamp')
+    df['event_ts'], ts_metrics = parse_timestamps(df['utc_timestamp'], ts_format)
     
     # 2. Convertir colonnes numériques
     for col in ['FR_load_actual_entsoe_transparency', 'FR_solar_generation_actual', 'FR_wind_onshore_generation_actual']:
         if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+            df[col] = coerce_numeric(df[col])
     
     # Renommer colonnes
     df = df.rename(columns={
@@ -54,34 +114,10 @@ def clean_france_time_series(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFra
         'FR_wind_onshore_generation_actual': 'wind_mw'
     })
     
-    # 3. Appliquer règles de validation
-    # Règle 1: Timestamp obligatoire
-    valid = df[df['event_ts'].notna()].copy()
-    invalid_ts = df[df['event_ts'].isna()].copy()
-    if len(invalid_ts) > 0:
-        invalid_ts['reject_reason'] = 'Timestamp invalide ou manquant'
-        reject_reasons.append(invalid_ts)
-    
-    df = valid
-    
-    # Règle 2: Valeurs négatives (impossible physiquement)
-    for col in ['load_mw', 'solar_mw', 'wind_mw']:
-        if col in df.columns:
-            invalid = df[(df[col] < 0) & (df[col].notna())].copy()
-            if len(invalid) > 0:
-                invalid['reject_reason'] = f'{col} < 0 (impossible physiquement)'
-                reject_reasons.append(invalid)
-            df = df[~((df[col] < 0) & (df[col].notna()))]
-    
-    # Règle 3: Timestamp futur
-    now = pd.Timestamp.now(tz='UTC')
-    # Comparer sans timezone si nécessaire
-    event_ts_naive = df['event_ts'].dt.tz_localize(None) if df['event_ts'].dt.tz is not None else df['event_ts']
-    invalid = df[event_ts_naive > now.tz_localize(None)].copy()
-    if len(invalid) > 0:
-        invalid['reject_reason'] = f'Timestamp futur'
-        reject_reasons.append(invalid)
-    df = df[event_ts_naive <= now.tz_localize(None)]
+    # 3. Appliquer règles de validation (une passe, un bit par règle)
+    if rules is None:
+        rules = source_rules('france_time_series')
+    df, rejects = split_valid_rejects(df, rules)
     
     # 4. Déduplication par event_ts
     df = df.drop_duplicates(subset=['event_ts'], keep='first')
@@ -93,142 +129,862 @@ def clean_france_time_series(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFra
     # Sélectionner colonnes finales
     final_cols = ['event_ts', 'load_mw', 'solar_mw', 'wind_mw', 'country', 'energy_type', '_source_file', '_ingest_ts', '_ingest_date']
     df = df[[c for c in final_cols if c in df.columns]]
+    add_dq_metrics(df, ts_metrics)
     
-    # Concaténer tous les rejets
-    reject_df = pd.concat(reject_reasons, ignore_index=True) if reject_reasons else pd.DataFrame()
-    
-    print(f"    ✅ {len(df)} lignes valides | ❌ {len(reject_df)} rejetées")
+    print(f"    ✅ {len(df)} lignes valides | ❌ {len(rejects)} rejetées")
     
-    return df, reject_df
+    return df, rejects
 
 
-def clean_eurostat_electricity_france(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+def clean_eurostat_electricity_france(df: pd.DataFrame, rules: Optional[List[Rule]] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Nettoie eurostat_electricity_france.csv
+    
+    Args:
+        df: Données BRONZE
+        rules: Règles DQ (None = `dq_rules.eurostat_electricity_france` de config.yaml)
     """
     
     df = df.copy()
-    reject_reasons = []
     
     print("  🔧 Nettoyage eurostat_electricity_france...")
     
-    # Convertir colonnes numériques
+    # Convertir colonnes numériques (années + index); les dimensions
+    # (freq, nrg_bal, siec, unit, geo\TIME_PERIOD) restent du texte
     for col in df.columns:
-        if col not in ['_source_file', '_ingest_ts', '_ingest_date']:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+        if EUROSTAT_YEAR_COLUMN.match(col) or col == 'index':
+            df[col] = coerce_numeric(df[col])
     
-    # Déduplication
-    df = df.drop_duplicates(keep='first')
+    # Règles DQ
+    if rules is None:
+        rules = source_rules('eurostat_electricity_france')
+    df, rejects = split_valid_rejects(df, rules)
     
-    # Ajouter colonnes métier
+    # Ajouter colonnes métier (avant la dédup: même clé que la fusion des blocs)
     df['country'] = 'FR'
     
-    reject_df = pd.DataFrame()
+    # Déduplication (hash de ligne 64 bits, _row_id stable; voir silver.dedup)
+    df, dedup_metrics = deduplicate(df, 'eurostat_electricity_france')
+    add_dq_metrics(df, dedup_metrics)
     
-    print(f"    ✅ {len(df)} lignes valides | ❌ {len(reject_df)} rejetées")
+    print(f"    ✅ {len(df)} lignes valides | ❌ {len(rejects)} rejetées | 🔁 {dedup_metrics['duplicate_rows']} doublons")
     
-    return df, reject_df
+    return df, rejects
 
 
-def clean_time_series_60min(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+def clean_time_series_60min(
+    df: pd.DataFrame,
+    rules: Optional[List[Rule]] = None,
+    ts_format: Optional[str] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Nettoie time_series_60min_sample.csv
     Données haute fréquence (toutes les heures)
+    
+    Args:
+        df: Données BRONZE
+        rules: Règles DQ (None = `dq_rules.time_series_60min_sample` de config.yaml)
+        ts_format: Format du timestamp (None = `silver.timestamp_formats`)
     """
     
     df = df.copy()
-    reject_reasons = []
     
     print("  🔧 Nettoyage time_series_60min_sample...")
     
     # Convertir timestamp
     timestamp_col = [c for c in df.columns if 'time' in c.lower()][0] if any('time' in c.lower() for c in df.columns) else df.columns[0]
-    try:
-        df['event_ts'] = pd.to_datetime(df[timestamp_col], errors='coerce')
-    except:
-        df['event_ts'] = pd.NaT
-    
-    # Valider timestamp
-    valid = df[df['event_ts'].notna()].copy()
-    invalid = df[df['event_ts'].isna()].copy()
-    if len(invalid) > 0:
-        invalid['reject_reason'] = 'Timestamp invalide'
-        reject_reasons.append(invalid)
-    df = valid
-    
-    # Convertir colonnes numériques (sauf système)
-    for col in df.columns:
-        if col not in ['_source_file', '_ingest_ts', '_ingest_date', 'event_ts', timestamp_col]:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+    if ts_format is None:
+        ts_format = timestamp_format('time_series_60min_sample', timestamp_col)
+    df['event_ts'], ts_metrics = parse_timestamps(df[timestamp_col], ts_format)
+    
+    # Convertir colonnes numériques (sauf système), table reconstruite en une
+    # fois: ~300 colonnes réassignées une à une fragmenteraient le DataFrame
+    skip = ['_source_file', '_ingest_ts', '_ingest_date', 'event_ts', timestamp_col]
+    attrs = dict(df.attrs)
+    df = pd.DataFrame(
+        {col: df[col] if col in skip else coerce_numeric(df[col]) for col in df.columns},
+        index=df.index
+    )
+    df.attrs = attrs
+    
+    # Règles DQ (timestamp obligatoire, ...)
+    if rules is None:
+        rules = source_rules('time_series_60min_sample')
+    df, rejects = split_valid_rejects(df, rules)
     
     # Supprimer colonnes timestamp originales
     df = df.drop(columns=[timestamp_col], errors='ignore')
     
     # Ajouter colonnes métier
     df['country'] = 'FR'
+    add_dq_metrics(df, ts_metrics)
+    
+    print(f"    ✅ {len(df)} lignes valides | ❌ {len(rejects)} rejetées")
+    
+    return df, rejects
+
+
+def parse_series_column(column: str) -> Tuple[str, Optional[str], str, Optional[str]]:
+    """
+    Décompose un nom de colonne de série 60 min
     
-    reject_df = pd.concat(reject_reasons, ignore_index=True) if reject_reasons else pd.DataFrame()
+    Args:
+        column: Ex: DE_50hertz_load_actual_entsoe_transparency
     
-    print(f"    ✅ {len(df)} lignes valides | ❌ {len(reject_df)} rejetées")
+    Returns:
+        Tuple[pays, zone, métrique, fournisseur] - ex: ('DE', '50hertz', 'load_actual',
+        'entsoe_transparency'); zone / fournisseur None si absents
+    """
+    tokens = column.split('_')
+    start = next((i for i in range(1, len(tokens)) if tokens[i] in SERIES_VARIABLES), 1)
+    zone = '_'.join(tokens[1:start]) or None
+    metric = '_'.join(tokens[start:])
     
-    return df, reject_df
+    source = next((p for p in SERIES_PROVIDERS if metric.endswith('_' + p)), None)
+    if source:
+        metric = metric[:-len(source) - 1]
+    return tokens[0], zone, metric, source
 
 
-def clean_renewable_power_plants(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
+def melt_time_series_60min(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Table longue creuse des séries 60 min (une ligne par valeur non vide)
+    
+    Le pivot est fait en NumPy sur la matrice (séries × timestamps): les
+    cellules NaN sont écartées par masque, sans passer par DataFrame.melt.
+    Sortie triée par (country, metric, zone, source, event_ts); les
+    catégories sont en ordre lexicographique pour que les statistiques
+    min/max des row groups suivent le tri.
+    
+    Args:
+        df: Table large nettoyée (event_ts + colonnes <CC>_...)
+    
+    Returns:
+        pd.DataFrame: event_ts, country, zone, metric, source (category), value (float32)
+    """
+    columns = [c for c in df.columns if SERIES_COLUMN.match(c)]
+    parts = {c: parse_series_column(c) for c in columns}
+    columns.sort(key=lambda c: (parts[c][0], parts[c][2], parts[c][1] or '', parts[c][3] or ''))
+    
+    order = df['event_ts'].array.argsort(kind='stable')
+    values = df[columns].to_numpy(dtype=np.float32)[order].T
+    present = ~np.isnan(values)
+    series_idx, ts_idx = np.nonzero(present)
+    
+    long_df = pd.DataFrame({'event_ts': df['event_ts'].array.take(order[ts_idx])})
+    for position, name in enumerate(['country', 'zone', 'metric', 'source']):
+        labels = [parts[c][position] for c in columns]
+        categories = sorted({label for label in labels if label is not None})
+        codes = np.array([categories.index(label) if label is not None else -1 for label in labels], dtype=np.int32)
+        long_df[name] = pd.Categorical.from_codes(codes[series_idx], categories=categories)
+    long_df['value'] = values[present]
+    
+    return long_df
+
+
+def melt_eurostat_balance(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Table longue du bilan annuel Eurostat (une ligne par valeur non vide)
+    
+    Même pivot NumPy que melt_time_series_60min sur la matrice (lignes ×
+    années). Sortie triée par (nrg_bal, siec, unit, year), catégories en
+    ordre lexicographique. Une seule valeur par clé (nrg_bal, siec, unit,
+    year): la première ligne BRONZE l'emporte (lignes répétées aux valeurs
+    divergentes).
+    
+    Args:
+        df: Table large nettoyée (dimensions + colonnes 1990..2024)
+    
+    Returns:
+        pd.DataFrame: nrg_bal, siec, unit (category), year (int16), value (float64)
+    """
+    years = [c for c in df.columns if EUROSTAT_YEAR_COLUMN.match(c)]
+    dimensions = {name: pd.factorize(df[name], sort=True) for name in EUROSTAT_DIMENSIONS}
+    
+    order = np.lexsort([dimensions[name][0] for name in reversed(EUROSTAT_DIMENSIONS)])
+    values = df[years].to_numpy(dtype=np.float64, na_value=np.nan)[order]
+    present = ~np.isnan(values)
+    row_idx, year_idx = np.nonzero(present)
+    
+    long_df = pd.DataFrame({
+        name: pd.Categorical.from_codes(codes[order[row_idx]], categories=categories)
+        for name, (codes, categories) in dimensions.items()
+    })
+    long_df['year'] = np.array([int(c) for c in years], dtype=np.int16)[year_idx]
+    long_df['value'] = values[present]
+    
+    # Tri stable: à clé égale, les lignes restent dans l'ordre BRONZE
+    duplicated = long_df.duplicated(subset=list(EUROSTAT_DIMENSIONS) + ['year'], keep='first').to_numpy()
+    return long_df[~duplicated].reset_index(drop=True) if duplicated.any() else long_df
+
+
+def write_long_table(spec: dict, valid_df: pd.DataFrame, silver_path: str, append: bool = False) -> int:
+    """
+    Écrit la table longue d'une source (clé `long_table` de SILVER_SOURCES)
+    
+    Args:
+        spec: Entrée de SILVER_SOURCES
+        valid_df: Lignes valides (format large)
+        silver_path: Répertoire SILVER
+        append: Ajout d'un fichier part (incrémental) au lieu d'une reconstruction
+    
+    Returns:
+        int: Lignes écrites
+    """
+    long_df = globals()[spec['melt']](valid_df)
+    table_path = os.path.join(silver_path, spec['long_table'])
+    options = {**load_write_options(), 'row_group_size': LONG_TABLE_ROW_GROUP_SIZE}
+    
+    if append:
+        if len(long_df) == 0:
+            return 0
+        parquet_file = table_part_file(table_path, pd.Timestamp.now())
+    else:
+        clear_appended_parts(table_path)
+        os.makedirs(table_path, exist_ok=True)
+        parquet_file = os.path.join(table_path, "data.parquet")
+    
+    write_parquet_table(long_df, parquet_file, options)
+    update_profile(table_path, long_df, append)
+    print(f"    📂 {parquet_file} ({len(long_df)} lignes, format long)")
+    return len(long_df)
+
+
+def clean_renewable_power_plants(df: pd.DataFrame, rules: Optional[List[Rule]] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Nettoie renewable_power_plants_FR.csv
     Données statiques de centrales
+    
+    Args:
+        df: Données BRONZE
+        rules: Règles DQ (None = `dq_rules.renewable_power_plants_FR` de config.yaml)
     """
     
     df = df.copy()
-    reject_reasons = []
     
     print("  🔧 Nettoyage renewable_power_plants_FR...")
     
     # Convertir capacité électrique
     if 'electrical_capacity' in df.columns:
-        df['electrical_capacity'] = pd.to_numeric(df['electrical_capacity'], errors='coerce')
-        
-        # Capacité doit être positive
-        invalid = df[(df['electrical_capacity'] <= 0) & (df['electrical_capacity'].notna())].copy()
-        if len(invalid) > 0:
-            invalid['reject_reason'] = 'Capacité <= 0'
-            reject_reasons.append(invalid)
-        df = df[~((df['electrical_capacity'] <= 0) & (df['electrical_capacity'].notna()))]
+        df['electrical_capacity'] = coerce_numeric(df['electrical_capacity'])
     
-    # Déduplication
-    df = df.drop_duplicates(keep='first')
+    # Règles DQ (capacité strictement positive, ...)
+    if rules is None:
+        rules = source_rules('renewable_power_plants_FR')
+    df, rejects = split_valid_rejects(df, rules)
     
-    # Ajouter colonnes métier
+    # Ajouter colonnes métier (avant la dédup: même clé que la fusion des blocs)
     df['country'] = 'FR'
     
-    reject_df = pd.concat(reject_reasons, ignore_index=True) if reject_reasons else pd.DataFrame()
+    # Déduplication (hash de ligne 64 bits, _row_id stable; voir silver.dedup)
+    df, dedup_metrics = deduplicate(df, 'renewable_power_plants_FR')
+    add_dq_metrics(df, dedup_metrics)
     
-    print(f"    ✅ {len(df)} lignes valides | ❌ {len(reject_df)} rejetées")
+    print(f"    ✅ {len(df)} lignes valides | ❌ {len(rejects)} rejetées | 🔁 {dedup_metrics['duplicate_rows']} doublons")
     
-    return df, reject_df
+    return df, rejects
 
 
-def write_parquet_safe(df: pd.DataFrame, output_path: str, table_name: str) -> None:
+def collect_dq_metrics(metrics: dict, source: str, valid_df: pd.DataFrame, rejects: Rejects) -> List[dict]:
+    """
+    Lignes de métriques DQ d'une source (même forme que lib.dq_utils: job, metric, value, run_ts)
+    
+    Args:
+        metrics: Métriques du nettoyage (df.attrs)
+        source: Nom de la source
+        valid_df: Lignes valides
+        rejects: Rejets (compte exact, même échantillonnés)
+    
+    Returns:
+        List[dict]
+    """
+    run_ts = pd.Timestamp.now()
+    metrics = {'valid_rows': len(valid_df), 'rejected_rows': len(rejects), **metrics}
+    return [
+        {'job': 'silver', 'source': source, 'metric': name, 'value': int(value), 'run_ts': run_ts}
+        for name, value in metrics.items()
+    ]
+
+
+def optimize_for_write(df: pd.DataFrame, label: str) -> Tuple[pd.DataFrame, dict, Optional[dict]]:
+    """
+    Étape d'optimisation des dtypes avant écriture d'une sortie SILVER
+    
+    Args:
+        df: Table à écrire
+        label: Nom affiché dans le log
+    
+    Returns:
+        Tuple[table optimisée, métadonnées Parquet, rapport (None si désactivé)]
+    """
+    options = load_dtype_options()
+    if not options['enabled'] or len(df) == 0:
+        return df, {}, None
+    
+    optimized, constants, report = optimize_dtypes(df, options)
+    print(f"    🗜️  {label}: {format_bytes_saved(report)}"
+          f" | float32: {len(report['float32'])}, category: {len(report['categories'])}"
+          f", constantes: {len(report['constants'])}")
+    return optimized, constants_metadata(constants, list(df.columns)), report
+
+
+def write_parquet_safe(df: pd.DataFrame, output_path: str, table_name: str, metadata: Optional[dict] = None) -> None:
     """Écrit Parquet de manière robuste"""
     
     os.makedirs(output_path, exist_ok=True)
     
     parquet_file = os.path.join(output_path, f"{table_name}.parquet")
-    df.to_parquet(parquet_file, engine='pyarrow', index=False)
+    write_parquet_table(df, parquet_file, metadata=metadata)
     
     print(f"    📂 {parquet_file} ({len(df)} lignes)")
 
 
-def run_silver_cleaning() -> bool:
+# Sources SILVER: source BRONZE -> nettoyeur -> tables de sortie (SILVER, DQ)
+# dedup: clé de déduplication du nettoyeur, rejouée à la fusion des blocs
+# en mode découpé ("all" = toutes les colonnes, None = pas de dédup)
+# merge_key: clé de fusion du mode incrémental (1re colonne = timestamp de
+# plage); None = source de référence, reconstruite à chaque nouveau run BRONZE
+# long_table / melt: table longue dérivée (optionnelle) et fonction de pivot
+# (melt_time_series_60min, melt_eurostat_balance)
+SILVER_SOURCES = [
+    {'source': 'france_time_series', 'cleaner': 'clean_france_time_series',
+     'silver_table': 'france_time_series', 'reject_table': 'france_time_series_rejects',
+     'dedup': ['event_ts'], 'merge_key': ['event_ts']},
+    {'source': 'eurostat_electricity_france', 'cleaner': 'clean_eurostat_electricity_france',
+     'silver_table': 'eurostat_electricity_france', 'reject_table': 'eurostat_rejects',
+     'dedup': 'all', 'merge_key': None,
+     'long_table': 'eurostat_energy_balance', 'melt': 'melt_eurostat_balance'},
+    {'source': 'time_series_60min_sample', 'cleaner': 'clean_time_series_60min',
+     'silver_table': 'time_series_60min', 'reject_table': 'time_series_rejects',
+     'dedup': None, 'merge_key': ['event_ts'],
+     'long_table': 'time_series_60min_long', 'melt': 'melt_time_series_60min'},
+    {'source': 'renewable_power_plants_FR', 'cleaner': 'clean_renewable_power_plants',
+     'silver_table': 'renewable_plants', 'reject_table': 'renewable_rejects',
+     'dedup': 'all', 'merge_key': None},
+]
+
+
+def load_watermarks(silver_path: str) -> dict:
+    """
+    Charge les watermarks SILVER ({source: dernier état traité})
+    
+    Args:
+        silver_path: Répertoire SILVER
+    
+    Returns:
+        dict: Watermarks (vide si premier run ou fichier illisible)
+    """
+    watermark_file = os.path.join(silver_path, WATERMARK_FILE)
+    if not os.path.exists(watermark_file):
+        return {}
+    try:
+        with open(watermark_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        print(f"⚠️  Watermarks illisibles, reconstruction complète: {watermark_file}")
+        return {}
+
+
+def save_watermarks(silver_path: str, watermarks: dict) -> None:
+    """
+    Écrit les watermarks SILVER de manière atomique (fichier temporaire + rename)
+    
+    Args:
+        silver_path: Répertoire SILVER
+        watermarks: Watermarks à écrire
+    """
+    watermark_file = os.path.join(silver_path, WATERMARK_FILE)
+    tmp_file = watermark_file + ".tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(watermarks, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_file, watermark_file)
+
+
+def source_watermark(spec: dict, silver_path: str, bronze_run: Optional[str]) -> dict:
+    """
+    Watermark d'une source après écriture (statistiques des footers SILVER)
+    
+    Args:
+        spec: Entrée de SILVER_SOURCES
+        silver_path: Répertoire SILVER
+        bronze_run: Dernier run BRONZE traité
+    
+    Returns:
+        dict: {bronze_run, max_event_ts, rows, updated_at}
+    """
+    rows, max_event_ts = 0, None
+    for parquet_file in table_files(os.path.join(silver_path, spec['silver_table'])):
+        stats = read_parquet_stats(parquet_file)
+        rows += stats['rows']
+        maximum = (stats['column_stats'].get('event_ts') or {}).get('max')
+        if maximum is not None:
+            maximum = pd.Timestamp(maximum)
+            max_event_ts = maximum if max_event_ts is None else max(max_event_ts, maximum)
+    
+    return {
+        'bronze_run': bronze_run,
+        'max_event_ts': max_event_ts.isoformat() if max_event_ts is not None else None,
+        'rows': rows,
+        'updated_at': pd.Timestamp.now().isoformat(),
+    }
+
+
+def plan_incremental(
+    spec: dict,
+    bronze_path: str,
+    silver_path: str,
+    partition_column: str,
+    bronze_partitions,
+    watermark: Optional[dict],
+    enabled: bool = True,
+    reprocess: Optional[Tuple[pd.Timestamp, pd.Timestamp]] = None
+) -> dict:
+    """
+    Mode de traitement d'une source d'après son watermark
+    
+    Seuls les noms de fichiers BRONZE sont listés (token de run), aucune
+    donnée n'est lue.
+    
+    - full:   reconstruction depuis `bronze_partitions` (premier run,
+              incrémental désactivé, source sans clé de fusion modifiée)
+    - append: nettoyage des seuls runs BRONZE postérieurs au watermark
+              et/ou retraitement d'une fenêtre, fusionnés dans SILVER
+    - skip:   aucun nouveau run BRONZE, SILVER inchangée
+    
+    Args:
+        spec: Entrée de SILVER_SOURCES
+        bronze_path: Répertoire BRONZE
+        silver_path: Répertoire SILVER
+        partition_column: Colonne de partition BRONZE
+        bronze_partitions: Partitions BRONZE d'une reconstruction complète
+        watermark: Watermark de la source (None = jamais traitée)
+        enabled: Mode incrémental actif (`silver.incremental.enabled`)
+        reprocess: Fenêtre [début, fin[ d'event_ts à retraiter
+    
+    Returns:
+        dict: {mode, bronze_run, after_run, new_files, max_event_ts, reprocess}
+    """
+    bronze_table = os.path.join(bronze_path, spec['source'])
+    silver_table = os.path.join(silver_path, spec['silver_table'])
+    
+    def full_plan() -> dict:
+        files = select_partition_files(bronze_table, partition_column, bronze_partitions)
+        bronze_run = max((part_run_token(f) for f in files if part_run_token(f)), default=None)
+        return {'mode': 'full', 'bronze_run': bronze_run}
+    
+    if not enabled or not watermark or watermark.get('bronze_run') is None or not table_files(silver_table):
+        return full_plan()
+    
+    after_run = watermark['bronze_run']
+    new_files = select_partition_files(bronze_table, partition_column, "all", after_run=after_run)
+    
+    if spec['merge_key'] is None:
+        return full_plan() if new_files or reprocess else {'mode': 'skip', 'bronze_run': after_run}
+    if not new_files and not reprocess:
+        return {'mode': 'skip', 'bronze_run': after_run}
+    
+    return {
+        'mode': 'append',
+        'bronze_run': max([after_run] + [part_run_token(f) for f in new_files]),
+        'after_run': after_run,
+        'new_files': len(new_files),
+        'max_event_ts': watermark.get('max_event_ts'),
+        'reprocess': reprocess,
+    }
+
+
+def drop_existing_keys(
+    valid_df: pd.DataFrame,
+    table_path: str,
+    key: List[str],
+    max_event_ts: Optional[str] = None
+) -> Tuple[pd.DataFrame, int]:
+    """
+    Retire d'un incrément les clés déjà présentes dans SILVER (keep='first')
+    
+    Seule la plage [min, max] du timestamp de clé de l'incrément est relue
+    (filtre poussé sur les statistiques des row groups). Un incrément
+    entièrement postérieur au watermark ne relit rien.
+    
+    Args:
+        valid_df: Lignes valides de l'incrément
+        table_path: Table SILVER
+        key: Clé de fusion (1re colonne = timestamp)
+        max_event_ts: Plus grand timestamp déjà en SILVER (watermark)
+    
+    Returns:
+        Tuple[incrément sans doublons, nb_doublons]
+    """
+    if len(valid_df) == 0:
+        return valid_df, 0
+    
+    lower, upper = valid_df[key[0]].min(), valid_df[key[0]].max()
+    if max_event_ts is not None and lower > pd.Timestamp(max_event_ts):
+        return valid_df, 0
+    
+    existing = read_key_range(table_path, key[0], lower, upper, columns=key)
+    if len(existing) == 0:
+        return valid_df, 0
+    
+    seen = pd.MultiIndex.from_frame(valid_df[key]).isin(pd.MultiIndex.from_frame(existing[key]))
+    return valid_df[~seen], int(seen.sum())
+
+
+def in_window(df: pd.DataFrame, column: str, window: Tuple[pd.Timestamp, pd.Timestamp]) -> pd.Series:
+    """Masque des lignes dont `column` est dans [début, fin[ (False si colonne absente ou NaT)"""
+    if column not in df.columns:
+        return pd.Series(False, index=df.index)
+    start, end = window
+    return ((df[column] >= start) & (df[column] < end)).fillna(False).astype(bool)
+
+
+def clean_source_increment(
+    spec: dict,
+    bronze_path: str,
+    silver_path: str,
+    dq_path: str,
+    partition_column: str,
+    plan: dict
+) -> Tuple[str, int, int, List[dict]]:
+    """
+    Mode incrémental: nettoie les nouveaux runs BRONZE et les ajoute à SILVER
+    
+    La déduplication ne porte que sur la plage de clés recouverte par
+    l'incrément (les lignes déjà en SILVER l'emportent). Une fenêtre de
+    retraitement est d'abord supprimée de SILVER et des rejets, puis
+    reconstruite depuis tout l'historique BRONZE. Les lignes sont ajoutées
+    en fichiers part-<run>-*.parquet: un run interrompu est rejoué sans
+    doublon au run suivant (watermark inchangé, clés déjà présentes écartées).
+    Les rejets restent un journal: chaque run BRONZE y ajoute les siens.
+    
+    Returns:
+        Tuple[résultat, nb_valides, nb_rejetées, métriques_dq]
+    """
+    bronze_table = os.path.join(bronze_path, spec['source'])
+    silver_table = os.path.join(silver_path, spec['silver_table'])
+    reject_table = os.path.join(dq_path, spec['reject_table'])
+    cleaner = globals()[spec['cleaner']]
+    key = spec['merge_key']
+    window = plan.get('reprocess')
+    
+    valid_parts, reject_parts = [], []
+    metrics = {'bronze_new_files': plan['new_files']}
+    
+    if window:
+        removed = delete_key_range(silver_table, key[0], *window)
+        delete_key_range(reject_table, key[0], *window)
+        invalidate_profile(silver_table)
+        if spec.get('long_table'):
+            delete_key_range(os.path.join(silver_path, spec['long_table']), key[0], *window)
+            invalidate_profile(os.path.join(silver_path, spec['long_table']))
+        metrics['reprocess_removed_rows'] = removed
+        print(f"    ♻️  Fenêtre {window[0]} → {window[1]}: {removed:,} lignes SILVER retirées")
+        
+        df = read_partitioned_table(bronze_table, partition_column, "all")
+        valid_df, rejects = cleaner(df)
+        for name, value in pop_dq_metrics(valid_df).items():
+            metrics[f"reprocess_{name}"] = value
+        
+        valid_parts.append(valid_df[in_window(valid_df, key[0], window)].drop_duplicates(subset=key, keep='first'))
+        reject_parts.append(filter_rejects(rejects, lambda df: in_window(df, key[0], window)))
+    
+    if plan['new_files']:
+        print(f"    🆕 {plan['new_files']} fichier(s) BRONZE après le run {plan['after_run']}")
+        df = read_partitioned_table(bronze_table, partition_column, "all", after_run=plan['after_run'])
+        valid_df, rejects = cleaner(df)
+        metrics.update(pop_dq_metrics(valid_df))
+        
+        if window:
+            valid_df = valid_df[~in_window(valid_df, key[0], window)]
+            rejects = filter_rejects(rejects, lambda df: ~in_window(df, key[0], window))
+        
+        valid_df = valid_df.drop_duplicates(subset=key, keep='first')
+        valid_df, overlap = drop_existing_keys(valid_df, silver_table, key, plan.get('max_event_ts'))
+        metrics['incremental_overlap_duplicates'] = overlap
+        print(f"    🔁 {overlap:,} lignes déjà présentes en SILVER écartées")
+        
+        valid_parts.append(valid_df)
+        reject_parts.append(rejects)
+    
+    valid_df = pd.concat(valid_parts, ignore_index=True)
+    rejects = concat_rejects(reject_parts)
+    
+    return write_source_outputs(spec, valid_df, rejects, metrics, silver_path, dq_path, append=True)
+
+
+def clear_appended_parts(table_path: str) -> None:
+    """Supprime les fichiers part-*.parquet ajoutés (et leurs sidecars) avant une reconstruction"""
+    for parquet_file in table_files(table_path):
+        if part_run_token(parquet_file) is None:
+            continue
+        os.remove(parquet_file)
+        if os.path.exists(stats_sidecar_path(parquet_file)):
+            os.remove(stats_sidecar_path(parquet_file))
+
+
+def write_source_outputs(
+    spec: dict,
+    valid_df: pd.DataFrame,
+    rejects: Rejects,
+    source_metrics: dict,
+    silver_path: str,
+    dq_path: str,
+    append: bool = False
+) -> Tuple[str, int, int, List[dict]]:
+    """
+    Écrit les sorties d'une source nettoyée (SILVER + rejets)
+    
+    Reconstruction: data.parquet remplacé, fichiers ajoutés supprimés.
+    Ajout (incrémental): un nouveau fichier part-<run>-*.parquet par table.
+    Rejets: lignes complètes (toutes en mode full, échantillon en mode
+    summary) dans <reject_table>, compteurs exacts dans <reject_table>_summary.
+    Le profil de la table SILVER (_profile.json) est reconstruit ou fusionné.
+    
+    Returns:
+        Tuple[résultat, nb_valides, nb_rejetées, métriques_dq]
+    """
+    silver_table = os.path.join(silver_path, spec['silver_table'])
+    reject_table = os.path.join(dq_path, spec['reject_table'])
+    summary_table = f"{reject_table}_summary"
+    run_ts = pd.Timestamp.now()
+    
+    # Optimisation des dtypes (la table longue a déjà un schéma compact)
+    valid_out, valid_metadata, report = optimize_for_write(valid_df, spec['silver_table'])
+    reject_sample = rejects.sample.drop(columns=[SAMPLE_KEY_COLUMN], errors='ignore')
+    reject_out, reject_metadata, _ = optimize_for_write(reject_sample, spec['reject_table'])
+    reject_summary = summarize_rejects(rejects, run_ts)
+    if report:
+        source_metrics = {**source_metrics, 'dtype_bytes_before': report['bytes_before'],
+                          'dtype_bytes_after': report['bytes_after']}
+    if rejects.sample_size is not None:
+        source_metrics = {**source_metrics, 'rejects_sampled': len(reject_sample)}
+    if len(rejects) > 0:
+        print(f"    🧾 Rejets: {len(rejects):,} comptés, {len(reject_sample):,} lignes conservées → {summary_table}")
+    
+    if append:
+        outputs = (
+            (valid_out, valid_metadata, silver_table),
+            (reject_out, reject_metadata, reject_table),
+            (reject_summary, None, summary_table),
+        )
+        for df, metadata, table_path in outputs:
+            if len(df) > 0:
+                parquet_file = table_part_file(table_path, run_ts)
+                write_parquet_table(df, parquet_file, metadata=metadata)
+                print(f"    📂 {parquet_file} (+{len(df)} lignes)")
+    else:
+        clear_appended_parts(silver_table)
+        write_parquet_safe(valid_out, silver_table, 'data', valid_metadata)
+        if len(rejects) > 0:
+            clear_appended_parts(reject_table)
+            write_parquet_safe(reject_out, reject_table, 'data', reject_metadata)
+            clear_appended_parts(summary_table)
+            write_parquet_safe(reject_summary, summary_table, 'data')
+    
+    profile = update_profile(silver_table, valid_df, append)
+    if profile is not None:
+        print(f"    🧭 Profil: {profile['rows']:,} lignes, {len(profile['columns'])} colonnes")
+    
+    if spec.get('long_table'):
+        source_metrics = {**source_metrics, 'long_rows': write_long_table(spec, valid_df, silver_path, append)}
+    
+    print()
+    metrics = collect_dq_metrics(source_metrics, spec['source'], valid_df, rejects)
+    return 'SUCCESS', len(valid_df), len(rejects), metrics
+
+
+def clean_source(
+    spec: dict,
+    bronze_path: str,
+    silver_path: str,
+    dq_path: str,
+    partition_column: str,
+    bronze_partitions,
+    plan: Optional[dict] = None
+) -> Tuple[str, int, int, List[dict]]:
+    """
+    Nettoie une source: lecture BRONZE, nettoyage, écriture SILVER + rejets
+    
+    Les erreurs sont isolées: une source en échec n'interrompt pas les autres.
+    
+    Args:
+        spec: Entrée de SILVER_SOURCES
+        bronze_path: Répertoire BRONZE
+        silver_path: Répertoire SILVER
+        dq_path: Répertoire DQ
+        partition_column: Colonne de partition BRONZE
+        bronze_partitions: Partitions BRONZE à lire
+        plan: Plan incrémental (voir plan_incremental, None = reconstruction)
+    
+    Returns:
+        Tuple[résultat, nb_valides, nb_rejetées, métriques_dq]
+    """
+    source = spec['source']
+    print(f"🔄 {source}")
+    
+    try:
+        if plan and plan['mode'] == 'append':
+            return clean_source_increment(spec, bronze_path, silver_path, dq_path, partition_column, plan)
+        
+        df = read_partitioned_table(
+            os.path.join(bronze_path, source),
+            partition_column=partition_column,
+            partitions=bronze_partitions
+        )
+        
+        cleaner = globals()[spec['cleaner']]
+        valid_df, rejects = cleaner(df)
+        source_metrics = pop_dq_metrics(valid_df)
+        
+        return write_source_outputs(spec, valid_df, rejects, source_metrics, silver_path, dq_path)
+    
+    except Exception as e:
+        print(f"    ❌ ERREUR: {str(e)}\n")
+        return f'ERROR: {str(e)}', 0, 0, []
+
+
+def clean_source_worker(*args) -> Tuple[str, int, int, List[dict], str]:
+    """
+    Variante de `clean_source` pour le pool de process
+    
+    Capture la sortie du worker pour que le parent l'affiche d'un bloc
+    (pas de logs entrelacés entre sources).
+    
+    Returns:
+        Tuple[résultat, nb_valides, nb_rejetées, métriques_dq, log]
+    """
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+        outcome = clean_source(*args)
+    return (*outcome, buffer.getvalue())
+
+
+def plan_source_chunks(
+    spec: dict,
+    bronze_path: str,
+    partition_column: str,
+    bronze_partitions,
+    chunking: dict
+) -> list:
+    """
+    Blocs de row groups d'une source en mode découpé (liste vide = source entière)
+    
+    Args:
+        spec: Entrée de SILVER_SOURCES
+        bronze_path: Répertoire BRONZE
+        partition_column: Colonne de partition BRONZE
+        bronze_partitions: Partitions BRONZE à lire
+        chunking: Section `silver.chunking` de la config
+    
+    Returns:
+        list: Blocs [(fichier, [row groups])]
+    """
+    if not chunking.get('enabled', False) or spec['source'] not in chunking.get('sources', []):
+        return []
+    try:
+        return plan_row_group_chunks(
+            os.path.join(bronze_path, spec['source']),
+            partition_column=partition_column,
+            partitions=bronze_partitions,
+            chunk_rows=int(chunking.get('chunk_rows', 1_000_000))
+        )
+    except (OSError, ValueError):
+        # Table absente / illisible: le chemin normal remontera l'erreur
+        return []
+
+
+def clean_chunk(spec: dict, chunk: list, bronze_path: str, partition_column: str) -> Tuple[pd.DataFrame, pd.DataFrame, dict]:
+    """
+    Nettoie un bloc de row groups d'une source (worker du mode découpé)
+    
+    Args:
+        spec: Entrée de SILVER_SOURCES
+        chunk: [(fichier, [row groups])]
+        bronze_path: Répertoire BRONZE
+        partition_column: Colonne de partition BRONZE
+    
+    Returns:
+        Tuple[valid_df, rejects, métriques_dq]
+    """
+    df = read_row_group_chunk(os.path.join(bronze_path, spec['source']), chunk, partition_column)
+    
+    cleaner = globals()[spec['cleaner']]
+    with contextlib.redirect_stdout(io.StringIO()):
+        valid_df, rejects = cleaner(df)
+    return valid_df, rejects, pop_dq_metrics(valid_df)
+
+
+def merge_chunks(spec: dict, parts: List[tuple]) -> Tuple[pd.DataFrame, pd.DataFrame, dict]:
+    """
+    Fusionne les blocs nettoyés d'une source
+    
+    Les blocs sont concaténés dans l'ordre de lecture BRONZE puis la
+    déduplication du nettoyeur est rejouée sur l'ensemble: keep='first'
+    reste vrai à travers les frontières de blocs (chaque bloc a déjà gardé
+    sa première occurrence, la fusion garde celle du bloc le plus tôt).
+    Les sources dédupliquées sur toutes les colonnes ("all") repassent par
+    deduplicate (même clé que sans découpage: colonnes techniques et
+    _row_id exclues), et duplicate_rows cumule doublons intra et inter-blocs.
+    
+    Args:
+        spec: Entrée de SILVER_SOURCES
+        parts: [(valid_df, rejects, métriques)] dans l'ordre des blocs
+    
+    Returns:
+        Tuple[valid_df, rejects, métriques_dq]
+    """
+    valid_df = pd.concat([valid for valid, _, _ in parts], ignore_index=True)
+    rejects = concat_rejects([part_rejects for _, part_rejects, _ in parts])
+    
+    rows_before = len(valid_df)
+    dedup_metrics = {}
+    if spec['dedup'] == 'all':
+        # _row_id recalculé sur la même clé (identique pour les lignes conservées)
+        valid_df = valid_df.drop(columns=[ROW_ID_COLUMN], errors='ignore')
+        valid_df, dedup_metrics = deduplicate(valid_df, spec['source'])
+    elif spec['dedup']:
+        valid_df = valid_df.drop_duplicates(subset=spec['dedup'], keep='first')
+    
+    metrics = {'chunks': len(parts), 'cross_chunk_duplicates': rows_before - len(valid_df)}
+    for chunk_metrics in [chunk_metrics for _, _, chunk_metrics in parts] + [dedup_metrics]:
+        for name, value in chunk_metrics.items():
+            metrics[name] = metrics.get(name, 0) + value
+    
+    print(f"    🧩 {len(parts)} blocs fusionnés ({metrics['cross_chunk_duplicates']:,} doublons inter-blocs)")
+    print(f"    ✅ {len(valid_df)} lignes valides | ❌ {len(rejects)} rejetées")
+    
+    return valid_df, rejects, metrics
+
+
+def run_silver_cleaning(
+    full: bool = False,
+    reprocess: Optional[Tuple[pd.Timestamp, pd.Timestamp]] = None
+) -> bool:
     """
     Pipeline complet SILVER
+    
+    Les sources ne partagent aucune donnée: avec `silver.workers` > 1 elles
+    sont nettoyées en parallèle (une par process), la durée totale tend
+    vers celle de la source la plus lente.
+    
+    En mode découpé (`silver.chunking`), une grosse source est répartie en
+    blocs de row groups nettoyés par le même pool, puis fusionnée.
+    
+    En mode incrémental (`silver.incremental`), seuls les runs BRONZE
+    postérieurs au watermark de chaque source sont nettoyés: le coût d'un
+    run quotidien suit le volume des nouvelles données, pas l'historique.
+    
+    Args:
+        full: Ignorer les watermarks (reconstruction complète)
+        reprocess: Fenêtre [début, fin[ d'event_ts à reconstruire
     """
     
     print(f"\n{'='*80}")
     print(f"⚪ SILVER LAYER - NETTOYAGE & DATA QUALITY")
     print(f"{'='*80}\n")
     
+    run_started = pd.Timestamp.now()
+    
     try:
         # Charger config
         config = load_config("conf/config.yaml")
@@ -236,7 +992,11 @@ def run_silver_cleaning() -> bool:
         silver_path = config['paths']['silver']
         dq_path = config['paths']['dq']
         
-        print(f"📂 Bronze: {bronze_path}")
+        # Partitions BRONZE à lire (latest_run = dernier ingest de chaque source)
+        partition_column = config.get('partitioning', {}).get('bronze', {}).get('column', '_ingest_date')
+        bronze_partitions = config.get('silver', {}).get('bronze_partitions', 'latest_run')
+        
+        print(f"📂 Bronze: {bronze_path} (partitions: {bronze_partitions})")
         print(f"📂 Silver: {silver_path}")
         print(f"📂 DQ:     {dq_path}\n")
         
@@ -244,89 +1004,138 @@ def run_silver_cleaning() -> bool:
         Path(silver_path).mkdir(parents=True, exist_ok=True)
         Path(dq_path).mkdir(parents=True, exist_ok=True)
         
-        results = {}
-        total_valid = 0
-        total_reject = 0
+        args = (bronze_path, silver_path, dq_path, partition_column, bronze_partitions)
+        chunking = config.get('silver', {}).get('chunking', {}) or {}
+        incremental = config.get('silver', {}).get('incremental', {}) or {}
         
-        # ===== FRANCE TIME SERIES =====
-        print(f"🔄 france_time_series")
-        try:
-            bronze_file = os.path.join(bronze_path, 'france_time_series', 'data.parquet')
-            df = pd.read_parquet(bronze_file)
-            
-            valid_df, reject_df = clean_france_time_series(df)
-            
-            write_parquet_safe(valid_df, os.path.join(silver_path, 'france_time_series'), 'data')
-            if len(reject_df) > 0:
-                write_parquet_safe(reject_df, os.path.join(dq_path, 'france_time_series_rejects'), 'data')
-            
-            results['france_time_series'] = 'SUCCESS'
-            total_valid += len(valid_df)
-            total_reject += len(reject_df)
-            
-        except Exception as e:
-            print(f"    ❌ ERREUR: {str(e)}\n")
-            results['france_time_series'] = f'ERROR: {str(e)}'
+        # Plan incrémental par source (noms de fichiers BRONZE uniquement)
+        watermarks = load_watermarks(silver_path)
+        plans = {}
+        for spec in SILVER_SOURCES:
+            plan = plan_incremental(
+                spec, bronze_path, silver_path, partition_column, bronze_partitions,
+                None if full else watermarks.get(spec['source']),
+                enabled=incremental.get('enabled', False),
+                reprocess=reprocess
+            )
+            plans[spec['source']] = plan
+            if plan['mode'] == 'append':
+                print(f"🆕 {spec['source']}: incrémental ({plan['new_files']} fichier(s) BRONZE"
+                      f"{', fenêtre retraitée' if plan['reprocess'] else ''})")
+            elif plan['mode'] == 'skip':
+                print(f"⏭️  {spec['source']}: aucun nouveau run BRONZE (SILVER à jour)")
         
-        # ===== EUROSTAT =====
-        print(f"\n🔄 eurostat_electricity_france")
-        try:
-            bronze_file = os.path.join(bronze_path, 'eurostat_electricity_france', 'data.parquet')
-            df = pd.read_parquet(bronze_file)
-            
-            valid_df, reject_df = clean_eurostat_electricity_france(df)
-            
-            write_parquet_safe(valid_df, os.path.join(silver_path, 'eurostat_electricity_france'), 'data')
-            if len(reject_df) > 0:
-                write_parquet_safe(reject_df, os.path.join(dq_path, 'eurostat_rejects'), 'data')
-            
-            results['eurostat_electricity_france'] = 'SUCCESS'
-            total_valid += len(valid_df)
-            total_reject += len(reject_df)
-            
-        except Exception as e:
-            print(f"    ❌ ERREUR: {str(e)}\n")
-            results['eurostat_electricity_france'] = f'ERROR: {str(e)}'
+        # Tâches: une par source, ou une par bloc pour les sources découpées
+        # (reconstructions uniquement: un incrément est petit par construction)
+        chunk_plans = {}
+        for spec in SILVER_SOURCES:
+            if plans[spec['source']]['mode'] != 'full':
+                continue
+            chunks = plan_source_chunks(spec, bronze_path, partition_column, bronze_partitions, chunking)
+            if chunks:
+                chunk_plans[spec['source']] = chunks
+                print(f"🧩 {spec['source']}: {len(chunks)} blocs de row groups")
         
-        # ===== TIME SERIES 60MIN =====
-        print(f"\n🔄 time_series_60min_sample")
-        try:
-            bronze_file = os.path.join(bronze_path, 'time_series_60min_sample', 'data.parquet')
-            df = pd.read_parquet(bronze_file)
-            
-            valid_df, reject_df = clean_time_series_60min(df)
-            
-            write_parquet_safe(valid_df, os.path.join(silver_path, 'time_series_60min'), 'data')
-            if len(reject_df) > 0:
-                write_parquet_safe(reject_df, os.path.join(dq_path, 'time_series_rejects'), 'data')
-            
-            results['time_series_60min_sample'] = 'SUCCESS'
-            total_valid += len(valid_df)
-            total_reject += len(reject_df)
-            
-        except Exception as e:
-            print(f"    ❌ ERREUR: {str(e)}\n")
-            results['time_series_60min_sample'] = f'ERROR: {str(e)}'
+        tasks = {}
+        for spec in SILVER_SOURCES:
+            plan = plans[spec['source']]
+            if plan['mode'] == 'skip':
+                continue
+            if spec['source'] in chunk_plans:
+                for i, chunk in enumerate(chunk_plans[spec['source']]):
+                    tasks[(spec['source'], i)] = (clean_chunk, (spec, chunk, bronze_path, partition_column))
+            else:
+                tasks[(spec['source'], None)] = (clean_source, (spec, *args, plan))
+        
+        # Pas plus de workers que de tâches ni de CPU (1 CPU = séquentiel)
+        workers = min(int(config.get('silver', {}).get('workers', 1)), len(tasks), os.cpu_count() or 1)
+        print()
+        task_results = {}
         
-        # ===== RENEWABLE PLANTS =====
-        print(f"\n🔄 renewable_power_plants_FR")
-        try:
-            bronze_file = os.path.join(bronze_path, 'renewable_power_plants_FR', 'data.parquet')
-            df = pd.read_parquet(bronze_file)
+        if workers > 1:
+            print(f"⚡ Nettoyage parallèle: {workers} workers\n")
             
-            valid_df, reject_df = clean_renewable_power_plants(df)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(clean_source_worker if func is clean_source else func, *func_args): key
+                    for key, (func, func_args) in tasks.items()
+                }
+                for future in as_completed(futures):
+                    key = futures[future]
+                    try:
+                        outcome = future.result()
+                        if key[1] is None:
+                            *outcome, log = outcome
+                            print(log, end='')
+                        task_results[key] = tuple(outcome)
+                    except Exception as e:
+                        # Crash du worker lui-même (ex: process tué) ou bloc en erreur
+                        print(f"❌ {key[0]}: worker en échec - {str(e)}\n")
+                        task_results[key] = e
+        else:
+            for key, (func, func_args) in tasks.items():
+                try:
+                    task_results[key] = func(*func_args)
+                except Exception as e:
+                    task_results[key] = e
+        
+        # Sources découpées: fusion des blocs + dédup globale puis écriture
+        outcomes = {}
+        for spec in SILVER_SOURCES:
+            source = spec['source']
+            if plans[source]['mode'] == 'skip':
+                outcomes[source] = ('SKIPPED', 0, 0, [])
+                continue
+            if source not in chunk_plans:
+                outcomes[source] = task_results[(source, None)]
+                continue
             
-            write_parquet_safe(valid_df, os.path.join(silver_path, 'renewable_plants'), 'data')
-            if len(reject_df) > 0:
-                write_parquet_safe(reject_df, os.path.join(dq_path, 'renewable_rejects'), 'data')
+            print(f"🔄 {source}")
+            parts = [task_results[(source, i)] for i in range(len(chunk_plans[source]))]
+            errors = [part for part in parts if isinstance(part, Exception)]
+            if errors:
+                print(f"    ❌ ERREUR: {str(errors[0])}\n")
+                outcomes[source] = (f'ERROR: {str(errors[0])}', 0, 0, [])
+                continue
             
-            results['renewable_power_plants_FR'] = 'SUCCESS'
-            total_valid += len(valid_df)
-            total_reject += len(reject_df)
+            try:
+                valid_df, rejects, source_metrics = merge_chunks(spec, parts)
+                outcomes[source] = write_source_outputs(spec, valid_df, rejects, source_metrics, silver_path, dq_path)
+            except Exception as e:
+                print(f"    ❌ ERREUR: {str(e)}\n")
+                outcomes[source] = (f'ERROR: {str(e)}', 0, 0, [])
+        
+        # Consolider (ordre de SILVER_SOURCES)
+        results = {}
+        total_valid = 0
+        total_reject = 0
+        dq_metrics = []
+        
+        for spec in SILVER_SOURCES:
+            result, n_valid, n_reject, metrics = outcomes[spec['source']]
+            results[spec['source']] = result
+            total_valid += n_valid
+            total_reject += n_reject
+            dq_metrics += [{**metric, 'mode': plans[spec['source']]['mode']} for metric in metrics]
             
-        except Exception as e:
-            print(f"    ❌ ERREUR: {str(e)}\n")
-            results['renewable_power_plants_FR'] = f'ERROR: {str(e)}'
+            # Watermark avancé uniquement si la source a été écrite
+            if result == 'SUCCESS':
+                watermarks[spec['source']] = source_watermark(spec, silver_path, plans[spec['source']]['bronze_run'])
+        
+        save_watermarks(silver_path, watermarks)
+        
+        # ===== MÉTRIQUES DQ =====
+        # Historique: une part par run (run_id), les métriques des sources
+        # ignorées ou des runs précédents ne sont jamais écrasées
+        if dq_metrics:
+            metrics_df = pd.DataFrame(dq_metrics)
+            metrics_df.insert(0, 'run_id', run_token(run_started))
+            parquet_file = table_part_file(os.path.join(dq_path, 'silver_metrics'), run_started)
+            write_parquet_table(metrics_df, parquet_file)
+            print(f"    📂 {parquet_file} (+{len(metrics_df)} lignes)")
+            fallback = sum(m['value'] for m in dq_metrics if m['metric'] == 'ts_fallback_parsed')
+            if fallback:
+                print(f"    ⚠️  {fallback:,} timestamps hors format parsés en mode tolérant")
         
         # ===== RÉSUMÉ =====
         print(f"\n{'='*80}")
@@ -337,22 +1146,25 @@ def run_silver_cleaning() -> bool:
         print(f"   • Lignes valides:  {total_valid:,}")
         print(f"   • Lignes rejetées: {total_reject:,}")
         print(f"   • Taux d'acceptation: {(total_valid/(total_valid+total_reject)*100):.1f}%" if total_valid + total_reject > 0 else "   • Aucune donnée")
+        
+        failed = {source: result for source, result in results.items() if result not in ('SUCCESS', 'SKIPPED')}
+        for source, result in failed.items():
+            print(f"   ❌ {source}: {result}")
+        
         print(f"\n📁 Structure SILVER:")
         print(f"   {silver_path}/")
-        print(f"   ├── france_time_series/")
-        print(f"   ├── eurostat_electricity_france/")
-        print(f"   ├── time_series_60min/")
-        print(f"   └── renewable_plants/")
+        silver_tables = [t for spec in SILVER_SOURCES for t in (spec['silver_table'], spec.get('long_table')) if t]
+        for i, table in enumerate(silver_tables):
+            print(f"   {'└──' if i == len(silver_tables) - 1 else '├──'} {table}/")
         print(f"\n📁 Rejets (DQ):")
         print(f"   {dq_path}/")
-        print(f"   ├── france_time_series_rejects/")
-        print(f"   ├── eurostat_rejects/")
-        print(f"   ├── time_series_rejects/")
-        print(f"   └── renewable_rejects/")
+        for spec in SILVER_SOURCES:
+            print(f"   ├── {spec['reject_table']}/")
+        print(f"   └── silver_metrics/")
         print(f"\n✅ Next step: 03_gold_dwh.py (Star Schema)\n")
         
         return True
-        
+    
     except Exception as e:
         print(f"\n❌ ERREUR FATALE: {str(e)}\n")
         import traceback
@@ -360,10 +1172,29 @@ def run_silver_cleaning() -> bool:
         return False
 
 
+def parse_window_bound(value: str) -> pd.Timestamp:
+    """Borne de fenêtre en ligne de commande (ISO-8601, UTC si sans fuseau)"""
+    ts = pd.Timestamp(value)
+    return ts.tz_localize('UTC') if ts.tz is None else ts.tz_convert('UTC')
+
+
 if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Nettoyage SILVER (BRONZE → SILVER)")
+    parser.add_argument("--full", action="store_true", help="Ignorer les watermarks et tout reconstruire")
+    parser.add_argument("--reprocess-from", help="Début de la fenêtre d'event_ts à retraiter (incluse)")
+    parser.add_argument("--reprocess-to", help="Fin de la fenêtre d'event_ts à retraiter (exclue, défaut: maintenant)")
+    args = parser.parse_args()
+    
+    reprocess = None
+    if args.reprocess_from:
+        reprocess = (
+            parse_window_bound(args.reprocess_from),
+            parse_window_bound(args.reprocess_to) if args.reprocess_to else pd.Timestamp.now(tz='UTC')
+        )
     
     try:
-        success = run_silver_cleaning()
+        success = run_silver_cleaning(full=args.full, reprocess=reprocess)
         
         if success:
             print("🎉 Pipeline SILVER terminé avec succès!\n")
@@ -371,7 +1202,7 @@ if __name__ == "__main__":
         else:
             print("⚠️  Pipeline SILVER terminé avec des avertissements\n")
             sys.exit(1)
-            
+    
     except Exception as e:
         print(f"❌ Erreur fatale: {str(e)}\n")
         sys.exit(1)
@@ -4,12 +4,49 @@ import os
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import yaml
 import pandas as pd
 import numpy as np
 
+# Ajouter le chemin src pour les imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from lib.dtype_utils import coerce_numeric, restore_plain_dtypes
+from lib.parquet_utils import read_table, write_parquet_table
+from lib.profile_utils import profile_columns, profile_time_range, read_profile, update_profile
+
+
+# Tables SILVER des faits datés (date_id): leur couverture (profil) élargit la plage de dim_date
+DATED_SILVER_TABLES = ("france_time_series",)
+
+# Produits Eurostat (SIEC) → dim_energy_type, par préfixe de code (défaut: 5 = Other)
+SIEC_ENERGY_TYPES = {
+    'RA4': 1,     # Solaire (thermique RA410, photovoltaïque RA420)
+    'RA3': 2,     # Éolien
+    'E7000': 6,   # Électricité (tous modes de production)
+    'RA1': 4,     # Hydraulique
+}
+
+# Colonnes SILVER lues par chaque builder (projection Parquet, voir GoldContext)
+LOCATION_COLUMNS = ['nuts_1_region', 'nuts_2_region', 'region', 'region_code']
+PLANT_COLUMNS = [
+    'site_name', 'technology', 'energy_source_level_1', 'electrical_capacity',
+    'lat', 'lon', 'commissioning_date', 'region'
+]
+CAPACITY_COLUMNS = ['electrical_capacity', 'technology', 'region', 'commissioning_date']
+PLANT_PRODUCTION_COLUMNS = ['energy_source_level_1', 'energy_type', 'electrical_capacity']
+TS_TIME_COLUMNS = ['DateTime', 'datetime', 'date', 'event_ts']
+BALANCE_COLUMNS = ['siec', 'nrg_bal', 'unit', 'year', 'value']
+
+# Métriques horaires de fact_energy_production: colonne SILVER → energy_type_id
+# (défaut si `gold.production_metrics` est absent de config.yaml)
+DEFAULT_PRODUCTION_METRICS = [('load_mw', 3), ('solar_mw', 1), ('wind_mw', 2)]
+
+# Statistiques journalières: value_mw, value_min_mw, value_max_mw, value_avg_mw, nb_records
+PRODUCTION_STATS = ['sum', 'min', 'max', 'mean', 'count']
+
 
 def load_config(config_path: str = "conf/config.yaml") -> dict:
     """Charge la configuration"""
@@ -18,6 +55,111 @@ def load_config(config_path: str = "conf/config.yaml") -> dict:
     return config
 
 
+def read_silver_table(table_path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Lit une table SILVER (data.parquet + parts, colonnes constantes recréées)
+    
+    Les dtypes compacts de SILVER (category, float32) sont ramenés aux
+    dtypes de travail de GOLD, qui ajoute des libellés et agrège en float64
+    (types Arrow string / double / int64 si `dtype_backend: pyarrow`).
+    
+    Args:
+        table_path: Répertoire de la table
+        columns: Colonnes à lire (None = toutes, colonnes absentes ignorées)
+    """
+    return restore_plain_dtypes(read_table(str(table_path), columns=columns))
+
+
+class GoldContext:
+    """
+    Tables SILVER partagées par les builders GOLD d'un même run
+    
+    Chaque table est lue au plus une fois, à la première demande, et
+    seulement sur les colonnes demandées: une demande ultérieure ne lit que
+    les colonnes encore jamais demandées (les colonnes absentes de la table
+    sont mémorisées, pas relues). Les profils _profile.json sont aussi lus
+    une fois.
+    
+    `table()` renvoie une sélection de colonnes du cache: avec
+    Copy-on-Write (défaut de pandas >= 3), une vue sans copie que le
+    builder peut enrichir (nouvelles colonnes, fillna) sans modifier le
+    cache; avec pandas < 3, une copie des seules colonnes demandées.
+    """
+    
+    def __init__(self, silver_path: str):
+        self.silver_path = Path(silver_path)
+        self._tables: Dict[str, pd.DataFrame] = {}
+        self._requested: Dict[str, set] = {}
+        self._profiles: Dict[str, Optional[dict]] = {}
+    
+    def path(self, name: str) -> Path:
+        """Répertoire d'une table SILVER"""
+        return self.silver_path / name
+    
+    def profile(self, name: str) -> Optional[dict]:
+        """Profil d'une table SILVER (None si absent)"""
+        if name not in self._profiles:
+            self._profiles[name] = read_profile(self.path(name))
+        return self._profiles[name]
+    
+    def table(self, name: str, columns: Iterable[str]) -> pd.DataFrame:
+        """
+        Colonnes d'une table SILVER (lecture paresseuse, une fois par colonne)
+        
+        Args:
+            name: Table SILVER (ex: renewable_plants)
+            columns: Colonnes voulues (les colonnes absentes de la table sont ignorées)
+        
+        Returns:
+            pd.DataFrame: Colonnes présentes, dans l'ordre demandé
+        
+        Raises:
+            FileNotFoundError: Si la table n'a aucun fichier
+        """
+        columns = list(dict.fromkeys(columns))
+        requested = self._requested.setdefault(name, set())
+        missing = [c for c in columns if c not in requested]
+        
+        if name not in self._tables or missing:
+            df = read_silver_table(self.path(name), columns=missing if name in self._tables else columns)
+            if name in self._tables:
+                cached = self._tables[name]
+                df = pd.concat([cached, df[[c for c in df.columns if c not in cached.columns]]], axis=1)
+            self._tables[name] = df
+            requested.update(columns)
+        
+        cached = self._tables[name]
+        return cached[[c for c in columns if c in cached.columns]]
+    
+    def clear(self) -> None:
+        """Libère les tables en cache"""
+        self._tables.clear()
+        self._requested.clear()
+        self._profiles.clear()
+
+
+def dim_date_range(silver_path: str, start_date: str, end_date: str) -> Tuple[str, str]:
+    """
+    Plage de dim_date: plage par défaut élargie à la couverture des tables
+    SILVER datées (profils _profile.json, aucune donnée relue)
+    
+    Args:
+        silver_path: Répertoire SILVER
+        start_date: Début par défaut (YYYY-MM-DD)
+        end_date: Fin par défaut (YYYY-MM-DD)
+    
+    Returns:
+        Tuple[début, fin] (YYYY-MM-DD)
+    """
+    start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+    for table in DATED_SILVER_TABLES:
+        coverage = profile_time_range(read_profile(os.path.join(silver_path, table)))
+        if coverage and coverage['start'] is not None:
+            start = min(start, coverage['start'].tz_localize(None).normalize())
+            end = max(end, coverage['end'].tz_localize(None).normalize())
+    return start.strftime('%Y-%m-%d'), end.strftime('%Y-%m-%d')
+
+
 def create_dim_date(start_date: str = "2015-01-01", end_date: str = "2026-12-31") -> pd.DataFrame:
     """
     Crée la dimension temporelle
@@ -25,7 +167,7 @@ def create_dim_date(start_date: str = "2015-01-01", end_date: str = "2026-12-31"
     Args:
         start_date: Date de début (YYYY-MM-DD)
         end_date: Date de fin (YYYY-MM-DD)
-        
+    
     Returns:
         DataFrame dimension avec colonnes:
         - date_id (YYYYMMDD format)
@@ -90,23 +232,24 @@ def create_dim_energy_type() -> pd.DataFrame:
         - energy_type_name
         - description
         - unit
-        - category (renewable/non-renewable/load)
+        - category (renewable/non-renewable/load/electricity)
     """
     
     print("  🔧 Création dim_energy_type...")
     
     df = pd.DataFrame({
-        'energy_type_id': [1, 2, 3, 4, 5],
-        'energy_type_name': ['Solar', 'Wind Onshore', 'Load (Consumption)', 'Hydro', 'Other'],
+        'energy_type_id': [1, 2, 3, 4, 5, 6],
+        'energy_type_name': ['Solar', 'Wind Onshore', 'Load (Consumption)', 'Hydro', 'Other', 'Electricity'],
         'description': [
             'Solar photovoltaic generation',
             'Wind onshore generation',
             'Electrical load / consumption',
             'Hydroelectric generation',
-            'Other renewable / thermal sources'
+            'Other renewable / thermal sources',
+            'Electricity, all sources (Eurostat balance product E7000)'
         ],
-        'unit': ['MW', 'MW', 'MW', 'MW', 'MW'],
-        'category': ['Renewable', 'Renewable', 'Consumption', 'Renewable', 'Other']
+        'unit': ['MW', 'MW', 'MW', 'MW', 'MW', 'GWh'],
+        'category': ['Renewable', 'Renewable', 'Consumption', 'Renewable', 'Other', 'Electricity']
     })
     
     print(f"    ✅ {len(df)} types d'énergie créés")
@@ -114,7 +257,15 @@ def create_dim_energy_type() -> pd.DataFrame:
     return df
 
 
-def create_dim_location() -> pd.DataFrame:
+def gold_context(context: Optional[GoldContext] = None, config: Optional[dict] = None) -> GoldContext:
+    """Contexte du run, sinon contexte dédié sur paths.silver (config.yaml si absente)"""
+    if context is not None:
+        return context
+    config = config if config is not None else load_config()
+    return GoldContext(config['paths']['silver'])
+
+
+def create_dim_location(context: Optional[GoldContext] = None) -> pd.DataFrame:
     """
     Crée la dimension géographique (Régions/Départements France)
     Extraite de renewable_power_plants_FR
@@ -122,16 +273,13 @@ def create_dim_location() -> pd.DataFrame:
     
     print("  🔧 Création dim_location...")
     
-    config = load_config()
-    silver_path = Path(config['paths']['silver'])
-    
     try:
         # Lire les plantes ENR pour extraire locations
-        plants_path = silver_path / "renewable_plants" / "data.parquet"
-        df_plants = pd.read_parquet(plants_path)
+        context = gold_context(context)
+        df_plants = context.table('renewable_plants', LOCATION_COLUMNS)
         
         # Extraire locations uniques
-        locations = df_plants[['nuts_1_region', 'nuts_2_region', 'region', 'region_code']].drop_duplicates()
+        locations = df_plants[LOCATION_COLUMNS].drop_duplicates()
         locations = locations.dropna(subset=['region'])
         locations = locations.reset_index(drop=True)
         
@@ -147,7 +295,7 @@ def create_dim_location() -> pd.DataFrame:
         print(f"    ✅ {len(df)} régions/locations créées")
         
         return df
-        
+    
     except Exception as e:
         print(f"    ⚠️  Erreur: {str(e)}")
         # Fallback
@@ -161,7 +309,7 @@ def create_dim_location() -> pd.DataFrame:
         })
 
 
-def create_dim_plant() -> pd.DataFrame:
+def create_dim_plant(context: Optional[GoldContext] = None) -> pd.DataFrame:
     """
     Crée la dimension installations ENR
     Source: renewable_power_plants_FR
@@ -169,22 +317,19 @@ def create_dim_plant() -> pd.DataFrame:
     
     print("  🔧 Création dim_plant...")
     
-    config = load_config()
-    silver_path = Path(config['paths']['silver'])
-    
     try:
         # Lire les plantes
-        plants_path = silver_path / "renewable_plants" / "data.parquet"
-        df = pd.read_parquet(plants_path)
+        context = gold_context(context)
+        df = context.table('renewable_plants', PLANT_COLUMNS)
         
         # Sélectionner et transformer
         df['plant_id'] = range(1, len(df) + 1)
         df['plant_name'] = df['site_name'].fillna(f"Plant_{df.index}")
         df['technology'] = df['technology'].fillna('Unknown')
         df['energy_source'] = df['energy_source_level_1'].fillna('Unknown')
-        df['capacity_mw'] = pd.to_numeric(df['electrical_capacity'], errors='coerce').fillna(0)
-        df['latitude'] = pd.to_numeric(df['lat'], errors='coerce').fillna(0)
-        df['longitude'] = pd.to_numeric(df['lon'], errors='coerce').fillna(0)
+        df['capacity_mw'] = coerce_numeric(df['electrical_capacity']).fillna(0)
+        df['latitude'] = coerce_numeric(df['lat']).fillna(0)
+        df['longitude'] = coerce_numeric(df['lon']).fillna(0)
         df['commissioning_date'] = pd.to_datetime(df['commissioning_date'], errors='coerce')
         df['region'] = df['region'].fillna('Unknown')
         
@@ -197,7 +342,7 @@ def create_dim_plant() -> pd.DataFrame:
         print(f"    ✅ {len(df)} installations créées")
         
         return df
-        
+    
     except Exception as e:
         print(f"    ⚠️  Erreur: {str(e)}")
         return pd.DataFrame({
@@ -213,20 +358,18 @@ def create_dim_plant() -> pd.DataFrame:
         })
 
 
-def create_fact_renewable_capacity(config: dict) -> pd.DataFrame:
+def create_fact_renewable_capacity(config: dict, context: Optional[GoldContext] = None) -> pd.DataFrame:
     """Capacité installée ENR par technologie"""
     
     print("  🔧 Création fact_renewable_capacity...")
     
-    silver_path = Path(config['paths']['silver'])
-    
     try:
         # Lire plantes
-        plants_path = silver_path / "renewable_plants" / "data.parquet"
-        df = pd.read_parquet(plants_path)
+        context = gold_context(context, config)
+        df = context.table('renewable_plants', CAPACITY_COLUMNS)
         
         # Calculer capacité par technologie et région
-        df['capacity_mw'] = pd.to_numeric(df['electrical_capacity'], errors='coerce').fillna(0)
+        df['capacity_mw'] = coerce_numeric(df['electrical_capacity']).fillna(0)
         df['technology'] = df['technology'].fillna('Other')
         df['region'] = df['region'].fillna('Unknown')
         
@@ -256,7 +399,7 @@ def create_fact_renewable_capacity(config: dict) -> pd.DataFrame:
         print(f"    ✅ {len(agg)} enregistrements de capacité créés")
         
         return agg
-        
+    
     except Exception as e:
         print(f"    ⚠️  Erreur: {str(e)}")
         return pd.DataFrame({
@@ -271,24 +414,39 @@ def create_fact_renewable_capacity(config: dict) -> pd.DataFrame:
         })
 
 
-def create_fact_monthly_summary(config: dict) -> pd.DataFrame:
+def create_fact_monthly_summary(config: dict, context: Optional[GoldContext] = None) -> pd.DataFrame:
     """Résumés mensuels pour requêtes BI rapides"""
     
     print("  🔧 Création fact_monthly_summary...")
     
-    silver_path = Path(config['paths']['silver'])
+    metric_columns = [
+        (1, 'Solar'),
+        (2, 'Wind Onshore'),
+        (3, 'Load'),
+        (4, 'Hydro'),
+        (5, 'Thermal')
+    ]
     
     try:
-        # Lire données
-        ts_path = silver_path / "france_time_series" / "data.parquet"
-        df_ts = pd.read_parquet(ts_path)
+        context = gold_context(context, config)
+        profile = context.profile('france_time_series')
+        
+        # Profil SILVER: aucune colonne agrégée → pas de lecture
+        columns = profile_columns(profile)
+        if columns is not None and not any(col_name in columns for _, col_name in metric_columns):
+            print("    ⏭️  Aucune colonne agrégée dans france_time_series (profil SILVER)")
+            print("    ✅ 0 enregistrements mensuels créés")
+            return pd.DataFrame()
+        
+        # Lire données: colonne de temps du profil (sinon candidates) + métriques
+        coverage = profile_time_range(profile)
+        time_columns = [coverage['column']] if coverage else TS_TIME_COLUMNS
+        df_ts = context.table('france_time_series', time_columns + [col_name for _, col_name in metric_columns])
         
-        # Parser date - chercher la colonne datetime
-        date_col = None
-        for col in ['DateTime', 'datetime', 'date', 'event_ts']:
-            if col in df_ts.columns:
-                date_col = col
-                break
+        # Parser date - colonne de temps du profil, sinon chercher la colonne datetime
+        date_col = coverage['column'] if coverage else next(
+            (col for col in TS_TIME_COLUMNS if col in df_ts.columns), None
+        )
         
         if date_col:
             df_ts['date'] = pd.to_datetime(df_ts[date_col], errors='coerce')
@@ -301,13 +459,7 @@ def create_fact_monthly_summary(config: dict) -> pd.DataFrame:
         
         records = []
         
-        for energy_type_id, col_name in [
-            (1, 'Solar'),
-            (2, 'Wind Onshore'),
-            (3, 'Load'),
-            (4, 'Hydro'),
-            (5, 'Thermal')
-        ]:
+        for energy_type_id, col_name in metric_columns:
             if col_name in df_ts.columns:
                 # Agrégation mensuelle
                 monthly = df_ts.groupby(['year', 'month'])[col_name].agg([
@@ -341,74 +493,152 @@ def create_fact_monthly_summary(config: dict) -> pd.DataFrame:
         print(f"    ✅ {len(df)} enregistrements mensuels créés")
         
         return df
-        
+    
     except Exception as e:
         print(f"    ⚠️  Erreur: {str(e)}")
         return pd.DataFrame()
 
 
-def create_fact_energy_production(silver_path: str, dim_date: pd.DataFrame) -> pd.DataFrame:
+def siec_energy_type_id(siec: str) -> int:
+    """energy_type_id d'un produit Eurostat (code SIEC, ex: E7000, RA420)"""
+    return next((v for prefix, v in SIEC_ENERGY_TYPES.items() if str(siec).startswith(prefix)), 5)
+
+
+def create_fact_annual_energy_balance(config: dict, context: Optional[GoldContext] = None) -> pd.DataFrame:
+    """
+    Bilans énergétiques annuels Eurostat par type d'énergie
+    
+    Source: table longue SILVER eurostat_energy_balance (une ligne par
+    poste de bilan, produit, unité et année). Les produits sont rattachés à
+    dim_energy_type par leur code SIEC, qui reste dans le grain: plusieurs
+    produits d'un même type (ex: RA410 et RA420, Solaire) ne sont jamais
+    sommés entre eux (nb_records = lignes SILVER du grain).
+    
+    Returns:
+        DataFrame: year, energy_type_id, siec, nrg_bal, unit, value, nb_records, country
+    """
+    
+    print("  🔧 Création fact_annual_energy_balance...")
+    
+    try:
+        context = gold_context(context, config)
+        profile = context.profile('eurostat_energy_balance')
+        if profile is not None and profile['rows'] == 0:
+            raise ValueError("table vide (profil SILVER)")
+        df = context.table('eurostat_energy_balance', BALANCE_COLUMNS)
+        
+        # Type d'énergie: une fois par produit distinct, pas par ligne
+        codes, products = pd.factorize(df['siec'])
+        energy_type_ids = np.array([siec_energy_type_id(p) for p in products] + [5], dtype=np.int64)
+        df['energy_type_id'] = energy_type_ids[codes]
+        
+        agg = df.groupby(['year', 'energy_type_id', 'siec', 'nrg_bal', 'unit'], sort=True).agg(
+            value=('value', 'sum'),
+            nb_records=('value', 'count')
+        ).reset_index()
+        agg['year'] = agg['year'].astype(np.int16)
+        agg['country'] = 'FR'
+        
+        print(f"    ✅ {len(agg)} enregistrements annuels créés ({agg['year'].min()}-{agg['year'].max()})")
+        
+        return agg
+    
+    except Exception as e:
+        print(f"    ⚠️  Erreur: {str(e)}")
+        return pd.DataFrame(columns=['year', 'energy_type_id', 'siec', 'nrg_bal', 'unit', 'value', 'nb_records', 'country'])
+
+
+def production_metrics(config: dict) -> List[Tuple[str, int]]:
+    """
+    Métriques de fact_energy_production (`gold.production_metrics` de config.yaml)
+    
+    Args:
+        config: Configuration
+    
+    Returns:
+        List[Tuple[colonne SILVER, energy_type_id]]
+    """
+    entries = (config.get('gold') or {}).get('production_metrics')
+    if not entries:
+        return list(DEFAULT_PRODUCTION_METRICS)
+    return [(entry['column'], int(entry['energy_type_id'])) for entry in entries]
+
+
+def utc_day_key(ts: pd.Series) -> np.ndarray:
+    """Jour UTC de chaque timestamp, en jours depuis 1970-01-01 (int64)"""
+    if ts.dt.tz is not None:
+        ts = ts.dt.tz_convert('UTC').dt.tz_localize(None)
+    return ts.to_numpy(dtype='datetime64[ns]').astype('datetime64[D]').astype(np.int64)
+
+
+def day_key_date_id(day_keys: np.ndarray) -> np.ndarray:
+    """date_id (YYYYMMDD) de clés jour (jours depuis 1970-01-01)"""
+    dates = pd.DatetimeIndex(np.asarray(day_keys, dtype=np.int64).astype('datetime64[D]'))
+    return (dates.year * 10000 + dates.month * 100 + dates.day).to_numpy(dtype=np.int64)
+
+
+def create_fact_energy_production(
+    silver_path: str,
+    dim_date: pd.DataFrame,
+    context: Optional[GoldContext] = None,
+    metrics: Optional[List[Tuple[str, int]]] = None
+) -> pd.DataFrame:
     """
     Crée la fact table agrégée par jour/type/pays
+    
+    Les métriques horaires de france_time_series (`gold.production_metrics`)
+    sont agrégées en une passe: un groupby sur la clé jour entière pour
+    toutes les colonnes, puis passage au format long (date_id, energy_type_id).
+    
+    Args:
+        silver_path: Répertoire SILVER
+        dim_date: Dimension temporelle
+        context: Tables SILVER partagées du run (None = contexte dédié)
+        metrics: (colonne, energy_type_id) (None = config.yaml)
     """
     
     print("  🔧 Création fact_energy_production...")
     
+    context = context if context is not None else GoldContext(silver_path)
+    metrics = metrics if metrics is not None else production_metrics(load_config())
     facts = []
     
     # ===== FRANCE TIME SERIES (load + solar + wind) =====
     try:
-        silver_file = os.path.join(silver_path, 'france_time_series', 'data.parquet')
-        df = pd.read_parquet(silver_file)
-        
-        # Agréger par jour
-        df['date'] = df['event_ts'].dt.date
-        
-        # Load (consumption)
-        daily_load = df.groupby('date')['load_mw'].agg(['sum', 'min', 'max', 'mean', 'count']).reset_index()
-        daily_load['energy_type_id'] = 3
-        daily_load['country'] = 'FR'
-        daily_load['value_mw'] = daily_load['sum']
-        daily_load['value_min_mw'] = daily_load['min']
-        daily_load['value_max_mw'] = daily_load['max']
-        daily_load['value_avg_mw'] = daily_load['mean']
-        daily_load['nb_records'] = daily_load['count']
-        daily_load['date_id'] = pd.to_datetime(daily_load['date']).dt.strftime('%Y%m%d').astype(int)
-        facts.append(daily_load[['date_id', 'energy_type_id', 'country', 'value_mw', 'value_min_mw', 'value_max_mw', 'value_avg_mw', 'nb_records']])
-        
-        # Solar
-        daily_solar = df.groupby('date')['solar_mw'].agg(['sum', 'min', 'max', 'mean', 'count']).reset_index()
-        daily_solar['energy_type_id'] = 1
-        daily_solar['country'] = 'FR'
-        daily_solar['value_mw'] = daily_solar['sum']
-        daily_solar['value_min_mw'] = daily_solar['min']
-        daily_solar['value_max_mw'] = daily_solar['max']
-        daily_solar['value_avg_mw'] = daily_solar['mean']
-        daily_solar['nb_records'] = daily_solar['count']
-        daily_solar['date_id'] = pd.to_datetime(daily_solar['date']).dt.strftime('%Y%m%d').astype(int)
-        facts.append(daily_solar[['date_id', 'energy_type_id', 'country', 'value_mw', 'value_min_mw', 'value_max_mw', 'value_avg_mw', 'nb_records']])
-        
-        # Wind
-        daily_wind = df.groupby('date')['wind_mw'].agg(['sum', 'min', 'max', 'mean', 'count']).reset_index()
-        daily_wind['energy_type_id'] = 2
-        daily_wind['country'] = 'FR'
-        daily_wind['value_mw'] = daily_wind['sum']
-        daily_wind['value_min_mw'] = daily_wind['min']
-        daily_wind['value_max_mw'] = daily_wind['max']
-        daily_wind['value_avg_mw'] = daily_wind['mean']
-        daily_wind['nb_records'] = daily_wind['count']
-        daily_wind['date_id'] = pd.to_datetime(daily_wind['date']).dt.strftime('%Y%m%d').astype(int)
-        facts.append(daily_wind[['date_id', 'energy_type_id', 'country', 'value_mw', 'value_min_mw', 'value_max_mw', 'value_avg_mw', 'nb_records']])
-        
-        print(f"    ✅ france_time_series ingérée ({len(daily_load)} jours)")
-        
+        profile = context.profile('france_time_series')
+        if profile is not None and profile['rows'] == 0:
+            raise ValueError("table vide (profil SILVER)")
+        df = context.table('france_time_series', ['event_ts'] + [column for column, _ in metrics])
+        
+        # Une seule agrégation journalière pour toutes les métriques (clé entière: jour UTC)
+        metrics = [(column, energy_type_id) for column, energy_type_id in metrics if column in df.columns]
+        if not metrics:
+            raise ValueError("aucune colonne de gold.production_metrics dans la table")
+        df = df[df['event_ts'].notna()]
+        columns = [column for column, _ in metrics]
+        daily = df[columns].groupby(utc_day_key(df['event_ts']), sort=True).agg(PRODUCTION_STATS)
+        daily.index = day_key_date_id(daily.index.to_numpy())
+        
+        # Format long (date_id, energy_type_id): un bloc de jours par métrique
+        daily = pd.concat(
+            {energy_type_id: daily[column] for column, energy_type_id in metrics},
+            names=['energy_type_id', 'date_id']
+        ).reset_index()
+        daily.columns = ['energy_type_id', 'date_id', 'value_mw', 'value_min_mw', 'value_max_mw', 'value_avg_mw', 'nb_records']
+        daily['country'] = 'FR'
+        facts.append(daily[['date_id', 'energy_type_id', 'country', 'value_mw', 'value_min_mw', 'value_max_mw', 'value_avg_mw', 'nb_records']])
+        
+        print(f"    ✅ france_time_series ingérée ({len(daily) // len(metrics)} jours, {len(metrics)} métriques)")
+    
     except Exception as e:
         print(f"    ⚠️  france_time_series: {str(e)}")
     
     # ===== RENEWABLE PLANTS (capacités) =====
     try:
-        silver_file = os.path.join(silver_path, 'renewable_plants', 'data.parquet')
-        df = pd.read_parquet(silver_file)
+        profile = context.profile('renewable_plants')
+        if profile is not None and profile['rows'] == 0:
+            raise ValueError("table vide (profil SILVER)")
+        df = context.table('renewable_plants', PLANT_PRODUCTION_COLUMNS)
         
         # Agréger par type
         if 'energy_source_level_1' in df.columns:
@@ -431,7 +661,7 @@ def create_fact_energy_production(silver_path: str, dim_date: pd.DataFrame) -> p
         facts.append(agg_capacity[['date_id', 'energy_type_id', 'country', 'value_mw', 'value_min_mw', 'value_max_mw', 'value_avg_mw', 'nb_records']])
         
         print(f"    ✅ renewable_plants ingérées ({len(agg_capacity)} types)")
-        
+    
     except Exception as e:
         print(f"    ⚠️  renewable_plants: {str(e)}")
     
@@ -454,13 +684,14 @@ def write_parquet_safe(df: pd.DataFrame, output_path: str, table_name: str) -> N
     
     os.makedirs(output_path, exist_ok=True)
     parquet_file = os.path.join(output_path, f"{table_name}.parquet")
-    df.to_parquet(parquet_file, engine='pyarrow', index=False)
+    write_parquet_table(df, parquet_file)
+    update_profile(output_path, df)
     print(f"    📂 {parquet_file} ({len(df)} lignes)")
 
 
 def run_gold_warehouse() -> bool:
     """
-    Pipeline complet GOLD avec 7 tables
+    Pipeline complet GOLD avec 8 tables
     """
     
     print(f"\n{'='*80}")
@@ -479,10 +710,14 @@ def run_gold_warehouse() -> bool:
         # Créer répertoires
         Path(gold_path).mkdir(parents=True, exist_ok=True)
         
+        # Tables SILVER lues une fois pour tous les builders (colonnes utiles seulement)
+        context = GoldContext(silver_path)
+        
         # ===== DIMENSIONS =====
         print("📐 CRÉATION DES DIMENSIONS\n")
         
-        dim_date = create_dim_date(start_date="2015-01-01", end_date="2026-12-31")
+        start_date, end_date = dim_date_range(silver_path, "2015-01-01", "2026-12-31")
+        dim_date = create_dim_date(start_date=start_date, end_date=end_date)
         write_parquet_safe(dim_date, os.path.join(gold_path, 'dim_date'), 'data')
         print(f"    📂 data/warehouse/gold/dim_date/data.parquet ({len(dim_date)} lignes)")
         
@@ -490,33 +725,38 @@ def run_gold_warehouse() -> bool:
         write_parquet_safe(dim_energy_type, os.path.join(gold_path, 'dim_energy_type'), 'data')
         print(f"    📂 data/warehouse/gold/dim_energy_type/data.parquet ({len(dim_energy_type)} lignes)")
         
-        dim_location = create_dim_location()
+        dim_location = create_dim_location(context)
         write_parquet_safe(dim_location, os.path.join(gold_path, 'dim_location'), 'data')
         print(f"    📂 data/warehouse/gold/dim_location/data.parquet ({len(dim_location)} lignes)")
         
-        dim_plant = create_dim_plant()
+        dim_plant = create_dim_plant(context)
         write_parquet_safe(dim_plant, os.path.join(gold_path, 'dim_plant'), 'data')
         print(f"    📂 data/warehouse/gold/dim_plant/data.parquet ({len(dim_plant)} lignes)")
         
         print()
         print("📊 CRÉATION DES FACT TABLES\n")
         
-        fact_production = create_fact_energy_production(silver_path, dim_date)
+        fact_production = create_fact_energy_production(silver_path, dim_date, context, production_metrics(config))
         write_parquet_safe(fact_production, os.path.join(gold_path, 'fact_energy_production'), 'data')
         print(f"    📂 data/warehouse/gold/fact_energy_production/data.parquet ({len(fact_production)} lignes)")
         
-        fact_capacity = create_fact_renewable_capacity(config)
+        fact_capacity = create_fact_renewable_capacity(config, context)
         write_parquet_safe(fact_capacity, os.path.join(gold_path, 'fact_renewable_capacity'), 'data')
         print(f"    📂 data/warehouse/gold/fact_renewable_capacity/data.parquet ({len(fact_capacity)} lignes)")
         
-        fact_monthly = create_fact_monthly_summary(config)
+        fact_monthly = create_fact_monthly_summary(config, context)
         write_parquet_safe(fact_monthly, os.path.join(gold_path, 'fact_monthly_summary'), 'data')
         print(f"    📂 data/warehouse/gold/fact_monthly_summary/data.parquet ({len(fact_monthly)} lignes)")
         
+        fact_balance = create_fact_annual_energy_balance(config, context)
+        write_parquet_safe(fact_balance, os.path.join(gold_path, 'fact_annual_energy_balance'), 'data')
+        print(f"    📂 data/warehouse/gold/fact_annual_energy_balance/data.parquet ({len(fact_balance)} lignes)")
+        context.clear()
+        
         # ===== RÉSUMÉ STAR SCHEMA =====
         print()
         print("=" * 80)
-        print("📋 STAR SCHEMA ENRICHI (7 TABLES)")
+        print("📋 STAR SCHEMA ENRICHI (8 TABLES)")
         print("=" * 80)
         print()
         
@@ -531,6 +771,7 @@ def run_gold_warehouse() -> bool:
         print(f"   ✅ fact_energy_production:   {len(fact_production):>6d} records    (Agrégation journalière)")
         print(f"   ✅ fact_renewable_capacity:  {len(fact_capacity):>6d} records    (Capacité installée)")
         print(f"   ✅ fact_monthly_summary:     {len(fact_monthly):>6d} records    (Résumés mensuels)")
+        print(f"   ✅ fact_annual_energy_balance: {len(fact_balance):>4d} records    (Bilans annuels Eurostat)")
         print()
         
         # ===== REQUÊTES EXEMPLE =====
@@ -594,7 +835,7 @@ ORDER BY d.year DESC, d.month DESC;
         print("=" * 80)
         print()
         
-        print("📁 Structure GOLD (7 tables):")
+        print("📁 Structure GOLD (8 tables):")
         print("   data/warehouse/gold/")
         print("   ├── dim_date/")
         print("   ├── dim_energy_type/")
@@ -602,7 +843,8 @@ ORDER BY d.year DESC, d.month DESC;
         print("   ├── dim_plant/")
         print("   ├── fact_energy_production/")
         print("   ├── fact_renewable_capacity/")
-        print("   └── fact_monthly_summary/")
+        print("   ├── fact_monthly_summary/")
+        print("   └── fact_annual_energy_balance/")
         print()
         
         print("✅ Star Schema Relationships:")
@@ -613,6 +855,7 @@ ORDER BY d.year DESC, d.month DESC;
         print("   • fact_renewable_capacity → dim_plant (region)")
         print("   • fact_monthly_summary → dim_date (date_id)")
         print("   • fact_monthly_summary → dim_energy_type (energy_type_id)")
+        print("   • fact_annual_energy_balance → dim_energy_type (energy_type_id)")
         print()
         
         print("✅ Prêt pour BI:")
@@ -625,14 +868,14 @@ ORDER BY d.year DESC, d.month DESC;
         print("✅ Pipeline complet:")
         print("   1. ✅ BRONZE (Ingestion RAW)      - 61,554 lignes")
         print("   2. ✅ SILVER (Nettoyage)           - 61,554 lignes nettoyées")
-        print("   3. ✅ GOLD (Star Schema Enrichi)  - 7 tables prêtes pour BI")
+        print("   3. ✅ GOLD (Star Schema Enrichi)  - 8 tables prêtes pour BI")
         print()
         
         print("🎉 Data Warehouse Énergie France créé avec succès!")
         print()
         
         return True
-        
+    
     except Exception as e:
         print(f"\n❌ ERREUR FATALE: {str(e)}\n")
         import traceback
@@ -641,7 +884,7 @@ ORDER BY d.year DESC, d.month DESC;
 
 
 if __name__ == "__main__":
-    
+
     try:
         success = run_gold_warehouse()
         
@@ -651,7 +894,7 @@ if __name__ == "__main__":
         else:
             print("⚠️  Pipeline GOLD terminé avec des avertissements\n")
             sys.exit(1)
-            
+    
     except Exception as e:
         print(f"❌ Erreur fatale: {str(e)}\n")
         sys.exit(1)
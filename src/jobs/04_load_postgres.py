@@ -13,7 +13,8 @@ Flux:
     ├── dim_plant
     ├── fact_energy_production
     ├── fact_renewable_capacity
-    └── fact_monthly_summary
+    ├── fact_monthly_summary
+    └── fact_annual_energy_balance
 
 Usage:
   python 04_load_postgres.py                    # Charge tous les fichiers Parquet
@@ -24,7 +25,7 @@ import os
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 import pandas as pd
 
 # Ajouter le chemin src pour les imports
@@ -38,6 +39,15 @@ from lib.postgres_utils import (
     truncate_table,
     get_table_row_count
 )
+from lib.profile_utils import read_profile
+
+
+# Paramètres liés max par requête PostgreSQL (INSERT multi-lignes)
+MAX_BIND_PARAMETERS = 65535
+
+# Lignes par INSERT: sans profil / plafond
+DEFAULT_CHUNKSIZE = 1000
+MAX_CHUNKSIZE = 50000
 
 
 def load_parquet_to_dataframe(parquet_path: str) -> pd.DataFrame:
@@ -56,6 +66,25 @@ def load_parquet_to_dataframe(parquet_path: str) -> pd.DataFrame:
     return pd.read_parquet(parquet_path)
 
 
+def insert_chunksize(profile: Optional[dict]) -> int:
+    """
+    Taille des lots INSERT d'une table d'après son profil GOLD
+    
+    Un lot remplit au plus MAX_BIND_PARAMETERS (lignes × colonnes), sans
+    dépasser le nombre de lignes de la table.
+    
+    Args:
+        profile: Profil de la table (None = lot par défaut)
+        
+    Returns:
+        int: Lignes par lot
+    """
+    if profile is None:
+        return DEFAULT_CHUNKSIZE
+    rows_per_insert = MAX_BIND_PARAMETERS // max(len(profile['columns']), 1)
+    return max(1, min(profile['rows'], rows_per_insert, MAX_CHUNKSIZE))
+
+
 def load_gold_to_postgres(config: dict, truncate: bool = False) -> Dict[str, int]:
     """
     Charge toutes les tables GOLD vers PostgreSQL
@@ -87,6 +116,7 @@ def load_gold_to_postgres(config: dict, truncate: bool = False) -> Dict[str, int
         'fact_energy_production': gold_path / 'fact_energy_production',
         'fact_renewable_capacity': gold_path / 'fact_renewable_capacity',
         'fact_monthly_summary': gold_path / 'fact_monthly_summary',
+        'fact_annual_energy_balance': gold_path / 'fact_annual_energy_balance',
     }
     
     stats = {}
@@ -101,6 +131,24 @@ def load_gold_to_postgres(config: dict, truncate: bool = False) -> Dict[str, int
                 stats[table_name] = 0
                 continue
             
+            # Profil GOLD: lignes attendues et taille des lots sans relire la table
+            profile = read_profile(table_path)
+            chunksize = insert_chunksize(profile)
+            if profile is not None:
+                print(f"  🧭 {table_name}: {profile['rows']:,} lignes (profil), lots de {chunksize:,}")
+            
+            # Table GOLD vide: rien à lire ni à insérer, mais une reconstruction
+            # (truncate) doit quand même vider les lignes du chargement précédent
+            if profile is not None and profile['rows'] == 0:
+                if truncate:
+                    try:
+                        truncate_table(table_name, config)
+                    except Exception:
+                        pass  # Table absente: rien à vider
+                print(f"  ⏭️  {table_name}: table GOLD vide, aucun chargement")
+                stats[table_name] = 0
+                continue
+            
             # Charger le Parquet
             df = load_parquet_to_dataframe(str(table_path))
             
@@ -116,7 +164,8 @@ def load_gold_to_postgres(config: dict, truncate: bool = False) -> Dict[str, int
                 df,
                 table_name,
                 config,
-                if_exists='replace' if truncate else 'append'
+                if_exists='replace' if truncate else 'append',
+                chunksize=chunksize
             )
             
             stats[table_name] = rows_loaded
@@ -148,7 +197,7 @@ def print_statistics(stats: Dict[str, int]) -> None:
             total_rows += row_count
             success_count += 1
         elif row_count == 0:
-            print(f"  ⚠️  {table_name:30} → Fichier manquant")
+            print(f"  ⚠️  {table_name:30} → Aucune ligne (fichier manquant ou table vide)")
         else:
             print(f"  ❌ {table_name:30} → Erreur chargement")
     
@@ -0,0 +1,208 @@
+"""
+Déduplication SILVER des tables larges par hash de ligne 64 bits
+
+Au lieu d'un drop_duplicates sur toutes les colonnes, chaque ligne est
+résumée par un hash 64 bits calculé colonne par colonne (valeurs
+distinctes hachées une seule fois), et la déduplication se fait sur ce
+seul entier. Les doublons candidats sont ensuite vérifiés valeur à valeur
+(collisions). Le hash est stable (il ne dépend que des valeurs, pas de
+l'ordre des lignes ni du backend des dtypes) et sert d'identifiant de
+ligne `_row_id` en aval.
+"""
+
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import yaml
+from pandas.util import hash_pandas_object
+
+
+# Identifiant de ligne stable (hash 64 bits, vu en int64 signé pour Parquet / PostgreSQL)
+ROW_ID_COLUMN = "_row_id"
+
+# Colonnes techniques BRONZE: hors clé par défaut (un même enregistrement
+# réingéré garde le même _row_id)
+SYSTEM_COLUMNS = ('_source_file', '_ingest_ts', '_ingest_date')
+
+# Réglages par défaut (section `silver.dedup` de config.yaml)
+DEFAULT_DEDUP_OPTIONS = {
+    'mode': 'hash',
+    'verify': True,
+    'row_id': True,
+    'keys': {},
+}
+
+# Mélange des hashs de colonnes (FNV-1a 64 bits) et hash des valeurs nulles
+_FNV_PRIME = np.uint64(1099511628211)
+_NULL_HASH = np.uint64(0x9E3779B97F4A7C15)
+
+
+@lru_cache(maxsize=None)
+def _load_dedup_options(config_path: str) -> tuple:
+    """Lit `silver.dedup` de la config (une fois par process)"""
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+    except OSError:
+        config = {}
+    return tuple(((config.get('silver') or {}).get('dedup') or {}).items())
+
+
+def load_dedup_options(config_path: str = "conf/config.yaml") -> dict:
+    """
+    Réglages de déduplication: défauts + `silver.dedup` de config.yaml
+    
+    Args:
+        config_path: Chemin vers config.yaml
+    
+    Returns:
+        dict: Réglages (mode, verify, row_id, keys)
+    """
+    options = {**DEFAULT_DEDUP_OPTIONS, **dict(_load_dedup_options(config_path))}
+    options['keys'] = options['keys'] or {}
+    return options
+
+
+def dedup_key_columns(df: pd.DataFrame, source: str, options: Optional[dict] = None) -> List[str]:
+    """
+    Colonnes de la clé de déduplication d'une source
+    
+    Args:
+        df: Table à dédupliquer
+        source: Nom de la source (clé de `silver.dedup.keys`)
+        options: Réglages (None = config.yaml)
+    
+    Returns:
+        List[str]: Colonnes déclarées, sinon toutes les colonnes métier
+    """
+    options = options if options is not None else load_dedup_options()
+    keys = options['keys'].get(source)
+    if keys:
+        missing = [c for c in keys if c not in df.columns]
+        if missing:
+            raise ValueError(f"Clé de déduplication {source}: colonnes absentes {missing}")
+        return list(keys)
+    return [c for c in df.columns if c not in SYSTEM_COLUMNS and c != ROW_ID_COLUMN]
+
+
+def row_hash(
+    df: pd.DataFrame,
+    columns: Optional[List[str]] = None,
+    positions: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Hash 64 bits de chaque ligne sur `columns`
+    
+    Chaque colonne est factorisée: seules ses valeurs distinctes sont
+    hachées (pandas.util.hash_pandas_object), puis les hashs de colonnes
+    sont combinés en FNV-1a, en NumPy vectorisé.
+    
+    Args:
+        df: Table
+        columns: Colonnes hachées (None = toutes)
+        positions: Lignes à hacher (None = toutes); extraites colonne par
+            colonne, sans copie de la table
+    
+    Returns:
+        np.ndarray: uint64, une valeur par ligne (par position)
+    """
+    hashes = np.zeros(len(df) if positions is None else len(positions), dtype=np.uint64)
+    for name in (columns if columns is not None else df.columns):
+        values = df[name] if positions is None else df[name].take(positions)
+        codes, uniques = pd.factorize(values)
+        hashed = hash_pandas_object(pd.Series(uniques), index=False).to_numpy()
+        # Code -1 (null) → dernier élément: hash fixe des valeurs nulles
+        hashed = np.append(hashed, _NULL_HASH)
+        hashes = (hashes * _FNV_PRIME) ^ hashed[codes]
+    return hashes
+
+
+def _rows_equal(df: pd.DataFrame, columns: List[str], left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Égalité valeur à valeur des lignes left[i] / right[i] (null == null)"""
+    equal = np.ones(len(left), dtype=bool)
+    for name in columns:
+        a = df[name].iloc[left].reset_index(drop=True)
+        b = df[name].iloc[right].reset_index(drop=True)
+        same = (a == b).to_numpy(dtype=bool, na_value=False)
+        equal &= same | (a.isna() & b.isna()).to_numpy(dtype=bool)
+    return equal
+
+
+def drop_duplicate_rows(
+    df: pd.DataFrame,
+    columns: List[str],
+    verify: bool = True,
+    row_id: bool = True
+) -> Tuple[pd.DataFrame, dict]:
+    """
+    Supprime les doublons de `columns` (première occurrence conservée) par hash de ligne
+    
+    Un doublon candidat est une ligne dont le hash a déjà été vu. Avec
+    `verify`, chaque candidat est comparé à la première ligne de même hash:
+    une différence (collision) fait retraiter ce seul groupe de hash par un
+    drop_duplicates exact.
+    
+    Args:
+        df: Table à dédupliquer
+        columns: Colonnes de la clé
+        verify: Vérifier les candidats valeur à valeur
+        row_id: Ajouter le hash en colonne _row_id (int64)
+    
+    Returns:
+        Tuple[table dédupliquée, métriques {duplicate_rows, hash_collisions}]
+    """
+    hashes = row_hash(df, columns)
+    codes, uniques = pd.factorize(hashes)
+    
+    # Position de la première ligne de chaque hash
+    positions = np.arange(len(codes))
+    first = np.empty(len(uniques), dtype=np.intp)
+    first[codes[::-1]] = positions[::-1]
+    candidates = np.flatnonzero(first[codes] != positions)
+    
+    keep = np.ones(len(df), dtype=bool)
+    keep[candidates] = False
+    collisions = 0
+    
+    if verify and len(candidates):
+        equal = _rows_equal(df, columns, candidates, first[codes[candidates]])
+        collisions = int((~equal).sum())
+        if collisions:
+            # Groupes de hash en collision: déduplication exacte sur ces seules lignes
+            collided = np.isin(codes, np.unique(codes[candidates[~equal]]))
+            group = np.flatnonzero(collided)
+            keep[group] = ~df.iloc[group].duplicated(subset=columns, keep='first').to_numpy()
+    
+    result = df.take(np.flatnonzero(keep))
+    if row_id:
+        result.insert(0, ROW_ID_COLUMN, hashes[keep].view(np.int64))
+    
+    return result, {'duplicate_rows': int(len(df) - keep.sum()), 'hash_collisions': collisions}
+
+
+def deduplicate(df: pd.DataFrame, source: str, options: Optional[dict] = None) -> Tuple[pd.DataFrame, dict]:
+    """
+    Déduplication d'une table large selon `silver.dedup`
+    
+    - mode "hash": drop_duplicate_rows sur la clé de la source
+    - mode "exact": drop_duplicates sur toutes les colonnes (historique)
+    
+    Args:
+        df: Table à dédupliquer
+        source: Nom de la source
+        options: Réglages (None = config.yaml)
+    
+    Returns:
+        Tuple[table dédupliquée, métriques DQ]
+    """
+    options = options if options is not None else load_dedup_options()
+    
+    if options['mode'] == 'exact':
+        result = df.drop_duplicates(keep='first')
+        return result, {'duplicate_rows': len(df) - len(result)}
+    if options['mode'] != 'hash':
+        raise ValueError(f"Mode de déduplication inconnu: {options['mode']} (hash | exact)")
+    
+    return drop_duplicate_rows(df, dedup_key_columns(df, source, options), options['verify'], options['row_id'])
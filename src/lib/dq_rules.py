@@ -0,0 +1,367 @@
+"""
+Moteur de règles qualité (pandas) pour la couche SILVER
+
+Toutes les règles sont évaluées en une passe vectorisée et combinées dans
+un masque entier (un bit par règle). Les lignes valides et rejetées sont
+séparées en une seule indexation, et une ligne qui enfreint plusieurs
+règles porte toutes ses raisons de rejet.
+
+Les règles sont déclarées par source dans la section `dq_rules` de
+config.yaml et compilées une fois en expressions vectorisées.
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from lib.reject_sink import (
+    REJECT_MASK_COLUMN,
+    REJECT_REASON_COLUMN,
+    REASON_SEPARATOR,
+    Rejects,
+    collect_rejects,
+    describe_mask,
+)
+
+
+# Métriques DQ d'un nettoyage, portées par le DataFrame valide (df.attrs)
+DQ_METRICS_ATTR = "dq_metrics"
+
+# Un bit par règle dans un int64
+MAX_RULES = 63
+
+
+class Rule(NamedTuple):
+    """
+    Règle de validation
+    
+    Attributes:
+        name: Identifiant court (métriques DQ)
+        reason: Libellé de rejet
+        check: df -> masque booléen des lignes EN ERREUR
+        columns: Colonnes contrôlées (résumé des rejets)
+    """
+    name: str
+    reason: str
+    check: Callable[[pd.DataFrame], pd.Series]
+    columns: Tuple[str, ...] = ()
+
+
+def evaluate_rules(df: pd.DataFrame, rules: List[Rule]) -> np.ndarray:
+    """
+    Évalue toutes les règles et combine les erreurs en masque de bits
+    
+    Args:
+        df: Données à valider
+        rules: Règles (bit i = règle i)
+    
+    Returns:
+        np.ndarray: Masque int64 (0 = ligne valide)
+    
+    Raises:
+        ValueError: Si plus de MAX_RULES règles
+    """
+    if len(rules) > MAX_RULES:
+        raise ValueError(f"Trop de règles: {len(rules)} (max {MAX_RULES})")
+    
+    mask = np.zeros(len(df), dtype=np.int64)
+    for bit, rule in enumerate(rules):
+        failed = rule.check(df)
+        if isinstance(failed, pd.Series):
+            # Masques Arrow (bool[pyarrow]): une comparaison à null n'est pas une erreur
+            failed = failed.to_numpy(dtype=bool, na_value=False)
+        mask |= np.asarray(failed, dtype=bool).astype(np.int64) << bit
+    return mask
+
+
+def count_failures(mask: np.ndarray, rules: List[Rule]) -> dict:
+    """
+    Nombre de lignes en erreur par règle
+    
+    Args:
+        mask: Masques de rejet
+        rules: Règles ayant produit les masques
+    
+    Returns:
+        dict: {nom_règle: nb_lignes}
+    """
+    return {rule.name: int(((mask >> bit) & 1).sum()) for bit, rule in enumerate(rules)}
+
+
+def split_valid_rejects(
+    df: pd.DataFrame,
+    rules: List[Rule],
+    options: Optional[dict] = None
+) -> Tuple[pd.DataFrame, Rejects]:
+    """
+    Applique les règles et sépare lignes valides / rejetées
+    
+    Une seule évaluation des règles et une seule sélection pour les lignes
+    valides, quel que soit le nombre de règles. Les rejets sont confiés au
+    puits de rejets (lib.reject_sink): compteurs exacts + échantillon borné
+    en mode summary, lignes complètes en mode full.
+    
+    Args:
+        df: Données à valider
+        rules: Règles de validation
+        options: Réglages des rejets (None = `silver.rejects` de config.yaml)
+    
+    Returns:
+        Tuple[valid_df, rejects] - len(rejects) = nombre exact de lignes rejetées
+    """
+    mask = evaluate_rules(df, rules)
+    rejected = mask != 0
+    
+    # Aucun rejet: copie simple (pas de take ligne à ligne, les buffers Arrow
+    # immuables ne sont même pas recopiés)
+    if not rejected.any():
+        return df.copy(), Rejects.empty()
+    
+    # take (et non df[masque]): sortie indépendante, modifiable sans copie défensive
+    valid_df = df.take(np.flatnonzero(~rejected))
+    return valid_df, collect_rejects(df, mask, rules, options)
+
+
+def add_dq_metrics(df: pd.DataFrame, metrics: dict) -> pd.DataFrame:
+    """
+    Attache des métriques DQ au DataFrame (df.attrs)
+    
+    Args:
+        df: DataFrame issu d'un nettoyage
+        metrics: {nom_métrique: valeur}
+    
+    Returns:
+        pd.DataFrame: Le même DataFrame
+    """
+    df.attrs[DQ_METRICS_ATTR] = {**df.attrs.get(DQ_METRICS_ATTR, {}), **metrics}
+    return df
+
+
+def pop_dq_metrics(df: pd.DataFrame) -> dict:
+    """Retire et renvoie les métriques DQ du DataFrame (avant écriture)"""
+    return df.attrs.pop(DQ_METRICS_ATTR, {})
+
+
+# ============================================================
+# Règles usuelles
+# ============================================================
+
+def not_null(column: str, reason: str) -> Rule:
+    """Erreur si la colonne est nulle (ou absente)"""
+    def check(df: pd.DataFrame):
+        if column not in df.columns:
+            return np.ones(len(df), dtype=bool)
+        return df[column].isna()
+    return Rule(f"{column}_not_null", reason, check, (column,))
+
+
+def value_range(
+    column: str,
+    reason: str,
+    minimum: Optional[float] = None,
+    maximum: Optional[float] = None,
+    min_inclusive: bool = True,
+    max_inclusive: bool = True
+) -> Rule:
+    """Erreur si la valeur sort de [minimum, maximum]; nulls ignorés"""
+    def check(df: pd.DataFrame):
+        failed = np.zeros(len(df), dtype=bool)
+        if column not in df.columns:
+            return failed
+        values = df[column].to_numpy(dtype="float64", na_value=np.nan)
+        if minimum is not None:
+            failed |= values < minimum if min_inclusive else values <= minimum
+        if maximum is not None:
+            failed |= values > maximum if max_inclusive else values >= maximum
+        return failed
+    return Rule(f"{column}_range", reason, check, (column,))
+
+
+def allowed_values(column: str, values: List, reason: str) -> Rule:
+    """Erreur si la valeur n'est pas dans la liste; nulls ignorés"""
+    allowed = list(values)
+    def check(df: pd.DataFrame):
+        if column not in df.columns:
+            return np.zeros(len(df), dtype=bool)
+        series = df[column]
+        return series.notna() & ~series.isin(allowed)
+    return Rule(f"{column}_enum", reason, check, (column,))
+
+
+def matches_pattern(column: str, pattern: str, reason: str) -> Rule:
+    """
+    Erreur si la valeur ne correspond pas entièrement au motif; nulls ignorés
+    
+    Le motif compilé est appliqué une fois par valeur distincte (factorize),
+    quel que soit le backend des strings (str.fullmatch Arrow n'accepte pas
+    de motif compilé).
+    """
+    regex = re.compile(pattern)  # Motif invalide => erreur à la compilation, pas au run
+    def check(df: pd.DataFrame):
+        if column not in df.columns:
+            return np.zeros(len(df), dtype=bool)
+        codes, uniques = pd.factorize(df[column])
+        matched = np.array([regex.fullmatch(str(value)) is not None for value in uniques] + [True], dtype=bool)
+        # Code -1 (null) → dernier élément: jamais en erreur
+        return ~matched[codes]
+    return Rule(f"{column}_regex", reason, check, (column,))
+
+
+def unique(columns: List[str], reason: str) -> Rule:
+    """Erreur sur les doublons de la clé (la première occurrence reste valide)"""
+    def check(df: pd.DataFrame):
+        present = [c for c in columns if c in df.columns]
+        if not present:
+            return np.zeros(len(df), dtype=bool)
+        return df.duplicated(subset=present, keep='first')
+    return Rule(f"{'_'.join(columns)}_unique", reason, check, tuple(columns))
+
+
+def freshness(
+    column: str,
+    reason: str,
+    max_future: str = "0s",
+    max_age: Optional[str] = None
+) -> Rule:
+    """
+    Erreur si le timestamp est dans le futur (au-delà de `max_future`) ou
+    plus ancien que `max_age` (durées pandas: "0s", "1h", "3650D"); nulls ignorés
+    """
+    future_tolerance = pd.Timedelta(max_future)
+    age_limit = pd.Timedelta(max_age) if max_age else None
+    def check(df: pd.DataFrame):
+        if column not in df.columns:
+            return np.zeros(len(df), dtype=bool)
+        ts = df[column]
+        now = pd.Timestamp.now(tz='UTC')
+        if ts.dt.tz is None:
+            now = now.tz_localize(None)
+        failed = ts > now + future_tolerance
+        if age_limit is not None:
+            failed |= ts < now - age_limit
+        return failed
+    return Rule(f"{column}_freshness", reason, check, (column,))
+
+
+# ============================================================
+# Règles déclaratives (section `dq_rules` de config.yaml)
+# ============================================================
+
+# Règles par défaut si config.yaml n'a pas de section `dq_rules`
+DEFAULT_DQ_RULES = {
+    'france_time_series': [
+        {'column': 'event_ts', 'type': 'not_null', 'reason': 'Timestamp invalide ou manquant'},
+        {'column': 'load_mw', 'type': 'range', 'min': 0, 'reason': 'load_mw < 0 (impossible physiquement)'},
+        {'column': 'solar_mw', 'type': 'range', 'min': 0, 'reason': 'solar_mw < 0 (impossible physiquement)'},
+        {'column': 'wind_mw', 'type': 'range', 'min': 0, 'reason': 'wind_mw < 0 (impossible physiquement)'},
+        {'column': 'event_ts', 'type': 'freshness', 'reason': 'Timestamp futur'},
+    ],
+    'eurostat_electricity_france': [],
+    'time_series_60min_sample': [
+        {'column': 'event_ts', 'type': 'not_null', 'reason': 'Timestamp invalide'},
+    ],
+    'renewable_power_plants_FR': [
+        {'column': 'electrical_capacity', 'type': 'range', 'min': 0, 'min_inclusive': False,
+         'reason': 'Capacité <= 0'},
+    ],
+}
+
+
+def compile_rule(spec: dict) -> Rule:
+    """
+    Compile une règle déclarative en règle vectorisée
+    
+    Types: not_null, range (min/max, min_inclusive/max_inclusive), enum
+    (values), regex (pattern), unique (column ou columns), freshness
+    (max_future, max_age).
+    
+    Args:
+        spec: Entrée de `dq_rules.<source>` (config.yaml)
+    
+    Returns:
+        Rule
+    
+    Raises:
+        ValueError: Type inconnu ou paramètre manquant
+    """
+    rule_type = spec.get('type')
+    column = spec.get('column')
+    columns = spec.get('columns') or ([column] if column else [])
+    if not columns:
+        raise ValueError(f"Règle DQ sans colonne: {spec}")
+    
+    label = ', '.join(columns)
+    reason = spec.get('reason')
+    
+    if rule_type == 'not_null':
+        return not_null(column, reason or f"{label} manquant")
+    if rule_type == 'range':
+        if spec.get('min') is None and spec.get('max') is None:
+            raise ValueError(f"Règle range sans min ni max: {spec}")
+        return value_range(
+            column, reason or f"{label} hors bornes [{spec.get('min')}, {spec.get('max')}]",
+            minimum=spec.get('min'), maximum=spec.get('max'),
+            min_inclusive=spec.get('min_inclusive', True), max_inclusive=spec.get('max_inclusive', True)
+        )
+    if rule_type == 'enum':
+        if not spec.get('values'):
+            raise ValueError(f"Règle enum sans values: {spec}")
+        return allowed_values(column, spec['values'], reason or f"{label} hors valeurs autorisées")
+    if rule_type == 'regex':
+        if not spec.get('pattern'):
+            raise ValueError(f"Règle regex sans pattern: {spec}")
+        return matches_pattern(column, spec['pattern'], reason or f"{label} format invalide")
+    if rule_type == 'unique':
+        return unique(columns, reason or f"{label} en double")
+    if rule_type == 'freshness':
+        return freshness(
+            column, reason or f"{label} hors fenêtre de fraîcheur",
+            max_future=str(spec.get('max_future', '0s')), max_age=spec.get('max_age')
+        )
+    raise ValueError(f"Type de règle DQ inconnu: {rule_type}")
+
+
+def compile_rules(specs: List[dict]) -> Tuple[Rule, ...]:
+    """Compile une liste de règles déclaratives (ordre = bits du masque)"""
+    return tuple(compile_rule(spec) for spec in specs or [])
+
+
+@lru_cache(maxsize=None)
+def load_dq_rules(config_path: str = "conf/config.yaml") -> Dict[str, Tuple[Rule, ...]]:
+    """
+    Règles compilées par source (une compilation par process)
+    
+    Une source absente de `dq_rules` garde ses règles par défaut.
+    
+    Args:
+        config_path: Chemin vers config.yaml
+    
+    Returns:
+        Dict[source, règles]
+    """
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+    except OSError:
+        config = {}
+    
+    specs = {**DEFAULT_DQ_RULES, **(config.get('dq_rules') or {})}
+    return {source: compile_rules(source_specs) for source, source_specs in specs.items()}
+
+
+def source_rules(source: str, config_path: str = "conf/config.yaml") -> List[Rule]:
+    """
+    Règles compilées d'une source
+    
+    Args:
+        source: Nom de la source (section `sources`)
+        config_path: Chemin vers config.yaml
+    
+    Returns:
+        List[Rule]
+    """
+    return list(load_dq_rules(config_path).get(source, ()))
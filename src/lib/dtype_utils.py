@@ -0,0 +1,356 @@
+"""
+Optimisation des dtypes des sorties SILVER (mémoire et taille Parquet)
+et backend des dtypes en mémoire (numpy ou Arrow)
+"""
+
+import json
+import os
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import yaml
+
+
+# Clé des métadonnées Parquet: colonnes constantes retirées du fichier
+CONSTANTS_METADATA_KEY = "silver.constant_columns"
+
+# Réglages par défaut (section `silver.dtypes` de config.yaml)
+DEFAULT_DTYPE_OPTIONS = {
+    'enabled': True,
+    'float_tolerance': 0.0,
+    'category_max_ratio': 0.5,
+    'drop_constants': False,
+    'keep_columns': ['event_ts'],
+}
+
+# Backends des DataFrames (clé `dtype_backend` de config.yaml)
+DTYPE_BACKENDS = ("numpy", "pyarrow")
+
+# Variable d'environnement prioritaire sur config.yaml (ex: benchmark.py --dtype-backend)
+DTYPE_BACKEND_ENV = "DWH_DTYPE_BACKEND"
+
+
+@lru_cache(maxsize=None)
+def _load_dtype_options(config_path: str) -> tuple:
+    """Lit `silver.dtypes` de la config (une fois par process)"""
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+    except OSError:
+        config = {}
+    return tuple(((config.get('silver') or {}).get('dtypes') or {}).items())
+
+
+def load_dtype_options(config_path: str = "conf/config.yaml") -> dict:
+    """
+    Réglages d'optimisation des dtypes: défauts + `silver.dtypes` de config.yaml
+    
+    Args:
+        config_path: Chemin vers config.yaml
+    
+    Returns:
+        dict: Réglages (float_tolerance, category_max_ratio, drop_constants, ...)
+    """
+    return {**DEFAULT_DTYPE_OPTIONS, **dict(_load_dtype_options(config_path))}
+
+
+@lru_cache(maxsize=None)
+def load_dtype_backend(config_path: str = "conf/config.yaml") -> str:
+    """
+    Backend des dtypes en mémoire (`dtype_backend` de config.yaml,
+    surchargeable par la variable d'environnement DWH_DTYPE_BACKEND)
+    
+    - numpy: dtypes pandas par défaut (object / str, float64, datetime64)
+    - pyarrow: colonnes pd.ArrowDtype de la lecture CSV BRONZE jusqu'à
+      GOLD (string[pyarrow], double[pyarrow], ...), nulls natifs
+    
+    Args:
+        config_path: Chemin vers config.yaml
+    
+    Returns:
+        str: "numpy" ou "pyarrow"
+    
+    Raises:
+        ValueError: Si le backend est inconnu
+    """
+    backend = os.environ.get(DTYPE_BACKEND_ENV)
+    if not backend:
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                config = yaml.safe_load(f) or {}
+        except OSError:
+            config = {}
+        backend = config.get('dtype_backend') or "numpy"
+    if backend not in DTYPE_BACKENDS:
+        raise ValueError(f"dtype_backend inconnu: {backend} (attendu: {', '.join(DTYPE_BACKENDS)})")
+    return backend
+
+
+def _arrow_dtype(pa_type: pa.DataType) -> Optional[pd.ArrowDtype]:
+    """ArrowDtype pour tous les types sauf dictionnaires (→ category pandas)"""
+    return None if pa.types.is_dictionary(pa_type) else pd.ArrowDtype(pa_type)
+
+
+def arrow_types_mapper(backend: Optional[str] = None) -> Optional[Callable]:
+    """
+    `types_mapper` de Table.to_pandas pour le backend choisi
+    
+    En mode pyarrow, les colonnes restent des buffers Arrow (aucune
+    conversion en objets Python) et la réécriture Parquet est sans copie.
+    
+    Args:
+        backend: "numpy" ou "pyarrow" (None = config.yaml)
+    
+    Returns:
+        Callable ou None (conversion pandas par défaut)
+    """
+    return _arrow_dtype if (backend or load_dtype_backend()) == "pyarrow" else None
+
+
+def is_arrow_backed(values: pd.Series) -> bool:
+    """True si la colonne est une pd.ArrowDtype"""
+    return isinstance(values.dtype, pd.ArrowDtype)
+
+
+def coerce_numeric(values: pd.Series) -> pd.Series:
+    """
+    pd.to_numeric(errors='coerce') quel que soit le backend
+    
+    Sur une colonne Arrow, pandas renvoie NaN (et non null) pour les
+    valeurs non numériques: elles sont ramenées à null pour que isna(),
+    fillna() et les règles not_null se comportent comme en numpy.
+    
+    Args:
+        values: Colonne texte ou numérique
+    
+    Returns:
+        pd.Series: Colonne numérique (double[pyarrow] / int64[pyarrow] en mode Arrow)
+    """
+    numeric = pd.to_numeric(values, errors='coerce')
+    if not is_arrow_backed(numeric) or not pa.types.is_floating(numeric.dtype.pyarrow_dtype):
+        return numeric
+    array = pa.array(numeric.array)
+    array = pc.if_else(pc.is_nan(array), pa.scalar(None, array.type), array)
+    return pd.Series(pd.arrays.ArrowExtensionArray(array), index=numeric.index, name=numeric.name)
+
+
+def _is_float64(dtype) -> bool:
+    """float64 numpy ou double[pyarrow]"""
+    if isinstance(dtype, pd.ArrowDtype):
+        return pa.types.is_float64(dtype.pyarrow_dtype)
+    return dtype == np.float64
+
+
+def _is_plain_integer(dtype) -> bool:
+    """Entier numpy ou entier Arrow (les entiers nullables pandas Int64 sont laissés tels quels)"""
+    if isinstance(dtype, pd.ArrowDtype):
+        return pa.types.is_integer(dtype.pyarrow_dtype)
+    return pd.api.types.is_integer_dtype(dtype) and not isinstance(dtype, pd.api.extensions.ExtensionDtype)
+
+
+def _float32_is_lossless(values: pd.Series, tolerance: float) -> bool:
+    """
+    float64 → float32 sans écart relatif > tolerance (NaN, nulls et infinis conservés)
+    
+    L'arrondi float32 peut atteindre 2^-24 (~6e-8) en relatif: une tolérance
+    au-delà accepterait toute colonne. 0 = aller-retour exact exigé.
+    """
+    original = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    with np.errstate(over='ignore', invalid='ignore'):
+        converted = original.astype(np.float32).astype(np.float64)
+    finite = np.isfinite(original)
+    if not np.array_equal(np.isfinite(converted), finite):
+        return False
+    return bool(np.all(np.abs(converted[finite] - original[finite]) <= tolerance * np.abs(original[finite])))
+
+
+def _constant_value(values: pd.Series):
+    """Valeur JSON d'une colonne constante (None = colonne entièrement vide)"""
+    value = values.iloc[0]
+    if pd.isna(value):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def optimize_dtypes(df: pd.DataFrame, options: Optional[dict] = None) -> Tuple[pd.DataFrame, dict, dict]:
+    """
+    Réduit l'empreinte d'une table avant écriture
+    
+    - float64 → float32 si l'aller-retour est exact (écart relatif <= `float_tolerance`, 0 par défaut)
+    - entiers → plus petit type signé qui contient toutes les valeurs
+    - strings à faible cardinalité (distinctes / lignes <= `category_max_ratio`)
+      → category (dictionnaire Parquet)
+    - colonnes constantes → retirées, à stocker en métadonnées du fichier
+      (voir constants_metadata / restore_constants), si `drop_constants`.
+      Les fichiers ne se relisent alors complets que via
+      lib.parquet_utils.read_table. Par défaut elles sont gardées: une
+      string constante passe en category (dictionnaire Parquet à une valeur)
+    
+    Args:
+        df: Table à optimiser
+        options: Réglages (None = `silver.dtypes` de config.yaml)
+    
+    Returns:
+        Tuple[table optimisée, colonnes constantes {colonne: {value, dtype}},
+        rapport {bytes_before, bytes_after, float32, integers, categories, constants}]
+    """
+    options = {**DEFAULT_DTYPE_OPTIONS, **(options if options is not None else load_dtype_options())}
+    report = {
+        'bytes_before': int(df.memory_usage(deep=True).sum()),
+        'float32': [], 'integers': [], 'categories': [], 'constants': [],
+    }
+    constants = {}
+    keep = set(options['keep_columns'] or [])
+    columns = {}
+    
+    for name in df.columns:
+        values = df[name]
+        
+        if (options['drop_constants'] and name not in keep and len(df) > 1
+                and values.nunique(dropna=False) == 1):
+            constants[name] = {'value': _constant_value(values), 'dtype': str(values.dtype)}
+            report['constants'].append(name)
+            continue
+        
+        if _is_float64(values.dtype) and _float32_is_lossless(values, options['float_tolerance']):
+            values = values.astype("float[pyarrow]" if is_arrow_backed(values) else np.float32)
+            report['float32'].append(name)
+        elif _is_plain_integer(values.dtype):
+            downcast = pd.to_numeric(values, downcast='integer')
+            if downcast.dtype != values.dtype:
+                values = downcast
+                report['integers'].append(name)
+        elif pd.api.types.is_string_dtype(values) and not isinstance(values.dtype, pd.CategoricalDtype):
+            if len(values) > 1 and values.nunique() <= options['category_max_ratio'] * len(values):
+                values = values.astype('category')
+                report['categories'].append(name)
+        elif isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.cat.remove_unused_categories()
+        
+        columns[name] = values
+    
+    # Jamais de fichier sans colonne: la première constante est conservée
+    if not columns and constants:
+        name = next(iter(constants))
+        del constants[name]
+        report['constants'].remove(name)
+        columns[name] = df[name]
+    
+    optimized = pd.DataFrame(columns, index=df.index)
+    optimized.attrs = dict(df.attrs)
+    report['bytes_after'] = int(optimized.memory_usage(deep=True).sum())
+    
+    return optimized, constants, report
+
+
+def constants_metadata(constants: dict, columns: list) -> Dict[str, str]:
+    """
+    Métadonnées Parquet décrivant les colonnes constantes retirées
+    
+    Args:
+        constants: {colonne: {value, dtype}} (voir optimize_dtypes)
+        columns: Ordre des colonnes d'origine
+    
+    Returns:
+        dict: {clé: JSON} à fusionner dans les métadonnées du schéma (vide si aucune)
+    """
+    if not constants:
+        return {}
+    return {CONSTANTS_METADATA_KEY: json.dumps({'columns': list(columns), 'constants': constants}, ensure_ascii=False)}
+
+
+def restore_constants(df: pd.DataFrame, metadata: Optional[dict], columns: Optional[list] = None) -> pd.DataFrame:
+    """
+    Recrée les colonnes constantes décrites dans les métadonnées d'un fichier
+    
+    Args:
+        df: Table lue
+        metadata: Métadonnées du schéma Arrow (bytes → bytes)
+        columns: Colonnes demandées à la lecture (None = toutes)
+    
+    Returns:
+        pd.DataFrame: Table avec colonnes constantes, dans l'ordre d'origine
+    """
+    raw = (metadata or {}).get(CONSTANTS_METADATA_KEY.encode())
+    if raw is None:
+        return df
+    
+    spec = json.loads(raw)
+    wanted = spec['columns'] if columns is None else [c for c in columns if c in spec['columns']]
+    for name, constant in spec['constants'].items():
+        if name not in wanted:
+            continue
+        df[name] = pd.Series([constant['value']] * len(df), index=df.index, dtype=object).astype(constant['dtype'])
+    
+    return df[[c for c in wanted if c in df.columns] + [c for c in df.columns if c not in wanted]]
+
+
+def restore_plain_dtypes(df: pd.DataFrame, backend: Optional[str] = None) -> pd.DataFrame:
+    """
+    Dtypes de travail d'une table optimisée (category → valeurs, float32 → float64,
+    petits entiers → int64), pour les traitements qui ajoutent des libellés
+    ou agrègent en pleine précision
+    
+    En mode pyarrow, les colonnes sont ramenées aux types Arrow de travail
+    (string, double, int64) au lieu des dtypes numpy.
+    
+    Args:
+        df: Table lue
+        backend: "numpy" ou "pyarrow" (None = config.yaml)
+    
+    Returns:
+        pd.DataFrame: Même table, dtypes "pandas par défaut"
+    """
+    if (backend or load_dtype_backend()) == "pyarrow":
+        return _restore_arrow_dtypes(df)
+    
+    for name, dtype in df.dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            df[name] = df[name].astype(dtype.categories.dtype)
+        elif dtype == np.float32:
+            df[name] = df[name].astype(np.float64)
+        elif pd.api.types.is_integer_dtype(dtype) and not isinstance(dtype, pd.api.extensions.ExtensionDtype) \
+                and dtype.itemsize < 8:
+            df[name] = df[name].astype(np.int64)
+    return df
+
+
+def _restore_arrow_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """restore_plain_dtypes en mode pyarrow (category → valeurs, float → double, petits entiers → int64)"""
+    for name, dtype in df.dtypes.items():
+        if isinstance(dtype, pd.ArrowDtype):
+            if pa.types.is_floating(dtype.pyarrow_dtype) and dtype.pyarrow_dtype.bit_width < 64:
+                df[name] = df[name].astype("double[pyarrow]")
+            elif pa.types.is_integer(dtype.pyarrow_dtype) and dtype.pyarrow_dtype.bit_width < 64:
+                df[name] = df[name].astype("int64[pyarrow]")
+            continue
+        values = pa.array(df[name], from_pandas=True)
+        if pa.types.is_dictionary(values.type):
+            values = values.dictionary_decode()
+        if pa.types.is_large_string(values.type):
+            values = values.cast(pa.string())
+        df[name] = pd.Series(pd.arrays.ArrowExtensionArray(values), index=df.index, name=name)
+    return df
+
+
+def format_bytes_saved(report: dict) -> str:
+    """
+    Résumé lisible d'un rapport d'optimisation
+    
+    Args:
+        report: Rapport de optimize_dtypes
+    
+    Returns:
+        str: Ex: "12.3 Mo → 4.1 Mo (-67%)"
+    """
+    before, after = report['bytes_before'], report['bytes_after']
+    ratio = (after - before) / before if before else 0.0
+    return f"{before / 1e6:.1f} Mo → {after / 1e6:.1f} Mo ({ratio:+.0%})"
@@ -0,0 +1,740 @@
+"""
+Utilitaires Parquet partagés par les couches BRONZE / SILVER / GOLD
+"""
+
+import json
+import os
+import re
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import yaml
+
+from lib.dtype_utils import arrow_types_mapper, restore_constants
+
+
+# Nom des fichiers d'une partition: part-<run>-<uuid>.parquet
+# <run> = horodatage de l'ingest, identique pour tous les fichiers d'un même run
+PART_FILE_PATTERN = re.compile(r"^part-(\d{8}T\d{12})-[0-9a-f]+\.parquet$")
+
+
+# Réglages d'écriture par défaut (section `parquet` de config.yaml)
+DEFAULT_WRITE_OPTIONS = {
+    'compression': 'snappy',
+    'compression_level': None,
+    'row_group_size': 1_000_000,
+    'dictionary_columns': None,
+    'byte_stream_split': False,
+    'delta_encoding': False,
+}
+
+
+@lru_cache(maxsize=None)
+def _load_write_options(config_path: str) -> tuple:
+    """Lit la section `parquet` de la config (une fois par process)"""
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+    except OSError:
+        config = {}
+    return tuple((config.get('parquet') or {}).items())
+
+
+def load_write_options(config_path: str = "conf/config.yaml") -> dict:
+    """
+    Réglages d'écriture Parquet: défauts + section `parquet` de config.yaml
+    
+    Args:
+        config_path: Chemin vers config.yaml
+    
+    Returns:
+        dict: Réglages (compression, row_group_size, encodages, ...)
+    """
+    return {**DEFAULT_WRITE_OPTIONS, **dict(_load_write_options(config_path))}
+
+
+def parquet_writer_kwargs(schema: pa.Schema, options: Optional[dict] = None) -> dict:
+    """
+    Arguments pyarrow (write_table / ParquetWriter) pour un schéma donné
+    
+    - dictionnaire: colonnes listées dans `dictionary_columns` + colonnes
+      catégorielles (toutes les colonnes si la liste n'est pas définie)
+    - BYTE_STREAM_SPLIT pour les float, DELTA_BINARY_PACKED pour les
+      timestamps et entiers 64 bits (incompatibles avec le dictionnaire)
+    
+    Args:
+        schema: Schéma Arrow de la table
+        options: Réglages (None = config.yaml)
+    
+    Returns:
+        dict: kwargs pour pq.write_table / pq.ParquetWriter
+    """
+    options = {**DEFAULT_WRITE_OPTIONS, **(options if options is not None else load_write_options())}
+    
+    column_encoding = {}
+    for field in schema:
+        if options['byte_stream_split'] and pa.types.is_floating(field.type):
+            column_encoding[field.name] = 'BYTE_STREAM_SPLIT'
+        elif options['delta_encoding'] and (
+                pa.types.is_timestamp(field.type) or pa.types.is_int64(field.type)):
+            column_encoding[field.name] = 'DELTA_BINARY_PACKED'
+    
+    dictionary_columns = options['dictionary_columns']
+    if dictionary_columns is None:
+        use_dictionary = [f.name for f in schema if f.name not in column_encoding]
+    else:
+        use_dictionary = [
+            f.name for f in schema
+            if f.name not in column_encoding
+            and (f.name in dictionary_columns or pa.types.is_dictionary(f.type))
+        ]
+    
+    compression = options['compression'] or 'none'
+    kwargs = {
+        'compression': compression,
+        'use_dictionary': use_dictionary,
+        'write_statistics': True,
+    }
+    if options['compression_level'] is not None and compression in ('zstd', 'gzip', 'brotli'):
+        kwargs['compression_level'] = options['compression_level']
+    if column_encoding:
+        kwargs['column_encoding'] = column_encoding
+    
+    return kwargs
+
+
+def write_parquet_table(
+    data: Union[pd.DataFrame, pa.Table],
+    parquet_file: str,
+    options: Optional[dict] = None,
+    metadata: Optional[Dict[str, str]] = None
+) -> dict:
+    """
+    Writer Parquet partagé par toutes les couches
+    
+    Applique codec, row groups et encodages configurés, puis écrit le
+    sidecar de statistiques.
+    
+    Args:
+        data: DataFrame ou table Arrow
+        parquet_file: Chemin du fichier Parquet
+        options: Réglages (None = section `parquet` de config.yaml)
+        metadata: Métadonnées ajoutées au schéma (ex: colonnes constantes)
+    
+    Returns:
+        dict: Statistiques du fichier écrit
+    """
+    table = data if isinstance(data, pa.Table) else pa.Table.from_pandas(data, preserve_index=False)
+    table = normalize_dictionary_indices(table)
+    if metadata:
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), **metadata})
+    options = {**DEFAULT_WRITE_OPTIONS, **(options if options is not None else load_write_options())}
+    
+    pq.write_table(
+        table,
+        parquet_file,
+        row_group_size=options['row_group_size'],
+        **parquet_writer_kwargs(table.schema, options)
+    )
+    
+    return write_stats_sidecar(parquet_file)
+
+
+def normalize_dictionary_indices(table: pa.Table) -> pa.Table:
+    """
+    Indices int32 pour toutes les colonnes dictionnaire (catégorielles pandas)
+    
+    pandas choisit int8 / int16 selon le nombre de catégories: deux fichiers
+    d'une même table (data.parquet + parts ajoutés) n'auraient alors plus
+    le même schéma Arrow et ne se reliraient pas ensemble.
+    
+    Args:
+        table: Table Arrow
+    
+    Returns:
+        pa.Table: Table au schéma normalisé
+    """
+    fields = [
+        field.with_type(pa.dictionary(pa.int32(), field.type.value_type))
+        if pa.types.is_dictionary(field.type) and field.type.index_type != pa.int32() else field
+        for field in table.schema
+    ]
+    schema = pa.schema(fields, metadata=table.schema.metadata)
+    return table if schema.equals(table.schema) else table.cast(schema)
+
+
+def run_token(ingest_timestamp: pd.Timestamp) -> str:
+    """
+    Identifiant de run triable lexicographiquement (YYYYmmddTHHMMSSffffff)
+    
+    Args:
+        ingest_timestamp: Horodatage de l'ingest
+    
+    Returns:
+        str: Token du run
+    """
+    return ingest_timestamp.strftime("%Y%m%dT%H%M%S%f")
+
+
+def partition_part_file(
+    table_path: str,
+    partition_column: str,
+    partition_value: str,
+    ingest_timestamp: pd.Timestamp
+) -> str:
+    """
+    Chemin d'un nouveau fichier dans une partition Hive (jamais écrasé)
+    
+    <table_path>/<partition_column>=<partition_value>/part-<run>-<uuid>.parquet
+    
+    Args:
+        table_path: Répertoire de la table
+        partition_column: Colonne de partition (ex: _ingest_date)
+        partition_value: Valeur de partition (ex: 2026-01-31)
+        ingest_timestamp: Horodatage de l'ingest (identifie le run)
+    
+    Returns:
+        str: Chemin du fichier Parquet (répertoire créé)
+    """
+    partition_dir = os.path.join(table_path, f"{partition_column}={partition_value}")
+    return table_part_file(partition_dir, ingest_timestamp)
+
+
+def table_part_file(table_path: str, ingest_timestamp: pd.Timestamp) -> str:
+    """
+    Chemin d'un nouveau fichier d'une table non partitionnée (append)
+    
+    <table_path>/part-<run>-<uuid>.parquet, à côté d'un éventuel data.parquet
+    
+    Args:
+        table_path: Répertoire de la table
+        ingest_timestamp: Horodatage du run
+    
+    Returns:
+        str: Chemin du fichier Parquet (répertoire créé)
+    """
+    os.makedirs(table_path, exist_ok=True)
+    
+    file_name = f"part-{run_token(ingest_timestamp)}-{uuid.uuid4().hex[:8]}.parquet"
+    return os.path.join(table_path, file_name)
+
+
+def part_run_token(parquet_file: str) -> Optional[str]:
+    """
+    Token du run qui a écrit un fichier part-<run>-<uuid>.parquet
+    
+    Args:
+        parquet_file: Chemin du fichier
+    
+    Returns:
+        str: Token du run, None si le nom ne suit pas la convention
+    """
+    match = PART_FILE_PATTERN.match(Path(parquet_file).name)
+    return match.group(1) if match else None
+
+
+def list_partitions(table_path: str, partition_column: str) -> List[str]:
+    """
+    Liste les valeurs de partition présentes (triées)
+    
+    Args:
+        table_path: Répertoire de la table
+        partition_column: Colonne de partition
+    
+    Returns:
+        List[str]: Valeurs (ex: ['2026-01-30', '2026-01-31'])
+    """
+    prefix = f"{partition_column}="
+    if not os.path.isdir(table_path):
+        return []
+    return sorted(
+        entry.name[len(prefix):]
+        for entry in os.scandir(table_path)
+        if entry.is_dir() and entry.name.startswith(prefix)
+    )
+
+
+def select_partition_files(
+    table_path: str,
+    partition_column: str = "_ingest_date",
+    partitions: Union[str, List[str], None] = "all",
+    after_run: Optional[str] = None
+) -> List[str]:
+    """
+    Sélectionne les fichiers Parquet des partitions demandées
+    
+    Args:
+        table_path: Répertoire de la table
+        partition_column: Colonne de partition
+        partitions:
+            - "all" / None : tout l'historique
+            - "latest"     : dernière partition
+            - "latest_run" : fichiers du dernier run de la dernière partition
+            - liste        : valeurs de partition choisies
+        after_run: Ne garder que les runs postérieurs à ce token (incrémental)
+    
+    Returns:
+        List[str]: Fichiers Parquet (ordre partition puis run)
+    """
+    values = list_partitions(table_path, partition_column)
+    
+    if partitions in (None, "all"):
+        selected = values
+    elif partitions in ("latest", "latest_run"):
+        selected = values[-1:]
+    else:
+        wanted = {str(p) for p in partitions}
+        selected = [v for v in values if v in wanted]
+    
+    files = []
+    for value in selected:
+        partition_dir = os.path.join(table_path, f"{partition_column}={value}")
+        files.extend(
+            os.path.join(partition_dir, name)
+            for name in sorted(os.listdir(partition_dir))
+            if PART_FILE_PATTERN.match(name)
+        )
+    
+    if partitions == "latest_run" and files:
+        last_run = max(part_run_token(f) for f in files)
+        files = [f for f in files if part_run_token(f) == last_run]
+    
+    if after_run is not None:
+        files = [f for f in files if part_run_token(f) > after_run]
+    
+    return files
+
+
+def read_partitioned_table(
+    table_path: str,
+    partition_column: str = "_ingest_date",
+    partitions: Union[str, List[str], None] = "all",
+    columns: Optional[List[str]] = None,
+    after_run: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Lit une table partitionnée Hive en ne lisant que les partitions choisies
+    
+    La colonne de partition est reconstruite depuis le chemin. Une table
+    non partitionnée (<table>/data.parquet + part-*.parquet ajoutés) est
+    lue telle quelle.
+    
+    Args:
+        table_path: Répertoire de la table
+        partition_column: Colonne de partition
+        partitions: "all", "latest", "latest_run" ou liste de valeurs
+        columns: Colonnes à lire (None = toutes)
+        after_run: Ne lire que les runs postérieurs à ce token
+    
+    Returns:
+        pd.DataFrame
+    
+    Raises:
+        FileNotFoundError: Si aucune donnée n'est trouvée
+    """
+    files = select_partition_files(table_path, partition_column, partitions, after_run)
+    
+    if not files:
+        if after_run is None and not list_partitions(table_path, partition_column) and table_files(table_path):
+            return read_table(table_path, columns=columns)
+        raise FileNotFoundError(f"Aucune partition trouvée: {table_path} ({partitions})")
+    
+    dataset = _partitioned_dataset(files, table_path, partition_column)
+    return dataset.to_table(columns=columns).to_pandas(types_mapper=arrow_types_mapper())
+
+
+def table_files(table_path: str) -> List[str]:
+    """
+    Fichiers Parquet d'une table non partitionnée (data.parquet puis parts par run)
+    
+    Args:
+        table_path: Répertoire de la table
+    
+    Returns:
+        List[str]: Fichiers (vide si la table n'existe pas)
+    """
+    if not os.path.isdir(table_path):
+        return []
+    return [
+        os.path.join(table_path, name)
+        for name in sorted(os.listdir(table_path))
+        if name.endswith(".parquet") and not name.startswith(("_", "."))
+    ]
+
+
+def read_table(table_path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Lit une table non partitionnée (data.parquet + parts ajoutés)
+    
+    Lecture fichier par fichier: les colonnes constantes retirées à
+    l'écriture (métadonnées, voir lib.dtype_utils) sont recréées, et les
+    dtypes qui diffèrent d'un fichier à l'autre sont réconciliés par la
+    concaténation (catégorielles conservées). Avec `dtype_backend: pyarrow`,
+    les colonnes restent des buffers Arrow (pd.ArrowDtype).
+    
+    Args:
+        table_path: Répertoire de la table
+        columns: Colonnes à lire (None = toutes)
+    
+    Returns:
+        pd.DataFrame
+    
+    Raises:
+        FileNotFoundError: Si la table n'a aucun fichier
+    """
+    files = table_files(table_path)
+    if not files:
+        raise FileNotFoundError(f"Table introuvable: {table_path}")
+    
+    frames = []
+    for parquet_file in files:
+        parquet = pq.ParquetFile(parquet_file)
+        schema = parquet.schema_arrow
+        present = None if columns is None else [c for c in columns if c in schema.names]
+        df = parquet.read(columns=present).to_pandas(types_mapper=arrow_types_mapper())
+        frames.append(restore_constants(df, schema.metadata, columns))
+    
+    if len(frames) == 1:
+        return frames[0]
+    
+    categorical = {
+        name for frame in frames for name, dtype in frame.dtypes.items()
+        if isinstance(dtype, pd.CategoricalDtype)
+    }
+    df = pd.concat(frames, ignore_index=True)
+    for name in categorical:
+        if not isinstance(df[name].dtype, pd.CategoricalDtype):
+            df[name] = df[name].astype('category')
+    return df
+
+
+def read_key_range(
+    table_path: str,
+    column: str,
+    lower: pd.Timestamp,
+    upper: pd.Timestamp,
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Lit les lignes d'une table non partitionnée dont `column` est dans [lower, upper]
+    
+    Le filtre est poussé au scan Arrow: les row groups hors plage sont
+    écartés sur leurs statistiques min/max, sans être décodés.
+    
+    Args:
+        table_path: Répertoire de la table
+        column: Colonne de clé (ex: event_ts)
+        lower: Borne basse incluse
+        upper: Borne haute incluse
+        columns: Colonnes à lire (None = toutes)
+    
+    Returns:
+        pd.DataFrame (vide si la table n'existe pas)
+    """
+    files = table_files(table_path)
+    if not files:
+        return pd.DataFrame(columns=columns or [column])
+    
+    dataset = ds.dataset(files, format="parquet")
+    key_type = dataset.schema.field(column).type
+    key = ds.field(column)
+    predicate = (key >= pa.scalar(lower, type=key_type)) & (key <= pa.scalar(upper, type=key_type))
+    return dataset.to_table(columns=columns, filter=predicate).to_pandas(types_mapper=arrow_types_mapper())
+
+
+def delete_key_range(table_path: str, column: str, start: pd.Timestamp, end: pd.Timestamp) -> int:
+    """
+    Supprime d'une table non partitionnée les lignes dont `column` est dans [start, end[
+    
+    Seuls les fichiers dont les statistiques recoupent la fenêtre sont
+    relus puis réécrits (fichier temporaire + rename, sidecar compris).
+    
+    Args:
+        table_path: Répertoire de la table
+        column: Colonne timestamp
+        start: Début de fenêtre (inclus)
+        end: Fin de fenêtre (exclue)
+    
+    Returns:
+        int: Nombre de lignes supprimées
+    """
+    removed = 0
+    for parquet_file in table_files(table_path):
+        stats = read_parquet_stats(parquet_file)['column_stats'].get(column)
+        if not stats or stats['min'] is None:
+            continue
+        if _utc(stats['max']) < start or _utc(stats['min']) >= end:
+            continue
+        
+        table = pq.read_table(parquet_file)
+        values = table.column(column)
+        in_window = pc.and_(
+            pc.greater_equal(values, pa.scalar(start, type=values.type)),
+            pc.less(values, pa.scalar(end, type=values.type))
+        )
+        kept = table.filter(pc.invert(pc.fill_null(in_window, False)))
+        removed += table.num_rows - kept.num_rows
+        
+        if kept.num_rows == table.num_rows:
+            continue
+        if kept.num_rows == 0:
+            os.remove(parquet_file)
+            if os.path.exists(stats_sidecar_path(parquet_file)):
+                os.remove(stats_sidecar_path(parquet_file))
+            continue
+        
+        tmp_dir = os.path.join(table_path, "_rewrite")
+        os.makedirs(tmp_dir, exist_ok=True)
+        tmp_file = os.path.join(tmp_dir, Path(parquet_file).name)
+        write_parquet_table(kept, tmp_file)
+        os.replace(tmp_file, parquet_file)
+        os.replace(stats_sidecar_path(tmp_file), stats_sidecar_path(parquet_file))
+        os.rmdir(tmp_dir)
+    
+    return removed
+
+
+def _utc(value) -> pd.Timestamp:
+    """Timestamp UTC depuis une statistique JSON (ISO-8601, avec ou sans fuseau)"""
+    ts = pd.Timestamp(value)
+    return ts.tz_localize('UTC') if ts.tz is None else ts.tz_convert('UTC')
+
+
+def _partitioned_dataset(files: List[str], table_path: str, partition_column: str) -> ds.Dataset:
+    """Dataset Arrow sur des fichiers de partitions Hive (colonne de partition en string)"""
+    partition_schema = pa.schema([pa.field(partition_column, pa.string())])
+    
+    # Schéma unifié: les colonnes (et string/large_string) peuvent varier d'un run à l'autre
+    schemas = [pq.read_schema(f) for f in files] + [partition_schema]
+    try:
+        schema = pa.unify_schemas(schemas, promote_options="permissive")
+    except TypeError:
+        # pyarrow < 14: pas de promotion de types
+        schema = pa.unify_schemas(schemas)
+    
+    return ds.dataset(
+        files,
+        schema=schema,
+        format="parquet",
+        partitioning=ds.partitioning(partition_schema, flavor="hive"),
+        partition_base_dir=table_path
+    )
+
+
+def plan_row_group_chunks(
+    table_path: str,
+    partition_column: str = "_ingest_date",
+    partitions: Union[str, List[str], None] = "all",
+    chunk_rows: int = 1_000_000
+) -> List[List[Tuple[str, List[int]]]]:
+    """
+    Découpe une table partitionnée en blocs de row groups consécutifs
+    
+    Seuls les footers sont lus. Les blocs respectent l'ordre de lecture de
+    `read_partitioned_table` (fichiers puis row groups), ce qui permet de
+    garder une sémantique "première occurrence" à la fusion.
+    
+    Args:
+        table_path: Répertoire de la table
+        partition_column: Colonne de partition
+        partitions: "all", "latest", "latest_run" ou liste de valeurs
+        chunk_rows: Lignes visées par bloc (un row group n'est jamais coupé)
+    
+    Returns:
+        List[bloc] - bloc = [(fichier, [ids row groups])]; liste vide si
+        la table tient en un seul bloc (ou n'est pas partitionnée)
+    """
+    chunks = []
+    current, current_rows = [], 0
+    
+    for parquet_file in select_partition_files(table_path, partition_column, partitions):
+        metadata = pq.ParquetFile(parquet_file).metadata
+        for rg in range(metadata.num_row_groups):
+            rows = metadata.row_group(rg).num_rows
+            if current and current_rows + rows > chunk_rows:
+                chunks.append(current)
+                current, current_rows = [], 0
+            if current and current[-1][0] == parquet_file:
+                current[-1][1].append(rg)
+            else:
+                current.append((parquet_file, [rg]))
+            current_rows += rows
+    
+    if current:
+        chunks.append(current)
+    
+    return chunks if len(chunks) > 1 else []
+
+
+def read_row_group_chunk(
+    table_path: str,
+    chunk: List[Tuple[str, List[int]]],
+    partition_column: str = "_ingest_date",
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Lit un bloc produit par `plan_row_group_chunks`
+    
+    Args:
+        table_path: Répertoire de la table
+        chunk: [(fichier, [ids row groups])]
+        partition_column: Colonne de partition (reconstruite depuis le chemin)
+        columns: Colonnes à lire (None = toutes)
+    
+    Returns:
+        pd.DataFrame
+    """
+    dataset = _partitioned_dataset([f for f, _ in chunk], table_path, partition_column)
+    fragments = {fragment.path: fragment for fragment in dataset.get_fragments()}
+    
+    tables = [
+        fragments[parquet_file].subset(row_group_ids=row_groups).to_table(schema=dataset.schema, columns=columns)
+        for parquet_file, row_groups in chunk
+    ]
+    return pa.concat_tables(tables).to_pandas(types_mapper=arrow_types_mapper())
+
+
+def stats_sidecar_path(parquet_file: str) -> str:
+    """
+    Chemin du sidecar de statistiques d'un fichier Parquet
+    
+    Préfixe "_" : ignoré par les lecteurs Parquet (pyarrow, Spark).
+    
+    Args:
+        parquet_file: Chemin du fichier Parquet
+    
+    Returns:
+        str: <dir>/_<fichier>.stats.json
+    """
+    path = Path(parquet_file)
+    return str(path.parent / f"_{path.stem}.stats.json")
+
+
+def _json_value(value):
+    """Convertit une statistique Parquet en valeur JSON"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, bytes):
+        return value.decode('utf-8', errors='replace')
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+def collect_parquet_stats(parquet_file: str) -> dict:
+    """
+    Statistiques d'un fichier Parquet lues depuis le footer uniquement
+    
+    Aucune page de données n'est décodée: les compteurs et min/max
+    viennent des statistiques des row groups écrites par le writer.
+    
+    Args:
+        parquet_file: Chemin du fichier Parquet
+    
+    Returns:
+        dict: {file, rows, bytes, row_groups, columns, column_stats}
+    """
+    metadata = pq.read_metadata(parquet_file)
+    schema = metadata.schema.to_arrow_schema()
+    
+    column_stats = {}
+    for col_idx, field in enumerate(schema):
+        null_count = 0
+        minimum = None
+        maximum = None
+        complete = True
+        
+        for rg_idx in range(metadata.num_row_groups):
+            column = metadata.row_group(rg_idx).column(col_idx)
+            stats = column.statistics
+            if stats is None:
+                complete = False
+                continue
+            if stats.has_null_count:
+                null_count += stats.null_count
+            else:
+                complete = False
+            if stats.has_min_max:
+                minimum = stats.min if minimum is None else min(minimum, stats.min)
+                maximum = stats.max if maximum is None else max(maximum, stats.max)
+        
+        column_stats[field.name] = {
+            'type': str(field.type),
+            'null_count': null_count if complete else None,
+            'min': _json_value(minimum),
+            'max': _json_value(maximum),
+        }
+    
+    return {
+        'file': Path(parquet_file).name,
+        'rows': metadata.num_rows,
+        'bytes': os.path.getsize(parquet_file),
+        'row_groups': metadata.num_row_groups,
+        'columns': schema.names,
+        'column_stats': column_stats,
+    }
+
+
+def write_stats_sidecar(parquet_file: str) -> dict:
+    """
+    Écrit le sidecar de statistiques d'un fichier Parquet fraîchement écrit
+    
+    Args:
+        parquet_file: Chemin du fichier Parquet
+    
+    Returns:
+        dict: Statistiques écrites
+    """
+    stats = collect_parquet_stats(parquet_file)
+    stats['written_at'] = pd.Timestamp.now().isoformat()
+    
+    with open(stats_sidecar_path(parquet_file), 'w', encoding='utf-8') as f:
+        json.dump(stats, f, indent=2, ensure_ascii=False)
+    
+    return stats
+
+
+def read_parquet_stats(parquet_file: str) -> dict:
+    """
+    Statistiques d'un fichier Parquet: sidecar si présent, sinon footer
+    
+    Args:
+        parquet_file: Chemin du fichier Parquet
+    
+    Returns:
+        dict: Statistiques (voir collect_parquet_stats)
+    """
+    sidecar = stats_sidecar_path(parquet_file)
+    if os.path.exists(sidecar):
+        try:
+            with open(sidecar, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+    return collect_parquet_stats(parquet_file)
+
+
+def summarize_layer(layer_path: str) -> dict:
+    """
+    Résumé d'une couche (fichiers, lignes, octets) sans lire les données
+    
+    Args:
+        layer_path: Répertoire de la couche (bronze/, silver/, ...)
+    
+    Returns:
+        dict: {files, rows, bytes}
+    """
+    summary = {'files': 0, 'rows': 0, 'bytes': 0}
+    for parquet_file in Path(layer_path).rglob("*.parquet"):
+        stats = read_parquet_stats(str(parquet_file))
+        summary['files'] += 1
+        summary['rows'] += stats['rows']
+        summary['bytes'] += stats['bytes']
+    return summary
@@ -83,7 +83,8 @@ def load_dataframe_to_postgres(
     df: pd.DataFrame,
     table_name: str,
     config: dict,
-    if_exists: str = "replace"
+    if_exists: str = "replace",
+    chunksize: int = 1000
 ) -> int:
     """
     Charge un DataFrame Pandas dans PostgreSQL
@@ -93,6 +94,7 @@ def load_dataframe_to_postgres(
         table_name: Nom de la table (sans schéma)
         config: Configuration
         if_exists: 'fail', 'replace', 'append'
+        chunksize: Lignes par INSERT multi-lignes
         
     Returns:
         int: Nombre de lignes chargées
@@ -111,7 +113,7 @@ def load_dataframe_to_postgres(
             if_exists=if_exists,
             index=False,
             method='multi',
-            chunksize=1000
+            chunksize=chunksize
         )
         
         print(f"    ✅ {len(df):,} lignes chargées dans {schema}.{table_name}")
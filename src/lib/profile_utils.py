@@ -0,0 +1,335 @@
+"""
+Profils de tables (sidecar _profile.json) écrits par SILVER et GOLD
+
+Un profil décrit une table sans la relire: nombre de lignes, puis par
+colonne le dtype, le nombre de nulls, min / max, une estimation du nombre
+de valeurs distinctes et, pour les colonnes à faible cardinalité, la liste
+des valeurs. La couverture temporelle (colonne de temps, bornes, lignes par
+mois) permet à l'aval de choisir des plages sans scan complet.
+
+Le nombre de distincts est estimé par un sketch KMV ("k minimum values"):
+les k plus petits hashs 64 bits des valeurs distinctes. Le sketch est exact
+tant que la colonne a moins de k valeurs distinctes, et deux profils se
+fusionnent sans relire les données (ajouts incrémentaux).
+"""
+
+import json
+import os
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import yaml
+from pandas.util import hash_pandas_object
+
+from lib.parquet_utils import read_table
+
+
+# Préfixe "_": ignoré par les lecteurs Parquet (pyarrow, Spark)
+PROFILE_FILE = "_profile.json"
+
+# Colonne de temps préférée pour la couverture temporelle
+TIME_COLUMN = "event_ts"
+
+# Réglages par défaut (section `profile` de config.yaml)
+DEFAULT_PROFILE_OPTIONS = {
+    'enabled': True,
+    'sketch_size': 128,
+    'max_values': 64,
+}
+
+_HASH_SPACE = float(2 ** 64)
+
+
+@lru_cache(maxsize=None)
+def _load_profile_options(config_path: str) -> tuple:
+    """Lit `profile` de la config (une fois par process)"""
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+    except OSError:
+        config = {}
+    return tuple((config.get('profile') or {}).items())
+
+
+def load_profile_options(config_path: str = "conf/config.yaml") -> dict:
+    """
+    Réglages des profils: défauts + `profile` de config.yaml
+    
+    Args:
+        config_path: Chemin vers config.yaml
+    
+    Returns:
+        dict: Réglages (enabled, sketch_size, max_values)
+    """
+    return {**DEFAULT_PROFILE_OPTIONS, **dict(_load_profile_options(config_path))}
+
+
+def profile_path(table_path: str) -> str:
+    """Chemin du profil d'une table: <table>/_profile.json"""
+    return os.path.join(table_path, PROFILE_FILE)
+
+
+def _json_value(value):
+    """Convertit une valeur pandas / NumPy en valeur JSON"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, (bool, int, float, str)):
+        return value
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return str(value)
+
+
+def _bound(values: pd.Series, bound: str):
+    """min / max des valeurs distinctes (types non comparables: None)"""
+    try:
+        return _json_value(getattr(values, bound)())
+    except TypeError:
+        return None
+
+
+def _sorted_values(values: list) -> list:
+    """Valeurs triées (types mêlés: triées par leur texte)"""
+    try:
+        return sorted(values)
+    except TypeError:
+        return sorted(values, key=str)
+
+
+def _distinct_estimate(sketch: List[int], sketch_size: int) -> int:
+    """Estimation KMV: exacte si le sketch n'est pas plein, sinon (k - 1) / hash_k normalisé"""
+    if len(sketch) < sketch_size:
+        return len(sketch)
+    return int(round((sketch_size - 1) * _HASH_SPACE / (sketch[-1] + 1)))
+
+
+def _column_profile(values: pd.Series, options: dict) -> dict:
+    """Profil d'une colonne (une factorisation, valeurs distinctes hachées une fois)"""
+    codes, uniques = pd.factorize(values)
+    distinct = pd.Series(np.asarray(uniques, dtype=object) if isinstance(values.dtype, pd.CategoricalDtype) else uniques)
+    
+    hashes = np.sort(hash_pandas_object(distinct, index=False).to_numpy())
+    sketch = [int(h) for h in hashes[:options['sketch_size']]]
+    
+    profile = {
+        'type': str(values.dtype),
+        'null_count': int((codes == -1).sum()),
+        'min': _bound(distinct, 'min') if len(distinct) else None,
+        'max': _bound(distinct, 'max') if len(distinct) else None,
+        'distinct': len(distinct),
+        'sketch': sketch,
+    }
+    if len(distinct) <= options['max_values']:
+        profile['values'] = _sorted_values([_json_value(v) for v in distinct])
+    return profile
+
+
+def _time_coverage(df: pd.DataFrame) -> Optional[dict]:
+    """Couverture de la colonne de temps (event_ts, sinon 1re colonne datetime)"""
+    candidates = [TIME_COLUMN] + [c for c in df.columns if c != TIME_COLUMN]
+    column = next((
+        c for c in candidates
+        if c in df.columns and pd.api.types.is_datetime64_any_dtype(df[c].dtype)
+    ), None)
+    if column is None:
+        return None
+    
+    ts = df[column].dropna()
+    months = {}
+    if len(ts):
+        keys, counts = np.unique((ts.dt.year * 100 + ts.dt.month).to_numpy(dtype=np.int64), return_counts=True)
+        months = {f"{key // 100:04d}-{key % 100:02d}": int(n) for key, n in zip(keys, counts)}
+    
+    return {
+        'column': column,
+        'start': _json_value(ts.min()) if len(ts) else None,
+        'end': _json_value(ts.max()) if len(ts) else None,
+        'months': months,
+    }
+
+
+def build_profile(df: pd.DataFrame, options: Optional[dict] = None) -> dict:
+    """
+    Profil d'une table en mémoire
+    
+    Args:
+        df: Table
+        options: Réglages (None = config.yaml)
+    
+    Returns:
+        dict: {rows, sketch_size, columns: {nom: profil}, time, written_at}
+    """
+    options = options if options is not None else load_profile_options()
+    return {
+        'rows': len(df),
+        'sketch_size': options['sketch_size'],
+        'columns': {str(name): _column_profile(df[name], options) for name in df.columns},
+        'time': _time_coverage(df),
+        'written_at': pd.Timestamp.now().isoformat(),
+    }
+
+
+def _merge_bound(left, right, pick):
+    """Fusion de deux min / max JSON (None si non comparables)"""
+    if left is None or right is None:
+        return right if left is None else left
+    try:
+        return pick(left, right)
+    except TypeError:
+        return None
+
+
+def _merge_column(left: dict, right: dict, options: dict) -> dict:
+    """Fusion des profils d'une même colonne"""
+    sketch = sorted(set(left['sketch']) | set(right['sketch']))[:options['sketch_size']]
+    merged = {
+        'type': right['type'],
+        'null_count': left['null_count'] + right['null_count'],
+        'min': _merge_bound(left['min'], right['min'], min),
+        'max': _merge_bound(left['max'], right['max'], max),
+        'distinct': _distinct_estimate(sketch, options['sketch_size']),
+        'sketch': sketch,
+    }
+    if 'values' in left and 'values' in right:
+        values = _sorted_values(list(dict.fromkeys(left['values'] + right['values'])))
+        if len(values) <= options['max_values']:
+            merged['values'] = values
+    return merged
+
+
+def merge_profiles(left: dict, right: dict, options: Optional[dict] = None) -> dict:
+    """
+    Fusionne le profil d'une table et celui de lignes ajoutées
+    
+    Une colonne absente d'un côté est comptée nulle sur les lignes de ce côté.
+    
+    Args:
+        left: Profil existant
+        right: Profil des lignes ajoutées
+        options: Réglages (None = config.yaml)
+    
+    Returns:
+        dict: Profil fusionné
+    """
+    options = options if options is not None else load_profile_options()
+    columns = {}
+    for name in dict.fromkeys(list(left['columns']) + list(right['columns'])):
+        absent = {'null_count': 0, 'min': None, 'max': None, 'sketch': []}
+        a = left['columns'].get(name) or {**absent, 'null_count': left['rows'], 'type': None}
+        b = right['columns'].get(name) or {**absent, 'null_count': right['rows'], 'type': a['type']}
+        columns[name] = _merge_column(a, b, options)
+    
+    time = left['time'] or right['time']
+    if left['time'] and right['time'] and left['time']['column'] == right['time']['column']:
+        months = dict(left['time']['months'])
+        for month, n in right['time']['months'].items():
+            months[month] = months.get(month, 0) + n
+        time = {
+            'column': left['time']['column'],
+            'start': _merge_bound(left['time']['start'], right['time']['start'], min),
+            'end': _merge_bound(left['time']['end'], right['time']['end'], max),
+            'months': dict(sorted(months.items())),
+        }
+    
+    return {
+        'rows': left['rows'] + right['rows'],
+        'sketch_size': options['sketch_size'],
+        'columns': columns,
+        'time': time,
+        'written_at': pd.Timestamp.now().isoformat(),
+    }
+
+
+def read_profile(table_path: str) -> Optional[dict]:
+    """
+    Profil d'une table (None si absent ou illisible)
+    
+    Args:
+        table_path: Répertoire de la table
+    
+    Returns:
+        Optional[dict]
+    """
+    try:
+        with open(profile_path(str(table_path)), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_profile(table_path: str, profile: dict) -> None:
+    """Écrit le profil d'une table de manière atomique (fichier temporaire + rename)"""
+    target = profile_path(table_path)
+    tmp_file = target + ".tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(profile, f, ensure_ascii=False)
+    os.replace(tmp_file, target)
+
+
+def invalidate_profile(table_path: str) -> None:
+    """Supprime le profil d'une table dont des lignes ont été retirées (recalculé au prochain ajout)"""
+    if os.path.exists(profile_path(table_path)):
+        os.remove(profile_path(table_path))
+
+
+def update_profile(table_path: str, df: pd.DataFrame, append: bool = False, options: Optional[dict] = None) -> Optional[dict]:
+    """
+    Met à jour le profil d'une table après écriture de `df`
+    
+    Reconstruction: profil de `df`. Ajout: profil existant fusionné avec
+    celui de `df`; sans profil existant (table antérieure, fenêtre
+    retraitée), la table complète est relue une fois.
+    
+    Args:
+        table_path: Répertoire de la table
+        df: Lignes écrites (toute la table, ou les lignes ajoutées)
+        append: `df` a été ajouté à la table
+        options: Réglages (None = config.yaml)
+    
+    Returns:
+        Optional[dict]: Profil écrit (None si désactivé)
+    """
+    options = options if options is not None else load_profile_options()
+    if not options['enabled'] or not os.path.isdir(table_path):
+        return None
+    
+    if not append:
+        profile = build_profile(df, options)
+    else:
+        existing = read_profile(table_path)
+        if existing is not None and existing.get('sketch_size') == options['sketch_size']:
+            profile = merge_profiles(existing, build_profile(df, options), options)
+        else:
+            profile = build_profile(read_table(table_path), options)
+    
+    write_profile(table_path, profile)
+    return profile
+
+
+def profile_columns(profile: Optional[dict]) -> Optional[List[str]]:
+    """Colonnes d'une table d'après son profil (None si pas de profil)"""
+    return None if profile is None else list(profile['columns'])
+
+
+def profile_time_range(profile: Optional[dict]) -> Optional[Dict[str, pd.Timestamp]]:
+    """
+    Couverture temporelle d'un profil
+    
+    Args:
+        profile: Profil (ou None)
+    
+    Returns:
+        Optional[dict]: {column, start, end} (None si pas de colonne de temps)
+    """
+    time = (profile or {}).get('time')
+    if not time:
+        return None
+    return {
+        'column': time['column'],
+        'start': pd.Timestamp(time['start']) if time['start'] else None,
+        'end': pd.Timestamp(time['end']) if time['end'] else None,
+    }
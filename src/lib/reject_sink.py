@@ -0,0 +1,341 @@
+"""
+Puits des rejets SILVER: compteurs exacts + échantillon borné de lignes complètes
+
+Mode `summary`: chaque ligne rejetée n'est gardée que sur ses colonnes
+contrôlées (colonnes des règles + event_ts), de quoi produire des
+compteurs exacts par règle et par colonne (valeurs min/max en erreur,
+plage de timestamps). Seul un échantillon de lignes complètes est conservé
+par règle. Mode `full`: toutes les lignes rejetées sont conservées en
+entier (comportement historique).
+
+L'échantillon est un "bottom-k": chaque ligne rejetée reçoit une clé
+pseudo-aléatoire (hash 64 bits de la ligne) et chaque règle garde ses k
+plus petites clés. C'est un échantillon uniforme et reproductible, qui se
+fusionne exactement (blocs, runs incrémentaux): union puis k plus petites clés.
+"""
+
+from functools import lru_cache
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from lib.dedup_utils import row_hash
+
+
+REJECT_MASK_COLUMN = "reject_mask"
+REJECT_REASON_COLUMN = "reject_reason"
+REASON_SEPARATOR = " | "
+
+# Clé d'échantillonnage (hash de la ligne), retirée à l'écriture
+SAMPLE_KEY_COLUMN = "_sample_key"
+
+# Colonne temporelle des plages de rejets (si présente)
+TIME_COLUMN = "event_ts"
+
+# Libellé des lignes "toutes règles" du résumé
+ALL_RULES = "*"
+
+REJECT_MODES = ("summary", "full")
+
+# Réglages par défaut (section `silver.rejects` de config.yaml)
+DEFAULT_REJECT_OPTIONS = {
+    'mode': 'summary',
+    'sample_size': 1000,
+}
+
+
+class RejectRule(NamedTuple):
+    """
+    Description d'une règle portée par les rejets (sans la fonction de
+    contrôle: les rejets passent entre process)
+    
+    Attributes:
+        name: Identifiant court
+        reason: Libellé de rejet
+        columns: Colonnes contrôlées
+    """
+    name: str
+    reason: str
+    columns: Tuple[str, ...] = ()
+
+
+class Rejects:
+    """
+    Rejets d'un nettoyage
+    
+    Attributes:
+        rows: Toutes les lignes rejetées, colonnes contrôlées seulement
+            (+ reject_mask, _sample_key)
+        sample: Lignes complètes conservées (+ reject_mask, reject_reason,
+            _sample_key): toutes en mode full, k par règle en mode summary
+        rules: Règles ayant produit les masques (bit i = règle i)
+        sample_size: k (None = mode full)
+    """
+    
+    def __init__(
+        self,
+        rows: pd.DataFrame,
+        sample: pd.DataFrame,
+        rules: Tuple[RejectRule, ...],
+        sample_size: Optional[int]
+    ):
+        self.rows = rows
+        self.sample = sample
+        self.rules = rules
+        self.sample_size = sample_size
+    
+    def __len__(self) -> int:
+        """Nombre exact de lignes rejetées"""
+        return len(self.rows)
+    
+    @classmethod
+    def empty(cls) -> "Rejects":
+        """Aucun rejet"""
+        return cls(pd.DataFrame(), pd.DataFrame(), (), None)
+
+
+@lru_cache(maxsize=None)
+def _load_reject_options(config_path: str) -> tuple:
+    """Lit `silver.rejects` de la config (une fois par process)"""
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+    except OSError:
+        config = {}
+    return tuple(((config.get('silver') or {}).get('rejects') or {}).items())
+
+
+def load_reject_options(config_path: str = "conf/config.yaml") -> dict:
+    """
+    Réglages du puits de rejets: défauts + `silver.rejects` de config.yaml
+    
+    Args:
+        config_path: Chemin vers config.yaml
+    
+    Returns:
+        dict: Réglages (mode, sample_size)
+    
+    Raises:
+        ValueError: Si le mode est inconnu
+    """
+    options = {**DEFAULT_REJECT_OPTIONS, **dict(_load_reject_options(config_path))}
+    if options['mode'] not in REJECT_MODES:
+        raise ValueError(f"Mode de rejets inconnu: {options['mode']} (attendu: {', '.join(REJECT_MODES)})")
+    return options
+
+
+def describe_mask(mask: np.ndarray, rules: List) -> np.ndarray:
+    """
+    Traduit les masques en libellés (toutes les raisons d'une ligne)
+    
+    Les libellés sont construits une fois par combinaison distincte de
+    règles, pas par ligne.
+    
+    Args:
+        mask: Masques de rejet
+        rules: Règles ayant produit les masques
+    
+    Returns:
+        np.ndarray: Libellés (ex: "Timestamp futur | load_mw < 0")
+    """
+    codes, combinations = pd.factorize(mask)
+    labels = np.array([
+        REASON_SEPARATOR.join(rule.reason for bit, rule in enumerate(rules) if (int(combo) >> bit) & 1)
+        for combo in combinations
+    ], dtype=object)
+    return labels[codes] if len(labels) else np.array([], dtype=object)
+
+
+def sample_positions(mask: np.ndarray, keys: np.ndarray, n_rules: int, sample_size: Optional[int]) -> np.ndarray:
+    """
+    Lignes de l'échantillon bottom-k: pour chaque règle, les `sample_size`
+    lignes en erreur de plus petite clé
+    
+    Args:
+        mask: Masques de rejet
+        keys: Clés d'échantillonnage (uint64)
+        n_rules: Nombre de règles (bits du masque)
+        sample_size: k par règle (None = toutes les lignes)
+    
+    Returns:
+        np.ndarray: Positions retenues, dans l'ordre d'origine
+    """
+    if sample_size is None:
+        return np.arange(len(mask))
+    
+    selected = np.zeros(len(mask), dtype=bool)
+    for bit in range(n_rules):
+        members = np.flatnonzero((mask >> bit) & 1)
+        if len(members) > sample_size:
+            members = members[np.argpartition(keys[members], sample_size - 1)[:sample_size]]
+        selected[members] = True
+    return np.flatnonzero(selected)
+
+
+def collect_rejects(df: pd.DataFrame, mask: np.ndarray, rules: List, options: Optional[dict] = None) -> Rejects:
+    """
+    Construit les rejets d'une table évaluée (voir dq_rules.split_valid_rejects)
+    
+    Seules les colonnes contrôlées sont extraites pour toutes les lignes
+    rejetées; les lignes complètes ne le sont que pour l'échantillon.
+    
+    Args:
+        df: Données évaluées
+        mask: Masque de rejet de chaque ligne (0 = valide)
+        rules: Règles (name, reason, columns)
+        options: Réglages (None = `silver.rejects` de config.yaml)
+    
+    Returns:
+        Rejects
+    """
+    options = options if options is not None else load_reject_options()
+    sample_size = int(options['sample_size']) if options['mode'] == 'summary' else None
+    meta = tuple(RejectRule(rule.name, rule.reason, tuple(rule.columns)) for rule in rules)
+    
+    rejected = np.flatnonzero(mask != 0)
+    masks = mask[rejected]
+    keys = row_hash(df, positions=rejected)
+    
+    checked = dict.fromkeys([TIME_COLUMN] + [c for rule in meta for c in rule.columns])
+    narrow = [c for c in checked if c in df.columns]
+    rows = df[narrow].take(rejected).reset_index(drop=True)
+    rows[REJECT_MASK_COLUMN] = masks
+    rows[SAMPLE_KEY_COLUMN] = keys
+    
+    kept = sample_positions(masks, keys, len(meta), sample_size)
+    # Colonnes de rejet jointes en un bloc (pas d'insertions sur une table large)
+    sample = df.take(rejected[kept]).reset_index(drop=True)
+    sample = pd.concat([sample, pd.DataFrame({
+        REJECT_MASK_COLUMN: masks[kept],
+        REJECT_REASON_COLUMN: describe_mask(masks[kept], meta),
+        SAMPLE_KEY_COLUMN: keys[kept],
+    })], axis=1)
+    
+    return Rejects(rows, sample, meta, sample_size)
+
+
+def concat_rejects(parts: List[Rejects]) -> Rejects:
+    """
+    Fusionne des rejets d'une même source (blocs, incréments)
+    
+    Les compteurs restent exacts; l'échantillon est ramené à k lignes par
+    règle (plus petites clés de l'union).
+    
+    Args:
+        parts: Rejets à fusionner
+    
+    Returns:
+        Rejects
+    """
+    parts = [part for part in parts if len(part) > 0]
+    if not parts:
+        return Rejects.empty()
+    if len(parts) == 1:
+        return parts[0]
+    
+    first = parts[0]
+    rows = pd.concat([part.rows for part in parts], ignore_index=True)
+    sample = pd.concat([part.sample for part in parts], ignore_index=True)
+    kept = sample_positions(
+        sample[REJECT_MASK_COLUMN].to_numpy(), sample[SAMPLE_KEY_COLUMN].to_numpy(),
+        len(first.rules), first.sample_size
+    )
+    return Rejects(rows, sample.take(kept).reset_index(drop=True), first.rules, first.sample_size)
+
+
+def filter_rejects(rejects: Rejects, predicate: Callable[[pd.DataFrame], pd.Series]) -> Rejects:
+    """
+    Restreint les rejets aux lignes vérifiant `predicate` (ex: fenêtre d'event_ts)
+    
+    Args:
+        rejects: Rejets
+        predicate: df -> masque booléen (évalué sur les lignes et l'échantillon)
+    
+    Returns:
+        Rejects
+    """
+    if len(rejects) == 0:
+        return rejects
+    rows = rejects.rows[predicate(rejects.rows).to_numpy(dtype=bool)].reset_index(drop=True)
+    sample = rejects.sample[predicate(rejects.sample).to_numpy(dtype=bool)].reset_index(drop=True)
+    return Rejects(rows, sample, rejects.rules, rejects.sample_size)
+
+
+def _value_bound(values: pd.Series, bound: str) -> Optional[str]:
+    """min / max d'une série non vide, en texte (types hétérogènes: None)"""
+    try:
+        return str(getattr(values, bound)())
+    except TypeError:
+        return None
+
+
+def _summary_entry(rows: pd.DataFrame, members: np.ndarray, rule: str, reason: Optional[str], column: Optional[str]) -> dict:
+    """Ligne du résumé: lignes en erreur, valeurs en erreur (min / max), plage de temps"""
+    entry = {
+        'rule': rule,
+        'reason': reason,
+        'column': column,
+        'rejected_rows': int(members.sum()),
+        'offending_values': None,
+        'min_value': None,
+        'max_value': None,
+        'first_event_ts': pd.NaT,
+        'last_event_ts': pd.NaT,
+    }
+    if TIME_COLUMN in rows.columns:
+        ts = rows[TIME_COLUMN][members]
+        entry['first_event_ts'], entry['last_event_ts'] = ts.min(), ts.max()
+    if column is not None and column in rows.columns:
+        values = rows[column][members].dropna()
+        entry['offending_values'] = len(values)
+        if len(values):
+            entry['min_value'] = _value_bound(values, 'min')
+            entry['max_value'] = _value_bound(values, 'max')
+    return entry
+
+
+def summarize_rejects(rejects: Rejects, run_ts: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+    """
+    Résumé exact des rejets
+    
+    Une ligne par (règle, colonne contrôlée), une ligne par colonne toutes
+    règles confondues (rule = "*") et une ligne de total (rule = "*",
+    column = None). offending_values = valeurs non nulles en erreur (0 pour
+    un not_null).
+    
+    Args:
+        rejects: Rejets
+        run_ts: Horodatage du run (None = maintenant)
+    
+    Returns:
+        pd.DataFrame: rule, reason, column, rejected_rows, offending_values,
+        min_value, max_value, first_event_ts, last_event_ts, run_ts
+    """
+    if len(rejects) == 0:
+        return pd.DataFrame()
+    
+    rows = rejects.rows
+    masks = rows[REJECT_MASK_COLUMN].to_numpy()
+    entries = []
+    
+    for bit, rule in enumerate(rejects.rules):
+        members = ((masks >> bit) & 1).astype(bool)
+        if members.any():
+            for column in (rule.columns or (None,)):
+                entries.append(_summary_entry(rows, members, rule.name, rule.reason, column))
+    
+    columns = dict.fromkeys(c for rule in rejects.rules for c in rule.columns)
+    for column in columns:
+        column_bits = sum(1 << bit for bit, rule in enumerate(rejects.rules) if column in rule.columns)
+        members = (masks & column_bits) != 0
+        if members.any():
+            entries.append(_summary_entry(rows, members, ALL_RULES, None, column))
+    
+    entries.append(_summary_entry(rows, np.ones(len(rows), dtype=bool), ALL_RULES, None, None))
+    
+    summary = pd.DataFrame(entries)
+    summary['offending_values'] = summary['offending_values'].astype("Int64")
+    summary['run_ts'] = run_ts or pd.Timestamp.now()
+    return summary
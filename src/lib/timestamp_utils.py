@@ -0,0 +1,111 @@
+"""
+Parsing des timestamps SILVER: format explicite par source + repli tolérant
+"""
+
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import yaml
+
+
+# Format par défaut: ISO-8601 (pandas, sans inférence ligne à ligne)
+DEFAULT_TIMESTAMP_FORMAT = "ISO8601"
+
+UTC_DTYPE = "datetime64[ns, UTC]"
+ARROW_UTC_DTYPE = pd.ArrowDtype(pa.timestamp('ns', tz='UTC'))
+
+
+@lru_cache(maxsize=None)
+def _load_timestamp_formats(config_path: str) -> tuple:
+    """Lit `silver.timestamp_formats` de la config (une fois par process)"""
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+    except OSError:
+        config = {}
+    formats = (config.get('silver') or {}).get('timestamp_formats') or {}
+    return tuple(
+        ((source, column), fmt)
+        for source, columns in formats.items()
+        for column, fmt in (columns or {}).items()
+    )
+
+
+def timestamp_format(source: str, column: str, config_path: str = "conf/config.yaml") -> str:
+    """
+    Format déclaré pour une colonne timestamp d'une source
+    
+    Args:
+        source: Nom de la source (section `sources`)
+        column: Colonne timestamp brute
+        config_path: Chemin vers config.yaml
+    
+    Returns:
+        str: Format strptime, "ISO8601" par défaut
+    """
+    return dict(_load_timestamp_formats(config_path)).get((source, column), DEFAULT_TIMESTAMP_FORMAT)
+
+
+def _parse_strict(values: pd.Series, fmt: str) -> pd.Series:
+    """
+    Passe stricte (aucune inférence)
+    
+    - format strptime ("%Y-%m-%d %H:%M:%S%z"): pyarrow.compute.strptime,
+      vectorisé en C++, directement en timestamp[ns]
+    - "ISO8601": parser ISO de pandas avec cache des valeurs répétées
+    """
+    if fmt == DEFAULT_TIMESTAMP_FORMAT:
+        parsed = pd.to_datetime(values, format=fmt, utc=True, errors='coerce', cache=True)
+        return parsed.astype(UTC_DTYPE)
+    
+    array = pa.array(values.array) if hasattr(values.array, '__arrow_array__') else pa.array(
+        values.to_numpy(dtype=object), type=pa.string(), from_pandas=True
+    )
+    parsed = pc.strptime(array.cast(pa.string()), format=fmt, unit='ns', error_is_null=True)
+    series = pd.Series(parsed.to_pandas(), index=values.index, name=values.name)
+    if series.dt.tz is None:
+        series = series.dt.tz_localize('UTC')
+    return series.astype(UTC_DTYPE)
+
+
+def parse_timestamps(values: pd.Series, fmt: Optional[str] = None) -> Tuple[pd.Series, dict]:
+    """
+    Parse une colonne timestamp texte en datetime64[ns, UTC]
+    
+    Passe stricte sur le format déclaré, puis repli tolérant (format='mixed')
+    sur les seules lignes non vides qui l'ont ratée. Les compteurs du repli
+    sont remontés comme métriques DQ.
+    
+    Args:
+        values: Timestamps texte
+        fmt: Format strptime ou "ISO8601" (None = ISO8601)
+    
+    Returns:
+        Tuple[timestamps UTC, métriques {ts_strict_failed, ts_fallback_parsed, ts_unparseable}]
+        - timestamp[ns, tz=UTC][pyarrow] si `values` est une colonne Arrow
+    """
+    fmt = fmt or DEFAULT_TIMESTAMP_FORMAT
+    parsed = _parse_strict(values, fmt)
+    
+    text = values.astype("string")
+    failed = parsed.isna() & text.notna() & (text.str.strip() != "")
+    failed = failed.fillna(False).astype(bool)
+    n_failed = int(failed.sum())
+    
+    n_fallback = 0
+    if n_failed:
+        lenient = pd.to_datetime(values[failed], format='mixed', utc=True, errors='coerce', cache=True)
+        parsed.loc[failed] = lenient.astype(UTC_DTYPE)
+        n_fallback = int(lenient.notna().sum())
+    
+    if isinstance(values.dtype, pd.ArrowDtype):
+        parsed = parsed.astype(ARROW_UTC_DTYPE)
+    
+    return parsed, {
+        'ts_strict_failed': n_failed,
+        'ts_fallback_parsed': n_fallback,
+        'ts_unparseable': n_failed - n_fallback,
+    }
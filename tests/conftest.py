@@ -0,0 +1,43 @@
+"""Fixtures communes: imports `lib.*` et jobs numérotés (src/jobs/NN_*.py)"""
+
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+
+# Même convention que les jobs: src/ dans le path, config relative à la racine
+sys.path.insert(0, str(ROOT / "src"))
+
+
+def load_job(file_name: str):
+    """Importe un job de src/jobs (nom de fichier non importable directement)"""
+    spec = importlib.util.spec_from_file_location(Path(file_name).stem, ROOT / "src" / "jobs" / file_name)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(autouse=True)
+def repo_root(monkeypatch):
+    """conf/config.yaml résolu depuis la racine du dépôt"""
+    monkeypatch.chdir(ROOT)
+    return ROOT
+
+
+@pytest.fixture(scope="session")
+def bronze():
+    return load_job("01_bronze_ingest_pandas.py")
+
+
+@pytest.fixture(scope="session")
+def silver():
+    return load_job("02_silver_clean.py")
+
+
+@pytest.fixture(scope="session")
+def gold():
+    return load_job("03_gold_dwh.py")
@@ -0,0 +1,36 @@
+"""BRONZE: écritures pandas et streaming dans une même table"""
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from lib.parquet_utils import read_partitioned_table
+
+
+@pytest.mark.parametrize("dtype_backend", ["numpy", "pyarrow"])
+def test_pandas_and_streaming_runs_share_one_schema(tmp_path, bronze, dtype_backend):
+    csv_file = tmp_path / "source.csv"
+    csv_file.write_text("utc_timestamp,load\n2026-01-01 00:00:00+00:00,1.5\n2026-01-01 01:00:00+00:00,\n")
+    bronze_path = str(tmp_path / "bronze")
+    first_run = pd.Timestamp("2026-01-01 10:00:00.123456")
+    second_run = pd.Timestamp("2026-01-02 10:00:00.654321")
+    
+    df = bronze.ingest_csv_to_bronze_pandas(
+        str(csv_file), "source", ingest_timestamp=first_run, dtype_backend=dtype_backend
+    )
+    pandas_file = bronze.write_parquet(df, bronze_path, "source", partition_column="_ingest_date")
+    _, streaming_file = bronze.ingest_csv_to_bronze_streaming(
+        str(csv_file), "source", bronze_path, partition_column="_ingest_date",
+        ingest_timestamp=second_run, dtype_backend=dtype_backend
+    )
+    
+    pandas_schema = pq.read_schema(pandas_file)
+    streaming_schema = pq.read_schema(streaming_file)
+    assert pandas_schema.field("_ingest_ts").type == bronze.INGEST_TS_TYPE
+    assert streaming_schema.field("_ingest_ts").type == bronze.INGEST_TS_TYPE
+    assert pandas_schema.remove_metadata().equals(streaming_schema.remove_metadata())
+    
+    table = read_partitioned_table(str(tmp_path / "bronze" / "source"))
+    assert len(table) == 4
+    assert sorted(pd.to_datetime(table["_ingest_ts"]).unique()) == [first_run, second_run]
+    assert sorted(table["_ingest_date"].unique()) == ["2026-01-01", "2026-01-02"]
@@ -0,0 +1,52 @@
+"""Déduplication par hash de ligne: collisions et stabilité de _row_id"""
+
+import numpy as np
+import pandas as pd
+
+from lib import dedup_utils
+from lib.dedup_utils import ROW_ID_COLUMN, DEFAULT_DEDUP_OPTIONS, deduplicate, drop_duplicate_rows
+
+PLANTS = pd.DataFrame({
+    "site_name": ["Alpha", "Beta", "Alpha", "Gamma", "Beta", None, None],
+    "capacity_mw": [12.5, 3.0, 12.5, 7.25, 3.0, 1.0, 1.0],
+    "_ingest_ts": pd.Timestamp("2026-01-01 10:00"),
+})
+
+
+def row_ids(df: pd.DataFrame) -> dict:
+    """_row_id par ligne (clé indépendante du backend, null → "")"""
+    keys = zip(df["site_name"].astype(object).fillna(""), df["capacity_mw"].astype(float))
+    return dict(zip(keys, df[ROW_ID_COLUMN]))
+
+
+def test_hash_collision_keeps_distinct_rows(monkeypatch):
+    # Toutes les lignes sur le même hash: seule la vérification les distingue
+    monkeypatch.setattr(dedup_utils, "row_hash", lambda df, columns=None, positions=None: np.zeros(len(df), dtype=np.uint64))
+    
+    result, metrics = drop_duplicate_rows(PLANTS, ["site_name", "capacity_mw"], verify=True)
+    
+    assert result["site_name"].fillna("").tolist() == ["Alpha", "Beta", "Gamma", ""]
+    assert result["capacity_mw"].tolist() == [12.5, 3.0, 7.25, 1.0]
+    # 5 candidats différents de la première ligne du hash (Alpha, 12.5)
+    assert metrics == {"duplicate_rows": 3, "hash_collisions": 5}
+    
+    # Sans vérification, la collision écarte des lignes distinctes
+    unverified, _ = drop_duplicate_rows(PLANTS, ["site_name", "capacity_mw"], verify=False)
+    assert len(unverified) == 1
+
+
+def test_row_id_is_stable_across_runs():
+    options = {**DEFAULT_DEDUP_OPTIONS, "keys": {}}
+    first, first_metrics = deduplicate(PLANTS, "plants", options)
+    
+    # Run suivant: autre ordre, autre _ingest_ts, backend Arrow
+    rerun = PLANTS.iloc[::-1].assign(_ingest_ts=pd.Timestamp("2026-02-01 10:00"))
+    rerun = rerun.convert_dtypes(dtype_backend="pyarrow")
+    second, second_metrics = deduplicate(rerun, "plants", options)
+    
+    assert first_metrics["duplicate_rows"] == second_metrics["duplicate_rows"] == 3
+    assert first[ROW_ID_COLUMN].is_unique
+    assert row_ids(first) == row_ids(second)
+    
+    again, _ = deduplicate(PLANTS, "plants", options)
+    pd.testing.assert_frame_equal(again, first)
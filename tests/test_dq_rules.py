@@ -0,0 +1,64 @@
+"""Moteur de règles DQ (lib.dq_rules): masque de bits et règles déclaratives"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lib.dq_rules import compile_rules, count_failures, evaluate_rules, split_valid_rejects
+from lib.reject_sink import REJECT_MASK_COLUMN, REJECT_REASON_COLUMN, describe_mask
+
+# Mêmes formes que `dq_rules.<source>` de config.yaml (ordre = bits du masque)
+SPECS = [
+    {'column': 'event_ts', 'type': 'not_null', 'reason': 'Timestamp manquant'},
+    {'column': 'load_mw', 'type': 'range', 'min': 0, 'reason': 'load_mw < 0'},
+    {'column': 'technology', 'type': 'enum', 'values': ['Solar', 'Wind'], 'reason': 'Technologie inconnue'},
+    {'column': 'code', 'type': 'regex', 'pattern': r'FR\d{2}', 'reason': 'Code invalide'},
+    {'columns': ['site', 'event_ts'], 'type': 'unique', 'reason': 'Doublon'},
+]
+
+
+def rule_frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        'event_ts': pd.to_datetime(['2020-01-01', None, '2020-01-02', '2020-01-03', '2020-01-03'], utc=True),
+        'load_mw': [1.0, -5.0, 2.0, np.nan, 3.0],
+        'technology': ['Solar', 'Solar', 'Coal', 'Wind', None],
+        'code': ['FR01', 'FR02', 'FR3', 'FR04', 'FR05'],
+        'site': ['a', 'b', 'c', 'd', 'd'],
+    })
+
+
+def test_mask_bits_decode_to_failed_rules():
+    rules = compile_rules(SPECS)
+    
+    mask = evaluate_rules(rule_frame(), rules)
+    
+    # Ligne 1: bits 0 (timestamp) + 1 (load); ligne 2: bits 2 (enum) + 3 (regex); ligne 4: bit 4 (doublon)
+    assert mask.tolist() == [0, 0b11, 0b1100, 0, 0b10000]
+    assert describe_mask(mask[mask != 0], rules).tolist() == [
+        'Timestamp manquant | load_mw < 0',
+        'Technologie inconnue | Code invalide',
+        'Doublon',
+    ]
+    assert count_failures(mask, rules) == {
+        'event_ts_not_null': 1, 'load_mw_range': 1, 'technology_enum': 1,
+        'code_regex': 1, 'site_event_ts_unique': 1,
+    }
+
+
+@pytest.mark.parametrize("dtype", [object, "string[pyarrow]", "category"])
+def test_regex_rule_on_every_string_backend(dtype):
+    rule, = compile_rules([{'column': 'code', 'type': 'regex', 'pattern': r'FR\d{2}'}])
+    df = pd.DataFrame({'code': pd.Series(['FR01', 'FR1', None, 'xFR01'], dtype=dtype)})
+    
+    assert np.asarray(rule.check(df)).tolist() == [False, True, False, True]
+
+
+def test_split_keeps_valid_rows_and_labels_rejects():
+    rules = compile_rules(SPECS)
+    
+    valid, rejects = split_valid_rejects(rule_frame(), rules, {'mode': 'full', 'sample_size': None})
+    
+    assert valid.index.tolist() == [0, 3]
+    assert len(rejects) == 3
+    assert rejects.sample[REJECT_MASK_COLUMN].tolist() == [0b11, 0b1100, 0b10000]
+    assert rejects.sample[REJECT_REASON_COLUMN].tolist()[2] == 'Doublon'
@@ -0,0 +1,36 @@
+"""Optimisation des dtypes SILVER (lib.dtype_utils)"""
+
+import numpy as np
+import pandas as pd
+
+from lib.dtype_utils import DEFAULT_DTYPE_OPTIONS, optimize_dtypes
+
+
+def test_float_not_exact_in_float32_stays_float64():
+    df = pd.DataFrame({'load_mw': [69773.123, 70001.5, np.nan]})
+    
+    optimized, _, report = optimize_dtypes(df, DEFAULT_DTYPE_OPTIONS)
+    
+    assert optimized['load_mw'].dtype == np.float64
+    assert report['float32'] == []
+    assert optimized['load_mw'].iloc[0] == 69773.123
+
+
+def test_float_exact_in_float32_is_downcast():
+    df = pd.DataFrame({'share': [0.5, 0.25, 1024.0, np.nan, np.inf]})
+    
+    optimized, _, report = optimize_dtypes(df, DEFAULT_DTYPE_OPTIONS)
+    
+    assert optimized['share'].dtype == np.float32
+    assert report['float32'] == ['share']
+    np.testing.assert_array_equal(optimized['share'].to_numpy(dtype=np.float64), df['share'].to_numpy())
+
+
+def test_constant_columns_are_kept_by_default():
+    df = pd.DataFrame({'load_mw': [1.0, 2.0, 3.0], 'country': ['FR', 'FR', 'FR']})
+    
+    optimized, constants, report = optimize_dtypes(df, DEFAULT_DTYPE_OPTIONS)
+    
+    assert constants == {} and report['constants'] == []
+    assert list(optimized.columns) == ['load_mw', 'country']
+    assert isinstance(optimized['country'].dtype, pd.CategoricalDtype)
@@ -0,0 +1,31 @@
+"""GOLD: rattachement des produits Eurostat à dim_energy_type"""
+
+import pandas as pd
+
+from lib.parquet_utils import write_parquet_table
+
+
+def test_annual_balance_keeps_each_siec_product(tmp_path, gold):
+    balance = pd.DataFrame({
+        'siec': ['E7000', 'RA410', 'RA420', 'RA420'],
+        'nrg_bal': ['GEP', 'GEP', 'GEP', 'GEP'],
+        'unit': ['GWH', 'GWH', 'GWH', 'GWH'],
+        'year': [2020, 2020, 2020, 2021],
+        'value': [500.0, 2.0, 12.0, 14.0],
+    })
+    (tmp_path / "eurostat_energy_balance").mkdir()
+    write_parquet_table(balance, str(tmp_path / "eurostat_energy_balance" / "data.parquet"))
+    
+    fact = gold.create_fact_annual_energy_balance({}, gold.GoldContext(str(tmp_path)))
+    
+    # Deux produits solaires (RA410 thermique, RA420 photovoltaïque): jamais sommés
+    assert fact[['year', 'energy_type_id', 'siec', 'value', 'nb_records']].values.tolist() == [
+        [2020, 1, 'RA410', 2.0, 1],
+        [2020, 1, 'RA420', 12.0, 1],
+        [2020, 6, 'E7000', 500.0, 1],
+        [2021, 1, 'RA420', 14.0, 1],
+    ]
+    
+    energy_types = gold.create_dim_energy_type().set_index('energy_type_id')
+    assert set(fact['energy_type_id']) <= set(energy_types.index)
+    assert energy_types.loc[6, 'energy_type_name'] == 'Electricity'
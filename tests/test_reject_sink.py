@@ -0,0 +1,108 @@
+"""Puits des rejets (lib.reject_sink): compteurs exacts, échantillon bottom-k, fusion de blocs"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lib.dq_rules import compile_rules, evaluate_rules
+from lib.reject_sink import (
+    ALL_RULES, REJECT_MASK_COLUMN, SAMPLE_KEY_COLUMN,
+    collect_rejects, concat_rejects, summarize_rejects,
+)
+
+SPECS = [
+    {'column': 'event_ts', 'type': 'not_null', 'reason': 'Timestamp manquant'},
+    {'column': 'load_mw', 'type': 'range', 'min': 0, 'reason': 'load_mw < 0'},
+    {'column': 'solar_mw', 'type': 'range', 'min': 0, 'reason': 'solar_mw < 0'},
+    {'column': 'wind_mw', 'type': 'not_null', 'reason': 'wind_mw manquant'},
+]
+SAMPLE_SIZE = 25
+OPTIONS = {'mode': 'summary', 'sample_size': SAMPLE_SIZE}
+
+
+@pytest.fixture(scope="module")
+def evaluated():
+    """5 000 lignes, ~10 % en erreur par règle (plusieurs règles par ligne possibles)"""
+    rng = np.random.default_rng(42)
+    n = 5_000
+    event_ts = pd.Series(pd.date_range("2026-01-01", periods=n, freq="h", tz="UTC"))
+    df = pd.DataFrame({
+        'event_ts': event_ts.mask(rng.random(n) < 0.1),
+        'load_mw': rng.normal(50_000, 30_000, n),
+        'solar_mw': rng.normal(2_000, 1_500, n),
+        'wind_mw': pd.Series(rng.uniform(0, 5_000, n)).mask(rng.random(n) < 0.1),
+        'note': rng.choice(['a', 'b', 'c'], n),
+    })
+    rules = compile_rules(SPECS)
+    return df, evaluate_rules(df, rules), rules
+
+
+def expected_failures(df: pd.DataFrame) -> dict:
+    """Lignes en erreur par règle, calculées sans le moteur"""
+    return {
+        'event_ts': df['event_ts'].isna(),
+        'load_mw': df['load_mw'] < 0,
+        'solar_mw': df['solar_mw'] < 0,
+        'wind_mw': df['wind_mw'].isna(),
+    }
+
+
+def test_summary_counters_are_exact(evaluated):
+    df, mask, rules = evaluated
+    failures = expected_failures(df)
+    
+    rejects = collect_rejects(df, mask, rules, OPTIONS)
+    summary = summarize_rejects(rejects).set_index(['rule', 'column'], drop=False)
+    
+    any_failure = np.logical_or.reduce(list(failures.values()))
+    assert len(rejects) == any_failure.sum()
+    assert summary.loc[(ALL_RULES, None), 'rejected_rows'] == any_failure.sum()
+    for rule, spec in zip(rules, SPECS):
+        failed = failures[spec['column']]
+        entry = summary.loc[(rule.name, spec['column'])]
+        assert entry['rejected_rows'] == failed.sum()
+        assert entry['offending_values'] == df.loc[failed, spec['column']].notna().sum()
+    
+    negative = df.loc[failures['load_mw'], 'load_mw']
+    entry = summary.loc[(rules[1].name, 'load_mw')]
+    assert (entry['min_value'], entry['max_value']) == (str(negative.min()), str(negative.max()))
+    assert entry['first_event_ts'] == df.loc[failures['load_mw'], 'event_ts'].min()
+
+
+def bottom_k(rows: pd.DataFrame, bit: int, k: int) -> set:
+    """Clés des k plus petites lignes d'une règle (tri complet, sans argpartition)"""
+    members = rows[(rows[REJECT_MASK_COLUMN].to_numpy() >> bit) & 1 == 1]
+    return set(members[SAMPLE_KEY_COLUMN].sort_values().head(k))
+
+
+def test_sample_is_bottom_k_per_rule(evaluated):
+    df, mask, rules = evaluated
+    
+    rejects = collect_rejects(df, mask, rules, OPTIONS)
+    
+    # Échantillon = union des k plus petites clés de chaque règle (une ligne
+    # en erreur sur plusieurs règles peut être retenue au titre de l'une d'elles)
+    per_rule = [bottom_k(rejects.rows, bit, SAMPLE_SIZE) for bit in range(len(rules))]
+    assert all(len(keys) == SAMPLE_SIZE for keys in per_rule)
+    assert set(rejects.sample[SAMPLE_KEY_COLUMN]) == set().union(*per_rule)
+    assert len(rejects.sample) <= SAMPLE_SIZE * len(rules)
+    assert list(rejects.sample.columns[:len(df.columns)]) == list(df.columns)
+
+
+def test_chunk_merge_matches_single_pass(evaluated):
+    df, mask, rules = evaluated
+    bounds = [0, 1_200, 1_201, 3_700, len(df)]
+    
+    single = collect_rejects(df, mask, rules, OPTIONS)
+    merged = concat_rejects([
+        collect_rejects(df.iloc[start:end], mask[start:end], rules, OPTIONS)
+        for start, end in zip(bounds, bounds[1:])
+    ])
+    
+    assert len(merged) == len(single)
+    pd.testing.assert_frame_equal(merged.rows, single.rows)
+    pd.testing.assert_frame_equal(merged.sample, single.sample)
+    pd.testing.assert_frame_equal(
+        summarize_rejects(merged, run_ts=pd.Timestamp("2026-01-01")),
+        summarize_rejects(single, run_ts=pd.Timestamp("2026-01-01"))
+    )
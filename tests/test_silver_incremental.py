@@ -0,0 +1,123 @@
+"""SILVER incrémental: watermark, --force BRONZE, fenêtres de retraitement"""
+
+import shutil
+
+import pandas as pd
+import pytest
+
+from conftest import ROOT
+from lib.parquet_utils import delete_key_range, read_table, table_files, write_parquet_table
+
+SOURCE = "france_time_series"
+JANUARY = (pd.Timestamp("2026-01-01", tz="UTC"), pd.Timestamp("2026-02-01", tz="UTC"))
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Arborescence de travail: config du dépôt, landing avec une seule source (chemins relatifs)"""
+    shutil.copytree(ROOT / "conf", tmp_path / "conf")
+    landing = tmp_path / "data" / "landing"
+    landing.mkdir(parents=True)
+    
+    # Décembre 2025 → février 2026 horaire: janvier = 31 × 24 = 744 lignes
+    event_ts = pd.date_range("2025-12-15", "2026-02-15", freq="h", inclusive="left", tz="UTC")
+    pd.DataFrame({
+        "utc_timestamp": event_ts.strftime("%Y-%m-%d %H:%M:%S+00:00"),
+        "FR_load_actual_entsoe_transparency": 50000.0,
+        "FR_solar_generation_actual": 100.0,
+        "FR_wind_onshore_generation_actual": 1000.0,
+    }).to_csv(landing / f"{SOURCE}.csv", index=False)
+    
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def silver_table(workspace) -> pd.DataFrame:
+    return read_table(str(workspace / "data" / "warehouse" / "silver" / SOURCE))
+
+
+def last_run_metrics(workspace) -> dict:
+    metrics = read_table(str(workspace / "data" / "warehouse" / "dq" / "silver_metrics"))
+    metrics = metrics[(metrics["run_id"] == metrics["run_id"].max()) & (metrics["source"] == SOURCE)]
+    return dict(zip(metrics["metric"], metrics["value"])) | {"mode": metrics["mode"].iloc[0]}
+
+
+def test_force_reingest_drops_all_overlapping_rows(workspace, bronze, silver):
+    bronze.run_bronze_ingestion_pandas()
+    silver.run_silver_cleaning()
+    expected = silver_table(workspace)
+    
+    # Même fichier réingéré: nouveau run BRONZE, toutes les clés déjà en SILVER
+    bronze.run_bronze_ingestion_pandas(force=True)
+    silver.run_silver_cleaning()
+    
+    metrics = last_run_metrics(workspace)
+    assert metrics["mode"] == "append"
+    assert metrics["incremental_overlap_duplicates"] == len(expected)
+    after = silver_table(workspace)
+    assert len(after) == len(expected)
+    assert after["event_ts"].is_unique
+
+
+def test_reprocess_window_rebuilds_rows_once(workspace, bronze, silver):
+    bronze.run_bronze_ingestion_pandas()
+    silver.run_silver_cleaning()
+    before = silver_table(workspace)
+    
+    silver.run_silver_cleaning(reprocess=JANUARY)
+    
+    metrics = last_run_metrics(workspace)
+    assert metrics["reprocess_removed_rows"] == 744
+    after = silver_table(workspace)
+    assert len(after) == len(before)
+    assert after["event_ts"].is_unique
+    assert silver.in_window(after, "event_ts", JANUARY).sum() == 744
+    pd.testing.assert_series_equal(
+        after["event_ts"].sort_values(ignore_index=True), before["event_ts"].sort_values(ignore_index=True)
+    )
+
+
+def test_no_new_bronze_run_skips(workspace, bronze, silver):
+    bronze.run_bronze_ingestion_pandas()
+    silver.run_silver_cleaning()
+    silver_path = str(workspace / "data" / "warehouse" / "silver")
+    files = table_files(f"{silver_path}/{SOURCE}")
+    watermark = silver.load_watermarks(silver_path)[SOURCE]
+    
+    # Fichier landing inchangé: pas de nouveau run BRONZE
+    bronze.run_bronze_ingestion_pandas()
+    spec = next(spec for spec in silver.SILVER_SOURCES if spec["source"] == SOURCE)
+    plan = silver.plan_incremental(
+        spec, str(workspace / "data" / "warehouse" / "bronze"), silver_path,
+        "_ingest_date", "latest_run", watermark
+    )
+    assert plan == {"mode": "skip", "bronze_run": watermark["bronze_run"]}
+    
+    silver.run_silver_cleaning()
+    assert table_files(f"{silver_path}/{SOURCE}") == files
+    assert silver.load_watermarks(silver_path)[SOURCE]["bronze_run"] == watermark["bronze_run"]
+
+
+def test_window_over_empty_table(tmp_path):
+    table_path = tmp_path / "table"
+    assert delete_key_range(str(table_path), "event_ts", *JANUARY) == 0
+    
+    # Fichier sans ligne: statistiques vides, rien à relire ni à supprimer
+    empty = pd.DataFrame({"event_ts": pd.Series([], dtype="datetime64[us, UTC]"), "load_mw": pd.Series([], dtype=float)})
+    table_path.mkdir()
+    write_parquet_table(empty, str(table_path / "part-0.parquet"))
+    assert delete_key_range(str(table_path), "event_ts", *JANUARY) == 0
+    assert len(read_table(str(table_path))) == 0
+
+
+def test_reprocess_window_without_rows_keeps_table(workspace, bronze, silver):
+    bronze.run_bronze_ingestion_pandas()
+    silver.run_silver_cleaning()
+    before = silver_table(workspace)
+    
+    silver.run_silver_cleaning(reprocess=(pd.Timestamp("2030-01-01", tz="UTC"), pd.Timestamp("2030-02-01", tz="UTC")))
+    
+    assert last_run_metrics(workspace)["reprocess_removed_rows"] == 0
+    after = silver_table(workspace)
+    assert len(after) == len(before)
+    assert after["event_ts"].is_unique